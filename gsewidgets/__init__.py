@@ -26,7 +26,14 @@
 # ------------------------------------------------------------------------------
 
 from gsewidgets import _version
+from gsewidgets.models.collection_points import CollectionPointsModel
+from gsewidgets.models.journal import CollectionPointsJournal
+from gsewidgets.models.numeric import NumericDataModel, NumericDataArrayModel
+from gsewidgets.models.sources import ValueSource, SimulatedPV, SimulatedPVServer
+from gsewidgets.models.units import UnitFamily, LENGTH_UNITS, ANGLE_UNITS
+from gsewidgets.models.filesystem import PathInfo, FileSystemCache, DirectoryCreator
 from gsewidgets.widgets.filters import (
+    sanitize_text,
     FileNameEventFilter,
     FilePathEventFilter,
     URIParseEventFilter,
@@ -45,9 +52,15 @@ from gsewidgets.widgets.buttons import (
     ColorDialogButton,
 )
 from gsewidgets.widgets.spinboxes import (
+    NumericSpinBoxValueError,
     NumericSpinBox,
     NoWheelNumericSpinBox,
     NumericDataSpinBoxModel,
+    NumericSpinBoxArrayBinding,
+    LiveValueUpdater,
+    NumericSpinBoxGroup,
+    UnitNumericDataSpinBoxModel,
+    UnitNumericSpinBox,
 )
 from gsewidgets.widgets.inputboxes import (
     InputBox,
@@ -57,9 +70,30 @@ from gsewidgets.widgets.inputboxes import (
     IPv4InputBox,
     MultiFloatInputBox,
     TextInfoBox,
+    PATH_UNCHECKED,
+    PATH_PENDING,
+    PATH_OK,
+    PATH_ERROR,
 )
 from gsewidgets.widgets.comboboxes import FullComboBox
-from gsewidgets.widgets.checkboxes import CheckBox, ToggleCheckBox
+from gsewidgets.widgets.checkboxes import (
+    CheckBox,
+    ToggleCheckBox,
+    ToggleAnimationDriver,
+    CheckBoxBank,
+)
 from gsewidgets.widgets.tables import XYZCollectionPointsTable
+from gsewidgets.widgets.performance import (
+    PERFORMANCE_MODE_VARIABLE,
+    performance_mode,
+    set_performance_mode,
+)
+from gsewidgets.widgets.overviews import CollectionPointsOverview
+from gsewidgets.widgets.bindings import (
+    ValueSourceBinding,
+    NumericSpinBoxBinding,
+    ToggleCheckBoxBinding,
+    StatusLabelBinding,
+)
 
 __version__ = _version.get_versions()["version"]
@@ -0,0 +1,550 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: collection_points.py
+# Description: Headless data model for XYZ collection points.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import numpy as np
+from typing import Callable, Optional, Sequence, Union
+
+from gsewidgets.models.listeners import ListenerList
+
+__all__ = [
+    "CollectionPointsModel",
+    "POINTS_INSERTED",
+    "POINTS_REMOVED",
+    "POSITIONS_CHANGED",
+    "ENABLED_CHANGED",
+    "NAMES_CHANGED",
+    "GROUPS_CHANGED",
+    "LIMITS_CHANGED",
+    "POINTS_RESET",
+]
+
+# Notification types sent to the model listeners
+POINTS_INSERTED = "inserted"
+POINTS_REMOVED = "removed"
+POSITIONS_CHANGED = "positions"
+ENABLED_CHANGED = "enabled"
+NAMES_CHANGED = "names"
+GROUPS_CHANGED = "groups"
+LIMITS_CHANGED = "limits"
+POINTS_RESET = "reset"
+
+Indices = Union[int, Sequence[int], np.ndarray]
+Listener = Callable[[str, np.ndarray], None]
+
+
+class CollectionPointsModel:
+    """
+    Pure Python/NumPy model of a list of XYZ collection points. Keeps the positions, the
+    limits, the names, the enabled mask and the integer group label of every point, without
+    depending on Qt. The optional sources keep the object each value came from, e.g. the
+    numeric data model of a spinbox. Listeners that are bound methods are held weakly.
+    """
+
+    # Names of the per point arrays, kept in the same order
+    _array_attributes = (
+        "_positions",
+        "_min_values",
+        "_max_values",
+        "_incremental_steps",
+        "_precisions",
+        "_enabled",
+        "_groups",
+        "_sources",
+    )
+
+    def __init__(
+        self,
+        min_values: Optional[Sequence[float]] = (-np.inf, -np.inf, -np.inf),
+        max_values: Optional[Sequence[float]] = (np.inf, np.inf, np.inf),
+        incremental_steps: Optional[Sequence[float]] = (1.0, 1.0, 1.0),
+        precisions: Optional[Sequence[int]] = (0, 0, 0),
+        name_prefix: Optional[str] = "point",
+        capacity: Optional[int] = 64,
+    ) -> None:
+        self._default_min_values = np.asarray(min_values, dtype=np.float64)
+        self._default_max_values = np.asarray(max_values, dtype=np.float64)
+        self._default_incremental_steps = np.asarray(
+            incremental_steps, dtype=np.float64
+        )
+        self._default_precisions = np.asarray(precisions, dtype=np.int16)
+        self._name_prefix = name_prefix
+
+        self._size: int = 0
+        self._positions = np.zeros((capacity, 3), dtype=np.float64)
+        self._min_values = np.zeros((capacity, 3), dtype=np.float64)
+        self._max_values = np.zeros((capacity, 3), dtype=np.float64)
+        self._incremental_steps = np.zeros((capacity, 3), dtype=np.float64)
+        self._precisions = np.zeros((capacity, 3), dtype=np.int16)
+        self._enabled = np.zeros(capacity, dtype=bool)
+        self._groups = np.zeros(capacity, dtype=np.int32)
+        self._sources = np.full((capacity, 3), None, dtype=object)
+        self._names: list[str] = []
+        self._name_counts: dict[str, int] = {}
+        self._name_counter: int = 1
+
+        self._listeners = ListenerList()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_listener(self, listener: Listener) -> None:
+        """Registers a callable that receives the notification type and the affected indices."""
+        self._listeners.add(listener)
+
+    def remove_listener(self, listener: Optional[Listener]) -> None:
+        """Unregisters a previously registered listener."""
+        self._listeners.remove(listener)
+
+    def _notify(self, notification: str, indices: np.ndarray) -> None:
+        """Sends a notification to all the registered listeners."""
+        self._listeners.notify(notification, indices)
+
+    def _reserve(self, capacity: int) -> None:
+        """Grows the underlying arrays so that they can hold at least the given number of points."""
+        current_capacity = self._positions.shape[0]
+        if capacity <= current_capacity:
+            return
+        # Grow geometrically to keep repeated appends amortized
+        new_capacity = max(capacity, 2 * current_capacity, 1)
+        for attribute in self._array_attributes:
+            old_array = getattr(self, attribute)
+            new_array = np.full(
+                (new_capacity,) + old_array.shape[1:],
+                None if old_array.dtype == object else 0,
+                dtype=old_array.dtype,
+            )
+            new_array[: self._size] = old_array[: self._size]
+            setattr(self, attribute, new_array)
+
+    def _as_indices(self, indices: Indices) -> np.ndarray:
+        """Converts and checks the given indices against the current number of points."""
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        if indices.size and (indices.min() < 0 or indices.max() >= self._size):
+            raise IndexError("Collection point index out of range.")
+        return indices
+
+    def _generate_names(self, count: int) -> list[str]:
+        """Creates the next available point names, skipping the names that already exist."""
+        # Skip the names that are already taken at the start of the range
+        while f"{self._name_prefix}_{self._name_counter}" in self._name_counts:
+            self._name_counter += 1
+        start = self._name_counter
+        # Fast path for the common case of a contiguous range of free names
+        names = [f"{self._name_prefix}_{i}" for i in range(start, start + count)]
+        if self._name_counts.keys().isdisjoint(names):
+            self._name_counter = start + count - 1 if count else start
+            return names
+
+        names = []
+        generated_names: set[str] = set()
+        for _ in range(count):
+            name = f"{self._name_prefix}_{self._name_counter}"
+            while name in self._name_counts or name in generated_names:
+                self._name_counter += 1
+                name = f"{self._name_prefix}_{self._name_counter}"
+            names.append(name)
+            generated_names.add(name)
+        return names
+
+    def _count_name(self, name: str, change: int) -> None:
+        """Updates the number of points that use the given name."""
+        count = self._name_counts.get(name, 0) + change
+        if count > 0:
+            self._name_counts[name] = count
+        else:
+            self._name_counts.pop(name, None)
+
+    def add_point(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        name: Optional[str] = None,
+        enabled: Optional[bool] = True,
+        min_values: Optional[Sequence[float]] = None,
+        max_values: Optional[Sequence[float]] = None,
+        incremental_steps: Optional[Sequence[float]] = None,
+        precisions: Optional[Sequence[int]] = None,
+        group: Optional[int] = 0,
+        sources: Optional[Sequence[object]] = None,
+    ) -> int:
+        """Adds a single collection point to the bottom of the list and returns its index."""
+        indices = self.add_points(
+            positions=[(x, y, z)],
+            names=None if name is None else [name],
+            enabled=enabled,
+            min_values=min_values,
+            max_values=max_values,
+            incremental_steps=incremental_steps,
+            precisions=precisions,
+            groups=group,
+            sources=None if sources is None else [sources],
+        )
+        return int(indices[0])
+
+    def add_points(
+        self,
+        positions: Union[Sequence[Sequence[float]], np.ndarray],
+        names: Optional[Sequence[str]] = None,
+        enabled: Optional[Union[bool, Sequence[bool], np.ndarray]] = True,
+        min_values: Optional[Union[Sequence[float], np.ndarray]] = None,
+        max_values: Optional[Union[Sequence[float], np.ndarray]] = None,
+        incremental_steps: Optional[Union[Sequence[float], np.ndarray]] = None,
+        precisions: Optional[Union[Sequence[int], np.ndarray]] = None,
+        groups: Optional[Union[int, Sequence[int], np.ndarray]] = 0,
+        sources: Optional[Sequence[Sequence[object]]] = None,
+    ) -> np.ndarray:
+        """
+        Appends an (N, 3) array of positions to the list and returns the new indices. The limits
+        can be given per axis or per point, and default to the limits of the model. The sources
+        are the (N, 3) objects that the values came from.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        count = positions.shape[0]
+        if names is not None and len(names) != count:
+            raise ValueError("The number of names must match the number of points.")
+
+        start = self._size
+        stop = start + count
+        self._reserve(stop)
+
+        self._positions[start:stop] = positions
+        self._min_values[start:stop] = (
+            self._default_min_values if min_values is None else min_values
+        )
+        self._max_values[start:stop] = (
+            self._default_max_values if max_values is None else max_values
+        )
+        self._incremental_steps[start:stop] = (
+            self._default_incremental_steps
+            if incremental_steps is None
+            else incremental_steps
+        )
+        self._precisions[start:stop] = (
+            self._default_precisions if precisions is None else precisions
+        )
+        self._enabled[start:stop] = enabled
+        self._groups[start:stop] = groups
+        if sources is not None:
+            for row, point_sources in enumerate(sources, start):
+                self._sources[row] = point_sources
+
+        # Set the names
+        names = self._generate_names(count) if names is None else list(names)
+        for name in names:
+            self._count_name(name, 1)
+        self._names.extend(names)
+        self._size = stop
+
+        indices = np.arange(start, stop, dtype=np.int64)
+        self._notify(POINTS_INSERTED, indices)
+        return indices
+
+    def remove_points(self, indices: Indices) -> bool:
+        """Removes the points with the given indices and returns if any was removed."""
+        indices = np.unique(self._as_indices(indices))
+        if not indices.size:
+            return False
+
+        keep = np.ones(self._size, dtype=bool)
+        keep[indices] = False
+        new_size = int(keep.sum())
+        for attribute in self._array_attributes:
+            array = getattr(self, attribute)
+            array[:new_size] = array[: self._size][keep]
+        # Release the sources of the removed points
+        self._sources[new_size : self._size] = None
+
+        for index in indices:
+            self._count_name(self._names[index], -1)
+        self._names = [name for name, kept in zip(self._names, keep) if kept]
+        self._size = new_size
+
+        self._notify(POINTS_REMOVED, indices)
+        return True
+
+    def remove_point(self, index: int) -> None:
+        """Removes a single point from the list."""
+        self.remove_points(index)
+
+    def clear(self) -> None:
+        """Removes all the points. The name counter keeps its value, like the table does."""
+        self._sources[: self._size] = None
+        self._size = 0
+        self._names.clear()
+        self._name_counts.clear()
+        self._notify(POINTS_RESET, np.empty(0, dtype=np.int64))
+
+    def set_position(self, index: int, axis: int, value: float) -> None:
+        """Sets the value of a single axis of a point."""
+        indices = self._as_indices(index)
+        if self._positions[index, axis] == value:
+            return
+        self._positions[index, axis] = value
+        self._notify(POSITIONS_CHANGED, indices)
+
+    def set_positions(
+        self, indices: Indices, positions: Union[Sequence[float], np.ndarray]
+    ) -> None:
+        """Sets the (N, 3) positions of the given points."""
+        indices = self._as_indices(indices)
+        self._positions[indices] = positions
+        self._notify(POSITIONS_CHANGED, indices)
+
+    def set_limits(
+        self,
+        indices: Indices,
+        min_values: Union[Sequence[float], np.ndarray],
+        max_values: Union[Sequence[float], np.ndarray],
+    ) -> None:
+        """
+        Sets the (N, 3) min and max values of the given points. Positions outside of the new limits
+        are clamped, and sent with a positions notification after the limits notification.
+        """
+        indices = self._as_indices(indices)
+        min_values = np.broadcast_to(
+            np.asarray(min_values, dtype=np.float64), (indices.size, 3)
+        )
+        max_values = np.broadcast_to(
+            np.asarray(max_values, dtype=np.float64), (indices.size, 3)
+        )
+        if np.any(min_values >= max_values):
+            raise ValueError("The min value must be lower than the max value.")
+        changed = np.any(
+            (self._min_values[indices] != min_values)
+            | (self._max_values[indices] != max_values),
+            axis=1,
+        )
+        if not changed.any():
+            return
+        indices = indices[changed]
+        self._min_values[indices] = min_values[changed]
+        self._max_values[indices] = max_values[changed]
+        positions = self._positions[indices]
+        clamped_positions = np.clip(positions, min_values[changed], max_values[changed])
+        clamped = np.any(clamped_positions != positions, axis=1)
+        self._positions[indices] = clamped_positions
+        self._notify(LIMITS_CHANGED, indices)
+        if clamped.any():
+            self._notify(POSITIONS_CHANGED, indices[clamped])
+
+    def set_enabled(
+        self, indices: Indices, state: Union[bool, Sequence[bool], np.ndarray]
+    ) -> bool:
+        """Sets the enabled state of the given points, and returns if any state changed."""
+        indices = self._as_indices(indices)
+        changed = indices[self._enabled[indices] != np.asarray(state, dtype=bool)]
+        if not changed.size:
+            return False
+        self._enabled[indices] = state
+        self._notify(ENABLED_CHANGED, changed)
+        return True
+
+    def set_all_enabled(self, state: bool) -> None:
+        """Sets the enabled state of all the points."""
+        self.set_enabled(np.arange(self._size, dtype=np.int64), state)
+
+    def set_group(self, indices: Indices, group: int) -> bool:
+        """Moves the given points to a group, and returns if any point was moved."""
+        indices = self._as_indices(indices)
+        changed = indices[self._groups[indices] != group]
+        if not changed.size:
+            return False
+        self._groups[changed] = group
+        self._notify(GROUPS_CHANGED, changed)
+        return True
+
+    def group_indices(self, group: int) -> np.ndarray:
+        """Returns the indices of the points that belong to a group."""
+        return np.flatnonzero(self.groups == group)
+
+    def set_group_enabled(self, group: int, state: bool) -> bool:
+        """
+        Sets the enabled state of all the points of a group, with a single notification. Returns
+        if any state changed.
+        """
+        return self.set_enabled(self.group_indices(group), state)
+
+    def translate_group(self, group: int, offset: Sequence[float]) -> bool:
+        """
+        Adds an (x, y, z) offset to all the points of a group, with a single notification. Returns
+        if any point was moved.
+        """
+        indices = self.group_indices(group)
+        offset = np.asarray(offset, dtype=np.float64)
+        if not indices.size or not offset.any():
+            return False
+        positions = self._positions[indices] + offset
+        # Keep the group in place if any of the points would leave its limits
+        if np.any(
+            (positions < self._min_values[indices])
+            | (positions > self._max_values[indices])
+        ):
+            raise ValueError(
+                "The offset moves points of the group outside of the acceptable range."
+            )
+        self._positions[indices] = positions
+        self._notify(POSITIONS_CHANGED, indices)
+        return True
+
+    def remove_group(self, group: int) -> bool:
+        """
+        Removes all the points of a group, with a single notification. Returns if any point was
+        removed.
+        """
+        return self.remove_points(self.group_indices(group))
+
+    def rename_point(self, index: int, name: str) -> None:
+        """Changes the name of a single point."""
+        indices = self._as_indices(index)
+        if self._names[index] == name:
+            return
+        self._count_name(self._names[index], -1)
+        self._count_name(name, 1)
+        self._names[index] = name
+        self._notify(NAMES_CHANGED, indices)
+
+    def point_name(self, index: int) -> str:
+        """Returns the name of a single point."""
+        return self._names[index]
+
+    def reorder(self, order: Union[Sequence[int], np.ndarray]) -> None:
+        """Rearranges the points using the given permutation of the current indices."""
+        order = np.asarray(order, dtype=np.int64)
+        if order.shape != (self._size,) or not np.array_equal(
+            np.sort(order), np.arange(self._size)
+        ):
+            raise ValueError("The order must be a permutation of the point indices.")
+
+        for attribute in self._array_attributes:
+            array = getattr(self, attribute)
+            array[: self._size] = array[: self._size][order]
+        self._names = [self._names[index] for index in order]
+
+        self._notify(POINTS_RESET, np.empty(0, dtype=np.int64))
+
+    def move_point(self, source: int, destination: int) -> None:
+        """Moves a single point to a new position in the list."""
+        self._as_indices([source, destination])
+        order = list(range(self._size))
+        order.insert(destination, order.pop(source))
+        self.reorder(order)
+
+    def sort_points(self, axis: int, descending: Optional[bool] = False) -> None:
+        """Sorts the points by the value of the given axis."""
+        order = np.argsort(self.positions[:, axis], kind="stable")
+        if descending:
+            order = order[::-1]
+        self.reorder(order)
+
+    def out_of_bounds(self) -> np.ndarray:
+        """Returns a boolean mask of the points that have at least one value outside of its limits."""
+        positions = self.positions
+        return np.any(
+            (positions < self.min_values) | (positions > self.max_values), axis=1
+        )
+
+    def validate(self) -> None:
+        """Checks the limits and positions of all the points and raises on the first invalid point."""
+        invalid_limits = np.any(self.min_values >= self.max_values, axis=1)
+        if invalid_limits.any():
+            raise ValueError(
+                f"The min value must be lower than the max value (point {self._names[np.argmax(invalid_limits)]})."
+            )
+
+        out_of_bounds = self.out_of_bounds()
+        if out_of_bounds.any():
+            raise ValueError(
+                f"{int(out_of_bounds.sum())} point(s) are outside of the acceptable range, "
+                f"starting with {self._names[np.argmax(out_of_bounds)]}."
+            )
+
+        invalid_precisions = np.any(self.precisions < 0, axis=1)
+        if invalid_precisions.any():
+            raise ValueError(
+                f"Precision value can't be lesser than 0 (point {self._names[np.argmax(invalid_precisions)]})."
+            )
+
+    def _view(self, array: np.ndarray) -> np.ndarray:
+        """Returns a read only view of the used part of an array."""
+        view = array[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Returns a read only (N, 3) view of the point positions."""
+        return self._view(self._positions)
+
+    @property
+    def min_values(self) -> np.ndarray:
+        """Returns a read only (N, 3) view of the min values."""
+        return self._view(self._min_values)
+
+    @property
+    def max_values(self) -> np.ndarray:
+        """Returns a read only (N, 3) view of the max values."""
+        return self._view(self._max_values)
+
+    @property
+    def incremental_steps(self) -> np.ndarray:
+        """Returns a read only (N, 3) view of the incremental steps."""
+        return self._view(self._incremental_steps)
+
+    @property
+    def precisions(self) -> np.ndarray:
+        """Returns a read only (N, 3) view of the precision values."""
+        return self._view(self._precisions)
+
+    @property
+    def enabled(self) -> np.ndarray:
+        """Returns a read only view of the enabled mask."""
+        return self._view(self._enabled)
+
+    @property
+    def groups(self) -> np.ndarray:
+        """Returns a read only view of the group labels."""
+        return self._view(self._groups)
+
+    @property
+    def sources(self) -> np.ndarray:
+        """Returns a read only (N, 3) object view of the sources of the values, None if unknown."""
+        return self._view(self._sources)
+
+    @property
+    def group_labels(self) -> np.ndarray:
+        """Returns the sorted labels of the groups that have at least one point."""
+        return np.unique(self.groups)
+
+    @property
+    def enabled_indices(self) -> np.ndarray:
+        """Returns the indices of the enabled points."""
+        return np.flatnonzero(self.enabled)
+
+    @property
+    def names(self) -> list[str]:
+        """Returns a copy of the point names."""
+        return list(self._names)
@@ -0,0 +1,297 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: filesystem.py
+# Description: Filesystem work that is kept off the GUI thread.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import os
+import stat
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional, Union
+
+__all__ = ["PathInfo", "FileSystemCache", "DirectoryCreator"]
+
+PathLike = Union[str, Path]
+DirectoryCallback = Callable[[str, Optional[str]], None]
+
+_worker_pool: Optional[ThreadPoolExecutor] = None
+_worker_pool_lock = threading.Lock()
+
+
+def _workers() -> ThreadPoolExecutor:
+    """Returns the worker threads shared by the filesystem helpers, created on first use."""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="gsewidgets-filesystem"
+            )
+        return _worker_pool
+
+
+def _key(path: PathLike) -> str:
+    """Returns the normalized path used as the cache key."""
+    return os.path.normpath(os.fspath(path))
+
+
+class PathInfo(NamedTuple):
+    """Existence, type and permissions of a path."""
+
+    exists: bool
+    is_dir: bool
+    readable: bool
+    writable: bool
+
+
+# Stored for paths that don't exist or can't be reached
+_MISSING = PathInfo(exists=False, is_dir=False, readable=False, writable=False)
+
+
+class FileSystemCache:
+    """
+    Thread safe cache of the existence and permissions of paths, shared by the filesystem backed
+    widgets so the same network paths are not checked again and again. Entries expire after the
+    ttl, and invalidate or record keep the cache in line with changes made by the application.
+    The hit and miss counters show how many lookups were served without filesystem access.
+    """
+
+    _shared: Optional["FileSystemCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self, ttl: Optional[float] = 5.0, max_entries: Optional[int] = 4096
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[PathInfo, float]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def shared(cls) -> "FileSystemCache":
+        """Returns the cache shared by all the widgets, created on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def _read_info(path: str) -> PathInfo:
+        """Reads the path information from the filesystem."""
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            return _MISSING
+        return PathInfo(
+            exists=True,
+            is_dir=stat.S_ISDIR(mode),
+            readable=os.access(path, os.R_OK),
+            writable=os.access(path, os.W_OK),
+        )
+
+    def cached(self, path: PathLike) -> Optional[PathInfo]:
+        """Returns the cached information of a path without filesystem access, or None."""
+        key = _key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._hits += 1
+            return entry[0]
+
+    def info(self, path: PathLike) -> PathInfo:
+        """Returns the information of a path, from the cache or else from the filesystem."""
+        info = self.cached(path)
+        if info is not None:
+            return info
+        # The filesystem is accessed without holding the lock
+        info = self._read_info(_key(path))
+        with self._lock:
+            self._misses += 1
+        self.record(path, info)
+        return info
+
+    def prefetch(self, path: PathLike) -> Future:
+        """Reads the information of a path on a worker thread, unless it is already cached."""
+        info = self.cached(path)
+        if info is None:
+            return _workers().submit(self.info, path)
+        future = Future()
+        future.set_result(info)
+        return future
+
+    def record(self, path: PathLike, info: PathInfo) -> None:
+        """Stores the information of a path, e.g. after the application created it."""
+        key = _key(path)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (info, time.monotonic() + self._ttl)
+            if len(self._entries) > self._max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Removes the expired entries, and the oldest ones if the cache is still full."""
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if entry[1] <= now]:
+            del self._entries[key]
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(
+        self, path: Optional[PathLike] = None, recursive: Optional[bool] = True
+    ) -> None:
+        """
+        Removes a path from the cache, together with everything below it if recursive, or all the
+        entries if the path is None.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            key = _key(path)
+            if not recursive:
+                self._entries.pop(key, None)
+                return
+            prefix = os.path.join(key, "")
+            for entry_key in [
+                entry_key
+                for entry_key in self._entries
+                if entry_key == key or entry_key.startswith(prefix)
+            ]:
+                del self._entries[entry_key]
+
+    def reset_counters(self) -> None:
+        """Sets the hit and miss counters to zero."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def ttl(self) -> float:
+        """Returns the time in seconds that the entries are kept."""
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of lookups served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of lookups that accessed the filesystem."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DirectoryCreator:
+    """
+    Checks that directories exist and creates the missing ones on worker threads, so slow network
+    mounts never block the caller. The checks go through a FileSystemCache, and concurrent
+    requests for the same directory share the work.
+    """
+
+    _shared: Optional["DirectoryCreator"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache: Optional[FileSystemCache] = None) -> None:
+        self._cache = FileSystemCache.shared() if cache is None else cache
+        self._lock = threading.Lock()
+        self._pending: dict[str, Future] = {}
+
+    @classmethod
+    def shared(cls) -> "DirectoryCreator":
+        """Returns the directory creator shared by all the widgets, created on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def ensure(
+        self,
+        path: PathLike,
+        callback: Optional[DirectoryCallback] = None,
+    ) -> Future:
+        """
+        Creates the directory and its parents if they don't exist and returns the future of the
+        work. The callback receives the path and None, or the error message if the directory
+        could not be created or is not writable. It is called from a worker thread, or
+        immediately if the directory is cached as usable.
+        """
+        path = os.fspath(path)
+        key = _key(path)
+        info = self._cache.cached(key)
+        if info is not None and info.is_dir and info.writable:
+            future = Future()
+            future.set_result(None)
+        else:
+            with self._lock:
+                future = self._pending.get(key)
+                if future is None:
+                    future = _workers().submit(self._ensure, key)
+                    self._pending[key] = future
+
+        if callback is not None:
+            future.add_done_callback(
+                lambda done: callback(path, self._error_message(done))
+            )
+        return future
+
+    def _ensure(self, key: str) -> None:
+        """Checks and creates the directory, running on a worker thread."""
+        try:
+            info = self._cache.info(key)
+            if not info.exists:
+                os.makedirs(key, exist_ok=True)
+                # The new directory and its parents are no longer missing
+                for parent in Path(key).parents:
+                    self._cache.invalidate(parent, recursive=False)
+                info = PathInfo(exists=True, is_dir=True, readable=True, writable=True)
+                self._cache.record(key, info)
+            if not info.is_dir:
+                raise NotADirectoryError(f"Not a directory: '{key}'")
+            if not info.writable:
+                raise PermissionError(f"Permission denied: '{key}'")
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    @staticmethod
+    def _error_message(future: Future) -> Optional[str]:
+        """Returns the error message of a finished future, or None if it succeeded."""
+        error = future.exception()
+        return None if error is None else str(error)
+
+    @property
+    def cache(self) -> FileSystemCache:
+        """Returns the cache used for the directory checks."""
+        return self._cache
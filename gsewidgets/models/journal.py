@@ -0,0 +1,453 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: journal.py
+# Description: Append-only journal of the collection points model edits.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import os
+import struct
+import threading
+import numpy as np
+from pathlib import Path
+from typing import Optional, Union
+
+from gsewidgets.models.collection_points import (
+    CollectionPointsModel,
+    POINTS_INSERTED,
+    POINTS_REMOVED,
+    POSITIONS_CHANGED,
+    ENABLED_CHANGED,
+    NAMES_CHANGED,
+    GROUPS_CHANGED,
+    LIMITS_CHANGED,
+    POINTS_RESET,
+)
+
+__all__ = ["CollectionPointsJournal"]
+
+# File header with a token that pairs a journal file with its snapshot file
+_MAGIC = b"GSEJ\x01"
+_FILE_HEADER = struct.Struct("<5sQ")
+# Record header with the record type and the number of points
+_RECORD_HEADER = struct.Struct("<BI")
+# Byte length of an encoded block of names
+_NAMES_HEADER = struct.Struct("<I")
+
+# Record types
+_INSERT = 1
+_REMOVE = 2
+_POSITIONS = 3
+_ENABLED = 4
+_NAMES = 5
+_GROUPS = 6
+_SNAPSHOT = 7
+_LIMITS = 8
+
+
+def _encode_names(names: list[str]) -> bytes:
+    """Encodes a list of names as a single null separated block."""
+    block = "\0".join(names).encode("utf-8")
+    return _NAMES_HEADER.pack(len(block)) + block
+
+
+def _encode_values(
+    positions: np.ndarray,
+    min_values: np.ndarray,
+    max_values: np.ndarray,
+    incremental_steps: np.ndarray,
+    precisions: np.ndarray,
+    enabled: np.ndarray,
+    groups: np.ndarray,
+    names: list[str],
+) -> bytes:
+    """Encodes all the values of a number of points."""
+    return b"".join(
+        (
+            np.ascontiguousarray(positions, dtype="<f8").tobytes(),
+            np.ascontiguousarray(min_values, dtype="<f8").tobytes(),
+            np.ascontiguousarray(max_values, dtype="<f8").tobytes(),
+            np.ascontiguousarray(incremental_steps, dtype="<f8").tobytes(),
+            np.ascontiguousarray(precisions, dtype="<i2").tobytes(),
+            np.ascontiguousarray(enabled, dtype="u1").tobytes(),
+            np.ascontiguousarray(groups, dtype="<i4").tobytes(),
+            _encode_names(names),
+        )
+    )
+
+
+def _encode_points(model: CollectionPointsModel, indices: np.ndarray) -> bytes:
+    """Encodes all the values of the given points."""
+    return _encode_values(
+        model.positions[indices],
+        model.min_values[indices],
+        model.max_values[indices],
+        model.incremental_steps[indices],
+        model.precisions[indices],
+        model.enabled[indices],
+        model.groups[indices],
+        [model.point_name(index) for index in indices.tolist()],
+    )
+
+
+class _RecordReader:
+    """Reads consecutive arrays from a journal buffer."""
+
+    def __init__(self, data: memoryview, offset: int) -> None:
+        self._data = data
+        self.offset = offset
+
+    def array(self, dtype: str, count: int, columns: Optional[int] = 1) -> np.ndarray:
+        """Reads an array with the given number of rows and columns."""
+        dtype = np.dtype(dtype)
+        size = dtype.itemsize * count * columns
+        if self.offset + size > len(self._data):
+            raise EOFError("Incomplete journal record.")
+        array = np.frombuffer(
+            self._data, dtype=dtype, count=count * columns, offset=self.offset
+        )
+        self.offset += size
+        return array.reshape(count, columns) if columns > 1 else array
+
+    def names(self, count: int) -> list[str]:
+        """Reads a block of names."""
+        (size,) = self.array("<u4", 1)
+        if self.offset + size > len(self._data):
+            raise EOFError("Incomplete journal record.")
+        block = bytes(self._data[self.offset : self.offset + size]).decode("utf-8")
+        self.offset += int(size)
+        return block.split("\0") if count else []
+
+
+class CollectionPointsJournal:
+    """
+    Append-only journal of the edits of a CollectionPointsModel, used to recover the points after
+    a crash. Every edit is encoded as a compact binary record on the calling thread, and a
+    background thread writes the buffered records and syncs them to the disk periodically. The
+    journal is compacted into a snapshot file when it is opened, when the points are cleared or
+    reordered, and after a number of records. The snapshots are encoded by the background thread.
+    """
+
+    def __init__(
+        self,
+        model: CollectionPointsModel,
+        path: Union[str, Path],
+        replay: Optional[bool] = True,
+        flush_interval: Optional[float] = 1.0,
+        compaction_records: Optional[int] = 50_000,
+    ) -> None:
+        self._model = model
+        self._path = Path(path)
+        self._snapshot_path = self._path.with_name(f"{self._path.name}.snapshot")
+        self._flush_interval = flush_interval
+        self._compaction_records = compaction_records
+
+        self._buffer = bytearray()
+        self._pending_snapshot: Optional[tuple[tuple, int]] = None
+        self._records: int = 0
+        self._requested_flushes: int = 0
+        self._completed_flushes: int = 0
+        self._closing: bool = False
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+
+        # Restore the points of the previous session
+        if replay:
+            self.replay(self._path, self._model)
+
+        # Start a new journal on top of a snapshot of the current points
+        self._file = open(self._path, "ab")
+        self.compact()
+        self._model.add_listener(self._points_model_changed)
+        self._writer = threading.Thread(
+            target=self._run_writer, name="gsewidgets-journal", daemon=True
+        )
+        self._writer.start()
+
+    @staticmethod
+    def _copy_points(model: CollectionPointsModel) -> tuple:
+        """Copies all the values of the points, to be encoded by the writer thread."""
+        return (
+            model.positions.copy(),
+            model.min_values.copy(),
+            model.max_values.copy(),
+            model.incremental_steps.copy(),
+            model.precisions.copy(),
+            model.enabled.copy(),
+            model.groups.copy(),
+            model.names,
+        )
+
+    @staticmethod
+    def _snapshot_record(values: tuple) -> bytes:
+        """Encodes the copied values of all the points as a single snapshot record."""
+        return _RECORD_HEADER.pack(_SNAPSHOT, len(values[0])) + _encode_values(*values)
+
+    def _points_model_changed(self, notification: str, indices: np.ndarray) -> None:
+        """Encodes a record for every change of the model."""
+        model = self._model
+        count = indices.size
+        if notification == POINTS_INSERTED:
+            record = _RECORD_HEADER.pack(_INSERT, count) + _encode_points(
+                model, indices
+            )
+        elif notification == POINTS_REMOVED:
+            record = (
+                _RECORD_HEADER.pack(_REMOVE, count) + indices.astype("<i8").tobytes()
+            )
+        elif notification == POSITIONS_CHANGED:
+            record = (
+                _RECORD_HEADER.pack(_POSITIONS, count)
+                + indices.astype("<i8").tobytes()
+                + np.ascontiguousarray(model.positions[indices], dtype="<f8").tobytes()
+            )
+        elif notification == ENABLED_CHANGED:
+            record = (
+                _RECORD_HEADER.pack(_ENABLED, count)
+                + indices.astype("<i8").tobytes()
+                + model.enabled[indices].astype("u1").tobytes()
+            )
+        elif notification == NAMES_CHANGED:
+            record = (
+                _RECORD_HEADER.pack(_NAMES, count)
+                + indices.astype("<i8").tobytes()
+                + _encode_names([model.point_name(index) for index in indices.tolist()])
+            )
+        elif notification == GROUPS_CHANGED:
+            record = (
+                _RECORD_HEADER.pack(_GROUPS, count)
+                + indices.astype("<i8").tobytes()
+                + model.groups[indices].astype("<i4").tobytes()
+            )
+        elif notification == LIMITS_CHANGED:
+            record = (
+                _RECORD_HEADER.pack(_LIMITS, count)
+                + indices.astype("<i8").tobytes()
+                + np.ascontiguousarray(model.min_values[indices], dtype="<f8").tobytes()
+                + np.ascontiguousarray(model.max_values[indices], dtype="<f8").tobytes()
+            )
+        elif notification == POINTS_RESET:
+            # Cleared or reordered points replace the journal with a snapshot
+            self.compact()
+            return
+        else:
+            return
+
+        with self._condition:
+            self._buffer += record
+            self._records += 1
+            compact = self._records >= self._compaction_records
+
+        if compact:
+            self.compact()
+
+    def _run_writer(self) -> None:
+        """Writes the buffered records and the snapshots, away from the GUI thread."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closing
+                    or self._requested_flushes > self._completed_flushes,
+                    timeout=self._flush_interval,
+                )
+                snapshot, self._pending_snapshot = self._pending_snapshot, None
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                requested_flushes = self._requested_flushes
+                closing = self._closing
+
+            try:
+                if snapshot is not None:
+                    values, token = snapshot
+                    self._write_snapshot(self._snapshot_record(values), token)
+                if data:
+                    self._file.write(data)
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            except OSError as error:
+                self._error = error
+
+            with self._condition:
+                self._completed_flushes = requested_flushes
+                self._condition.notify_all()
+
+            if closing:
+                break
+
+    def _write_snapshot(self, snapshot: bytes, token: int) -> None:
+        """Replaces the snapshot file and starts a new, empty journal file."""
+        header = _FILE_HEADER.pack(_MAGIC, token)
+        temporary_path = self._snapshot_path.with_name(
+            f"{self._snapshot_path.name}.tmp"
+        )
+        with open(temporary_path, "wb") as file:
+            file.write(header + snapshot)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self._snapshot_path)
+
+        # The records of the journal are now part of the snapshot, and a journal with an
+        # older token is ignored if the truncation below does not complete
+        self._file.truncate(0)
+        self._file.write(header)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def compact(self) -> None:
+        """
+        Replaces the journal with a snapshot of the current points. The points are copied on the
+        calling thread, and encoded and written in the background.
+        """
+        values = self._copy_points(self._model)
+        with self._condition:
+            # The buffered records are already part of the snapshot
+            self._buffer.clear()
+            self._records = 0
+            self._pending_snapshot = (
+                values,
+                int.from_bytes(os.urandom(8), "little"),
+            )
+            self._requested_flushes += 1
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Writes all the buffered records to the disk and waits until they are synced."""
+        with self._condition:
+            self._requested_flushes += 1
+            requested_flushes = self._requested_flushes
+            self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: self._completed_flushes >= requested_flushes
+                or not self._writer.is_alive()
+            )
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """Stops journaling, writes the remaining records and closes the journal file."""
+        self._model.remove_listener(self._points_model_changed)
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._writer.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    @classmethod
+    def replay(cls, path: Union[str, Path], model: CollectionPointsModel) -> int:
+        """
+        Applies the snapshot and the records of a journal to a model and returns the number of
+        applied records. An incomplete record at the end of the journal is ignored.
+        """
+        path = Path(path)
+        applied_records = 0
+        snapshot_token = None
+        for file_path in (path.with_name(f"{path.name}.snapshot"), path):
+            if not file_path.exists():
+                continue
+            data = memoryview(file_path.read_bytes())
+            if len(data) < _FILE_HEADER.size:
+                continue
+            magic, token = _FILE_HEADER.unpack_from(data, 0)
+            if magic != _MAGIC:
+                continue
+            if snapshot_token is None:
+                snapshot_token = token
+            elif token != snapshot_token:
+                # The journal belongs to an older snapshot
+                continue
+            offset = _FILE_HEADER.size
+            while offset + _RECORD_HEADER.size <= len(data):
+                record_type, count = _RECORD_HEADER.unpack_from(data, offset)
+                reader = _RecordReader(data, offset + _RECORD_HEADER.size)
+                try:
+                    cls._apply_record(model, record_type, count, reader)
+                except EOFError:
+                    # The last record was not completely written
+                    break
+                offset = reader.offset
+                applied_records += 1
+        return applied_records
+
+    @staticmethod
+    def _apply_record(
+        model: CollectionPointsModel,
+        record_type: int,
+        count: int,
+        reader: _RecordReader,
+    ) -> None:
+        """Decodes a single record and applies it to the model."""
+        if record_type in (_INSERT, _SNAPSHOT):
+            positions = reader.array("<f8", count, 3)
+            min_values = reader.array("<f8", count, 3)
+            max_values = reader.array("<f8", count, 3)
+            incremental_steps = reader.array("<f8", count, 3)
+            precisions = reader.array("<i2", count, 3)
+            enabled = reader.array("u1", count).astype(bool)
+            groups = reader.array("<i4", count)
+            names = reader.names(count)
+            if record_type == _SNAPSHOT:
+                model.clear()
+            if count:
+                model.add_points(
+                    positions,
+                    names=names,
+                    enabled=enabled,
+                    min_values=min_values,
+                    max_values=max_values,
+                    incremental_steps=incremental_steps,
+                    precisions=precisions,
+                    groups=groups,
+                )
+            return
+
+        indices = reader.array("<i8", count)
+        if record_type == _REMOVE:
+            model.remove_points(indices)
+        elif record_type == _POSITIONS:
+            model.set_positions(indices, reader.array("<f8", count, 3))
+        elif record_type == _ENABLED:
+            model.set_enabled(indices, reader.array("u1", count).astype(bool))
+        elif record_type == _NAMES:
+            for index, name in zip(indices.tolist(), reader.names(count)):
+                model.rename_point(index, name)
+        elif record_type == _GROUPS:
+            groups = reader.array("<i4", count)
+            for group in np.unique(groups):
+                model.set_group(indices[groups == group], int(group))
+        elif record_type == _LIMITS:
+            min_values = reader.array("<f8", count, 3)
+            max_values = reader.array("<f8", count, 3)
+            model.set_limits(indices, min_values, max_values)
+        else:
+            raise ValueError(f"Unknown journal record type {record_type}.")
+
+    @property
+    def path(self) -> Path:
+        """Returns the path of the journal file."""
+        return self._path
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Returns the path of the snapshot file."""
+        return self._snapshot_path
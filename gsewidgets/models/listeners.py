@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: listeners.py
+# Description: Listener lists of the headless models.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import weakref
+from inspect import ismethod
+from typing import Callable, Optional
+
+__all__ = ["ListenerList"]
+
+
+class _StrongReference:
+    """Reference with the interface of weakref.WeakMethod, used for plain functions."""
+
+    __slots__ = ("_listener",)
+
+    def __init__(self, listener: Callable) -> None:
+        self._listener = listener
+
+    def __call__(self) -> Callable:
+        return self._listener
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _StrongReference) and other._listener == self._listener
+
+    def __hash__(self) -> int:
+        return hash(self._listener)
+
+
+class ListenerList:
+    """
+    Listeners of a headless model. Bound methods are held with weak references, so that a model
+    shared by several views doesn't keep the views alive after they are dropped.
+    """
+
+    __slots__ = ("_references",)
+
+    def __init__(self) -> None:
+        self._references: list = []
+
+    @staticmethod
+    def _reference(listener: Callable):
+        """Returns a weak reference for bound methods and a strong one for other callables."""
+        if ismethod(listener):
+            return weakref.WeakMethod(listener)
+        return _StrongReference(listener)
+
+    def add(self, listener: Callable) -> None:
+        """Registers a listener, unless it is already registered."""
+        reference = self._reference(listener)
+        if reference not in self._references:
+            self._references.append(reference)
+
+    def remove(self, listener: Optional[Callable]) -> None:
+        """Unregisters a listener. Listeners that are not registered are ignored."""
+        if listener is None:
+            return
+        reference = self._reference(listener)
+        if reference in self._references:
+            self._references.remove(reference)
+
+    def notify(self, *args) -> None:
+        """Calls all the live listeners and drops the ones whose objects were collected."""
+        dead = False
+        for reference in list(self._references):
+            listener = reference()
+            if listener is None:
+                dead = True
+            else:
+                listener(*args)
+        if dead:
+            self._references = [
+                reference for reference in self._references if reference() is not None
+            ]
+
+    def __len__(self) -> int:
+        return sum(1 for reference in self._references if reference() is not None)
+
+    def __contains__(self, listener: Callable) -> bool:
+        return self._reference(listener) in self._references
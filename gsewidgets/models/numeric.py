@@ -0,0 +1,289 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: numeric.py
+# Description: Headless numeric data models used to create spinboxes.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import numpy as np
+from typing import Callable, Optional, Sequence, Union
+
+from gsewidgets.models.listeners import ListenerList
+
+__all__ = [
+    "NumericDataModel",
+    "NumericDataArrayModel",
+    "VALUES_CHANGED",
+    "LIMITS_CHANGED",
+]
+
+# Notification types sent to the array model listeners
+VALUES_CHANGED = "values"
+LIMITS_CHANGED = "limits"
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class NumericDataModel:
+    """
+    Lightweight numeric data model for use in the creation of a spinbox, that does not depend on
+    Qt. Observers are optional and are only stored once the first one is added. Observers that
+    are bound methods are held weakly.
+    """
+
+    __slots__ = (
+        "_min_value",
+        "_max_value",
+        "_current_value",
+        "_incremental_step",
+        "_precision",
+        "_observers",
+    )
+
+    def __init__(
+        self,
+        min_value: float,
+        max_value: float,
+        current_value: float,
+        incremental_step: float,
+        precision: Optional[int] = 0,
+    ) -> None:
+        self._min_value = min_value
+        self._max_value = max_value
+        self._current_value = current_value
+        self._incremental_step = incremental_step
+        self._precision = precision
+        self._observers: Optional[ListenerList] = None
+
+    def add_observer(self, observer: Callable[["NumericDataModel"], None]) -> None:
+        """Registers a callable that receives the model after every change."""
+        if self._observers is None:
+            self._observers = ListenerList()
+        self._observers.add(observer)
+
+    def remove_observer(
+        self, observer: Optional[Callable[["NumericDataModel"], None]]
+    ) -> None:
+        """Unregisters a previously registered observer."""
+        if self._observers is not None:
+            self._observers.remove(observer)
+
+    def _notify(self) -> None:
+        """Calls all the registered observers."""
+        if self._observers is not None:
+            self._observers.notify(self)
+
+    def update_value(self, new_value: float) -> None:
+        """Updates the current value."""
+        if new_value != self._current_value:
+            self._current_value = new_value
+            self._notify()
+
+    def update_min_max(self, new_min: float, new_max: float) -> None:
+        """Updates the min and max values and clamps the current value into the new range."""
+        if new_min != self._min_value or new_max != self._max_value:
+            self._min_value = new_min
+            self._max_value = new_max
+            self._current_value = min(max(self._current_value, new_min), new_max)
+            self._notify()
+
+    @property
+    def min_value(self) -> float:
+        """Returns the minimum value."""
+        return self._min_value
+
+    @property
+    def max_value(self) -> float:
+        """Returns the maximum value."""
+        return self._max_value
+
+    @property
+    def current_value(self) -> float:
+        """Returns the current value."""
+        return self._current_value
+
+    @property
+    def incremental_step(self) -> float:
+        """Returns the incremental step value."""
+        return self._incremental_step
+
+    @property
+    def precision(self) -> int:
+        """Returns the precision value."""
+        return self._precision
+
+
+class NumericDataArrayModel:
+    """
+    Collection of numeric data for many spinboxes, stored as NumPy arrays. Batch updates send a
+    single notification with the indices of the entries that actually changed.
+    """
+
+    def __init__(
+        self,
+        min_values: ArrayLike,
+        max_values: ArrayLike,
+        current_values: ArrayLike,
+        incremental_steps: ArrayLike,
+        precisions: Optional[Union[int, Sequence[int], np.ndarray]] = 0,
+    ) -> None:
+        current_values = np.array(current_values, dtype=np.float64, ndmin=1)
+        count = current_values.shape[0]
+
+        self._current_values = current_values
+        self._min_values = np.broadcast_to(
+            np.asarray(min_values, dtype=np.float64), (count,)
+        ).copy()
+        self._max_values = np.broadcast_to(
+            np.asarray(max_values, dtype=np.float64), (count,)
+        ).copy()
+        self._incremental_steps = np.broadcast_to(
+            np.asarray(incremental_steps, dtype=np.float64), (count,)
+        ).copy()
+        self._precisions = np.broadcast_to(
+            np.asarray(precisions, dtype=np.int16), (count,)
+        ).copy()
+
+        self._listeners = ListenerList()
+
+    @classmethod
+    def from_data_models(
+        cls, models: Sequence[NumericDataModel]
+    ) -> "NumericDataArrayModel":
+        """Creates an array model from a sequence of single value data models."""
+        return cls(
+            min_values=[model.min_value for model in models],
+            max_values=[model.max_value for model in models],
+            current_values=[model.current_value for model in models],
+            incremental_steps=[model.incremental_step for model in models],
+            precisions=[model.precision for model in models],
+        )
+
+    def __len__(self) -> int:
+        return self._current_values.shape[0]
+
+    def add_listener(self, listener: Callable[[str, np.ndarray], None]) -> None:
+        """Registers a callable that receives the notification type and the changed indices."""
+        self._listeners.add(listener)
+
+    def remove_listener(self, listener: Callable[[str, np.ndarray], None]) -> None:
+        """Unregisters a previously registered listener."""
+        self._listeners.remove(listener)
+
+    def _notify(self, notification: str, indices: np.ndarray) -> None:
+        """Sends a notification to all the registered listeners."""
+        self._listeners.notify(notification, indices)
+
+    def update_values(
+        self, indices: Union[int, Sequence[int], np.ndarray], values: ArrayLike
+    ) -> np.ndarray:
+        """
+        Updates the current values of the given entries and returns the indices that changed.
+        The listeners are notified once, and only if at least one value changed.
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        values = np.broadcast_to(np.asarray(values, dtype=np.float64), indices.shape)
+        changed = self._current_values[indices] != values
+        if not changed.any():
+            return indices[:0]
+        indices, values = indices[changed], values[changed]
+        self._current_values[indices] = values
+        self._notify(VALUES_CHANGED, indices)
+        return indices
+
+    def update_min_max(
+        self,
+        indices: Union[int, Sequence[int], np.ndarray],
+        new_mins: ArrayLike,
+        new_maxs: ArrayLike,
+    ) -> np.ndarray:
+        """
+        Updates the min and max values of the given entries and returns the indices that changed.
+        The current values are clamped into the new limits, with a separate values notification.
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        new_mins = np.broadcast_to(
+            np.asarray(new_mins, dtype=np.float64), indices.shape
+        )
+        new_maxs = np.broadcast_to(
+            np.asarray(new_maxs, dtype=np.float64), indices.shape
+        )
+        changed = (self._min_values[indices] != new_mins) | (
+            self._max_values[indices] != new_maxs
+        )
+        if not changed.any():
+            return indices[:0]
+        indices = indices[changed]
+        self._min_values[indices] = new_mins[changed]
+        self._max_values[indices] = new_maxs[changed]
+        current_values = self._current_values[indices]
+        clamped_values = np.clip(
+            current_values, self._min_values[indices], self._max_values[indices]
+        )
+        clamped = clamped_values != current_values
+        self._current_values[indices] = clamped_values
+        self._notify(LIMITS_CHANGED, indices)
+        if clamped.any():
+            self._notify(VALUES_CHANGED, indices[clamped])
+        return indices
+
+    def data_model(self, index: int) -> NumericDataModel:
+        """Returns a NumericDataModel with the current values of a single entry."""
+        return NumericDataModel(
+            min_value=float(self._min_values[index]),
+            max_value=float(self._max_values[index]),
+            current_value=float(self._current_values[index]),
+            incremental_step=float(self._incremental_steps[index]),
+            precision=int(self._precisions[index]),
+        )
+
+    @staticmethod
+    def _view(array: np.ndarray) -> np.ndarray:
+        """Returns a read only view of an array."""
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def current_values(self) -> np.ndarray:
+        """Returns a read only view of the current values."""
+        return self._view(self._current_values)
+
+    @property
+    def min_values(self) -> np.ndarray:
+        """Returns a read only view of the min values."""
+        return self._view(self._min_values)
+
+    @property
+    def max_values(self) -> np.ndarray:
+        """Returns a read only view of the max values."""
+        return self._view(self._max_values)
+
+    @property
+    def incremental_steps(self) -> np.ndarray:
+        """Returns a read only view of the incremental steps."""
+        return self._view(self._incremental_steps)
+
+    @property
+    def precisions(self) -> np.ndarray:
+        """Returns a read only view of the precision values."""
+        return self._view(self._precisions)
@@ -0,0 +1,319 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: sources.py
+# Description: Value sources and a simulated process variable server.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import heapq
+import threading
+import time
+import numpy as np
+from typing import Callable, Optional
+
+__all__ = ["ValueSource", "SimulatedPV", "SimulatedPVServer"]
+
+ValueCallback = Callable[[object, float], None]
+ConnectionCallback = Callable[[bool], None]
+
+
+class ValueSource:
+    """
+    Source of live values, e.g. an EPICS process variable. Subscribers are called from the thread
+    that publishes the value with the value and its time.perf_counter timestamp. Subclasses publish
+    new values with _publish and connection changes with _set_connected.
+    """
+
+    def __init__(self, name: Optional[str] = "") -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._value: object = None
+        self._timestamp: float = 0.0
+        self._connected: bool = True
+        self._value_callbacks: list[ValueCallback] = []
+        self._connection_callbacks: list[ConnectionCallback] = []
+
+    def subscribe(self, callback: ValueCallback) -> None:
+        """Registers a callable that receives every new value and its timestamp."""
+        with self._lock:
+            if callback not in self._value_callbacks:
+                self._value_callbacks = self._value_callbacks + [callback]
+
+    def unsubscribe(self, callback: ValueCallback) -> None:
+        """Unregisters a value callback."""
+        with self._lock:
+            self._value_callbacks = [
+                registered
+                for registered in self._value_callbacks
+                if registered != callback
+            ]
+
+    def add_connection_callback(self, callback: ConnectionCallback) -> None:
+        """Registers a callable that receives the connection state when it changes."""
+        with self._lock:
+            if callback not in self._connection_callbacks:
+                self._connection_callbacks = self._connection_callbacks + [callback]
+
+    def remove_connection_callback(self, callback: ConnectionCallback) -> None:
+        """Unregisters a connection callback."""
+        with self._lock:
+            self._connection_callbacks = [
+                registered
+                for registered in self._connection_callbacks
+                if registered != callback
+            ]
+
+    def put(self, value: object) -> None:
+        """Writes a new value to the source. The default source publishes it directly."""
+        self._publish(value)
+
+    def _publish(self, value: object, timestamp: Optional[float] = None) -> None:
+        """Stores a new value and calls the subscribers."""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        with self._lock:
+            self._value = value
+            self._timestamp = timestamp
+            callbacks = self._value_callbacks
+        for callback in callbacks:
+            callback(value, timestamp)
+
+    def _set_connected(self, state: bool) -> None:
+        """Changes the connection state and calls the connection callbacks."""
+        with self._lock:
+            if state == self._connected:
+                return
+            self._connected = state
+            callbacks = self._connection_callbacks
+        for callback in callbacks:
+            callback(state)
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the source."""
+        return self._name
+
+    @property
+    def value(self) -> object:
+        """Returns the latest value."""
+        return self._value
+
+    @property
+    def timestamp(self) -> float:
+        """Returns the timestamp of the latest value."""
+        return self._timestamp
+
+    @property
+    def connected(self) -> bool:
+        """Returns the connection state."""
+        return self._connected
+
+
+class SimulatedPV(ValueSource):
+    """
+    Simulated process variable, updated by a SimulatedPVServer. The published value is the
+    setpoint, or the waveform value at the elapsed time, plus gaussian noise.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        value: Optional[object] = 0.0,
+        rate: Optional[float] = 10.0,
+        noise: Optional[float] = 0.0,
+        waveform: Optional[Callable[[float], float]] = None,
+    ) -> None:
+        super(SimulatedPV, self).__init__(name=name)
+
+        if rate <= 0:
+            raise ValueError("The update rate must be greater than 0.")
+
+        self._setpoint = value
+        self._rate = rate
+        self._noise = noise
+        self._waveform = waveform
+        self._value = value
+        self._updates = 0
+
+    def put(self, value: object) -> None:
+        """Changes the setpoint and publishes it, like a soft IOC record."""
+        self._setpoint = value
+        if self._connected:
+            self._publish(value)
+
+    def _next_value(self, elapsed: float, rng: np.random.Generator) -> object:
+        """Returns the next simulated value."""
+        value = (
+            self._waveform(elapsed) if self._waveform is not None else self._setpoint
+        )
+        if (
+            self._noise
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+        ):
+            value = value + rng.normal(0.0, self._noise)
+        return value
+
+    @property
+    def rate(self) -> float:
+        """Returns the number of updates per second."""
+        return self._rate
+
+    @property
+    def updates(self) -> int:
+        """Returns the number of values published by the server."""
+        return self._updates
+
+
+class SimulatedPVServer:
+    """
+    In-process server that publishes the values of simulated process variables from a background
+    thread, at the update rate of each variable. Variables can be disconnected manually, or at
+    random with the given rate of disconnects per second and duration. Used to test and benchmark
+    the value source bindings without hardware.
+    """
+
+    def __init__(
+        self,
+        disconnect_rate: Optional[float] = 0.0,
+        disconnect_duration: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._disconnect_rate = disconnect_rate
+        self._disconnect_duration = disconnect_duration
+        self._rng = np.random.default_rng(seed)
+        self._pvs: dict[str, SimulatedPV] = {}
+        self._reconnect_times: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = 0.0
+
+    def add_pv(
+        self,
+        name: str,
+        value: Optional[object] = 0.0,
+        rate: Optional[float] = 10.0,
+        noise: Optional[float] = 0.0,
+        waveform: Optional[Callable[[float], float]] = None,
+    ) -> SimulatedPV:
+        """Creates a simulated process variable. Must be called before the server starts."""
+        if self.running:
+            raise RuntimeError("Process variables can't be added to a running server.")
+        if name in self._pvs:
+            raise ValueError(f"The process variable {name} already exists.")
+        pv = SimulatedPV(
+            name=name, value=value, rate=rate, noise=noise, waveform=waveform
+        )
+        self._pvs[name] = pv
+        return pv
+
+    def pv(self, name: str) -> SimulatedPV:
+        """Returns a process variable by name."""
+        return self._pvs[name]
+
+    def disconnect(self, name: str, duration: Optional[float] = None) -> None:
+        """Disconnects a process variable, until reconnect is called or the duration passes."""
+        with self._lock:
+            self._reconnect_times[name] = (
+                time.perf_counter() + duration if duration is not None else np.inf
+            )
+        self._pvs[name]._set_connected(False)
+
+    def reconnect(self, name: str) -> None:
+        """Reconnects a process variable and publishes its current value."""
+        with self._lock:
+            self._reconnect_times.pop(name, None)
+        pv = self._pvs[name]
+        pv._set_connected(True)
+        pv._publish(pv.value)
+
+    def start(self) -> None:
+        """Starts publishing the values from the background thread."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="simulated-pv-server", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "SimulatedPVServer":
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        """Publishes the due values, using a queue ordered by the next update time."""
+        now = time.perf_counter()
+        queue = [(now, name) for name in self._pvs]
+        heapq.heapify(queue)
+        while queue and not self._stop_event.is_set():
+            due_time, name = queue[0]
+            delay = due_time - time.perf_counter()
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+            heapq.heappop(queue)
+            pv = self._pvs[name]
+            now = time.perf_counter()
+            self._update_pv(pv, now)
+            # Keep the rate without drifting, but don't try to catch up after a stall
+            heapq.heappush(queue, (max(due_time + 1.0 / pv.rate, now), name))
+
+    def _update_pv(self, pv: SimulatedPV, now: float) -> None:
+        """Publishes a single update and applies the simulated disconnects."""
+        with self._lock:
+            reconnect_time = self._reconnect_times.get(pv.name)
+        if reconnect_time is not None:
+            if now < reconnect_time:
+                return
+            self.reconnect(pv.name)
+
+        if self._disconnect_rate and (
+            self._rng.random() < self._disconnect_rate / pv.rate
+        ):
+            self.disconnect(pv.name, self._disconnect_duration)
+            return
+
+        pv._publish(pv._next_value(now - self._start_time, self._rng), now)
+        pv._updates += 1
+
+    @property
+    def running(self) -> bool:
+        """Returns True if the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pvs(self) -> list[SimulatedPV]:
+        """Returns all the process variables."""
+        return list(self._pvs.values())
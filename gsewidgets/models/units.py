@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: units.py
+# Description: Unit families with precomputed conversion factors.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import math
+from typing import Optional
+
+__all__ = ["UnitFamily", "LENGTH_UNITS", "ANGLE_UNITS"]
+
+
+class UnitFamily:
+    """
+    Units of the same quantity, e.g. lengths. Values are stored in the canonical unit, and the
+    conversion factors and the precision shift of every unit are computed once.
+    """
+
+    __slots__ = ("_name", "_canonical_unit", "_factors", "_precision_shifts")
+
+    def __init__(
+        self, name: str, canonical_unit: str, factors: dict[str, float]
+    ) -> None:
+        if factors.get(canonical_unit) != 1:
+            raise ValueError("The factor of the canonical unit must be 1.")
+        if any(factor <= 0 for factor in factors.values()):
+            raise ValueError("The unit factors must be greater than 0.")
+
+        self._name = name
+        self._canonical_unit = canonical_unit
+        # Canonical value of one display unit
+        self._factors = dict(factors)
+        # Decimal places gained or lost when a value is shown in a unit
+        self._precision_shifts = {
+            unit: math.log10(factor) for unit, factor in factors.items()
+        }
+
+    def factor(self, unit: str) -> float:
+        """Returns the canonical value of one unit."""
+        try:
+            return self._factors[unit]
+        except KeyError:
+            raise ValueError(f"Unknown {self._name} unit {unit}.") from None
+
+    def to_display(self, value: float, unit: str) -> float:
+        """Converts a canonical value to a unit."""
+        return value / self.factor(unit)
+
+    def to_canonical(self, value: float, unit: str) -> float:
+        """Converts a value of a unit to the canonical unit."""
+        return value * self.factor(unit)
+
+    def display_precision(self, precision: int, unit: str) -> int:
+        """Returns the decimals a unit needs to keep the resolution of a canonical precision."""
+        self.factor(unit)
+        return max(0, math.ceil(precision + self._precision_shifts[unit] - 1e-9))
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the quantity."""
+        return self._name
+
+    @property
+    def canonical_unit(self) -> str:
+        """Returns the canonical unit."""
+        return self._canonical_unit
+
+    @property
+    def units(self) -> list[str]:
+        """Returns the available units."""
+        return list(self._factors)
+
+
+LENGTH_UNITS = UnitFamily("length", "mm", {"m": 1e3, "mm": 1.0, "µm": 1e-3, "nm": 1e-6})
+ANGLE_UNITS = UnitFamily(
+    "angle",
+    "deg",
+    {
+        "deg": 1.0,
+        "rad": 180 / math.pi,
+        "mrad": 0.18 / math.pi,
+        "µrad": 1.8e-4 / math.pi,
+    },
+)
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: application.py
+# Description: Base test case of the widget tests.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import sys
+import unittest
+from qtpy.QtWidgets import QApplication
+
+
+class ApplicationTestCase(unittest.TestCase):
+    """Base of the widget tests, which share the QApplication of the test run."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the application, kept until all the tests of the class finish."""
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Tear down the application."""
+        del cls._app
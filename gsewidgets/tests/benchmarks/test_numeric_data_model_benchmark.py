@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_data_model_benchmark.py
+# Description: Compare the NumericDataModel with the NumericDataSpinBoxModel.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import gc
+import time
+import tracemalloc
+import unittest
+
+from gsewidgets.models.numeric import NumericDataModel
+from gsewidgets.tests.benchmarks import timing_test
+from gsewidgets.widgets.spinboxes import NumericDataSpinBoxModel
+
+
+class TestNumericDataModelBenchmark(unittest.TestCase):
+    """Benchmark the construction time and memory of the numeric data models."""
+
+    _instances = 20_000
+
+    def _construction_time(self, model_class: type) -> float:
+        """Returns the construction time per instance in microseconds."""
+        start = time.perf_counter()
+        models = [
+            model_class(
+                min_value=-100,
+                max_value=100,
+                current_value=0,
+                incremental_step=1,
+                precision=2,
+            )
+            for _ in range(self._instances)
+        ]
+        elapsed = time.perf_counter() - start
+        del models
+        gc.collect()
+        return elapsed / self._instances * 1e6
+
+    def _memory(self, model_class: type) -> float:
+        """Returns the traced Python memory per instance in bytes."""
+        gc.collect()
+        tracemalloc.start()
+        models = [
+            model_class(
+                min_value=-100,
+                max_value=100,
+                current_value=0,
+                incremental_step=1,
+                precision=2,
+            )
+            for _ in range(self._instances)
+        ]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del models
+        gc.collect()
+        return memory / self._instances
+
+    @timing_test
+    def test_construction_time(self) -> None:
+        """Test that the NumericDataModel is faster to create."""
+        qobject_time = self._construction_time(NumericDataSpinBoxModel)
+        slots_time = self._construction_time(NumericDataModel)
+        self.assertLess(slots_time, qobject_time)
+
+    def test_memory(self) -> None:
+        """Test that the NumericDataModel uses less memory. The C++ part of the QObject is not traced."""
+        qobject_memory = self._memory(NumericDataSpinBoxModel)
+        slots_memory = self._memory(NumericDataModel)
+        self.assertLess(slots_memory, qobject_memory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_spinbox_formatting_benchmark.py
+# Description: Benchmark the cached formatting of the NumericSpinBox.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import time
+import unittest
+import numpy as np
+from qtpy.QtWidgets import QDoubleSpinBox
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.tests.benchmarks import timing_test
+from gsewidgets.widgets.spinboxes import NumericSpinBox
+
+
+class TestNumericSpinBoxFormattingBenchmark(ApplicationTestCase):
+    """Benchmark the cached formatting of the NumericSpinBox."""
+
+    _calls = 20_000
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._spinbox = NumericSpinBox(-1000, 1000, 0, 1, 3)
+        # A few hundred distinct live values, repeated like a readback near its setpoint
+        self._values = np.round(
+            np.random.default_rng(0).normal(12.5, 0.05, self._calls), 3
+        ).tolist()
+
+    def _time_per_call(self, function, arguments: list) -> float:
+        """Returns the best time per call of three runs in microseconds."""
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            for argument in arguments:
+                function(*argument)
+            times.append((time.perf_counter() - start) / len(arguments) * 1e6)
+        return min(times)
+
+    @timing_test
+    def test_text_from_value(self) -> None:
+        """Test that the cached formatting is faster than the formatting of Qt."""
+        reference = QDoubleSpinBox()
+        reference.setRange(-1000, 1000)
+        reference.setDecimals(3)
+        arguments = [(value,) for value in self._values]
+        qt_time = self._time_per_call(reference.textFromValue, arguments)
+        cached_time = self._time_per_call(self._spinbox.textFromValue, arguments)
+        self.assertLess(cached_time, qt_time)
+
+    @timing_test
+    def test_set_value(self) -> None:
+        """Test that setValue, which formats the value in Python, stays close to the Qt cost."""
+        reference = QDoubleSpinBox()
+        reference.setRange(-1000, 1000)
+        reference.setDecimals(3)
+        arguments = [(value,) for value in self._values]
+        qt_time = self._time_per_call(reference.setValue, arguments)
+        numeric_time = self._time_per_call(self._spinbox.setValue, arguments)
+        self.assertLess(numeric_time, qt_time * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
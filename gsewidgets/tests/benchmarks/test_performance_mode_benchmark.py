@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_performance_mode_benchmark.py
+# Description: Measure the repaints saved by the performance mode.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+from qtpy.QtCore import QEvent, QObject
+from qtpy.QtTest import QTest
+from qtpy.QtWidgets import QGridLayout, QWidget
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.tests.benchmarks import timing_test
+from gsewidgets.widgets.checkboxes import ToggleCheckBox, ToggleAnimationDriver
+from gsewidgets.widgets.performance import set_performance_mode
+
+
+class _PaintCounter(QObject):
+    """Counts the paint events of the watched widgets and the number of painted pixels."""
+
+    def __init__(self) -> None:
+        super(_PaintCounter, self).__init__()
+        self.paints = 0
+        self.pixels = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            self.paints += 1
+            rect = event.rect()
+            self.pixels += rect.width() * rect.height()
+        return False
+
+
+class TestPerformanceModeBenchmark(ApplicationTestCase):
+    """Benchmark the repaints of a panel of toggles with and without the performance mode."""
+
+    _toggles = 50
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Tear down the application."""
+        set_performance_mode(False)
+        super().tearDownClass()
+
+    def _toggle_panel(self) -> _PaintCounter:
+        """Toggles all the checkboxes of a shown panel and returns the counted repaints."""
+        ToggleAnimationDriver.instance().set_duration(350)
+        panel = QWidget()
+        layout = QGridLayout(panel)
+        counter = _PaintCounter()
+        toggles = []
+        for index in range(self._toggles):
+            toggle = ToggleCheckBox()
+            toggle.installEventFilter(counter)
+            layout.addWidget(toggle, index // 10, index % 10)
+            toggles.append(toggle)
+        panel.show()
+        QTest.qWait(50)
+        counter.paints = counter.pixels = 0
+        for toggle in toggles:
+            toggle.setChecked(True)
+        QTest.qWait(500)
+        panel.close()
+        panel.deleteLater()
+        return counter
+
+    def test_animations(self) -> None:
+        """Test that the performance mode finishes the running animations and starts no new ones."""
+        driver = ToggleAnimationDriver.instance()
+        driver.set_duration(350)
+        set_performance_mode(False)
+        toggles = [ToggleCheckBox() for _ in range(self._toggles)]
+        for toggle in toggles[: self._toggles // 2]:
+            toggle.setChecked(True)
+        self.assertEqual(driver.active_animations, self._toggles // 2)
+
+        set_performance_mode(True)
+        self.assertEqual(driver.active_animations, 0)
+        for toggle in toggles[self._toggles // 2 :]:
+            toggle.setChecked(True)
+        self.assertEqual(driver.active_animations, 0)
+        self.assertEqual(
+            [toggle.circle_position for toggle in toggles], [1] * self._toggles
+        )
+        set_performance_mode(False)
+
+    @timing_test
+    def test_repaints(self) -> None:
+        """Test that the performance mode repaints every toggle once."""
+        set_performance_mode(False)
+        animated = self._toggle_panel()
+        set_performance_mode(True)
+        reduced = self._toggle_panel()
+        set_performance_mode(False)
+        self.assertLessEqual(reduced.paints, self._toggles * 2)
+        self.assertLess(reduced.paints * 5, animated.paints)
+
+
+if __name__ == "__main__":
+    unittest.main()
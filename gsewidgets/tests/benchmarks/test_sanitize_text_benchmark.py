@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_sanitize_text_benchmark.py
+# Description: Compare the shared sanitizer with per character replacement.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import timeit
+import unittest
+
+from gsewidgets.tests.benchmarks import timing_test
+from gsewidgets.widgets.filters import sanitize_text
+
+
+class TestSanitizeTextBenchmark(unittest.TestCase):
+    """Benchmark the sanitization of long pasted paths."""
+
+    _invalid_characters = '<>"\\|?*#&$: '
+    _repeats = 200
+    _text = "/data/beamline 13/run #42/sample <A>?|" * 500
+
+    def _replace(self, text: str) -> str:
+        """Replaces the invalid characters one at a time, as before the shared sanitizer."""
+        for character in self._invalid_characters:
+            text = text.replace(character, "_")
+        return text
+
+    def _time(self, function, text: str) -> float:
+        """Returns the best time of five runs, in microseconds per call."""
+        times = timeit.repeat(lambda: function(text), number=self._repeats, repeat=5)
+        return min(times) / self._repeats * 1e6
+
+    def test_long_paths(self) -> None:
+        """Test that the sanitizer matches the replacement on long paths."""
+        self.assertEqual(
+            sanitize_text(self._text, self._invalid_characters),
+            self._replace(self._text),
+        )
+
+    @timing_test
+    def test_long_paths_time(self) -> None:
+        """Test that the sanitizer is faster than the replacement on long paths."""
+        sanitize = lambda value: sanitize_text(value, self._invalid_characters)
+        replace_time = self._time(self._replace, self._text)
+        sanitize_time = self._time(sanitize, self._text)
+        self.assertLess(sanitize_time, replace_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_toggle_checkbox_paint_benchmark.py
+# Description: Measure the allocations of the ToggleCheckBox paints.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import statistics
+import tracemalloc
+import unittest
+from unittest import mock
+from qtpy.QtGui import QImage
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets import checkboxes
+from gsewidgets.widgets.checkboxes import ToggleCheckBox
+
+
+class TestToggleCheckBoxPaintBenchmark(ApplicationTestCase):
+    """Benchmark the paints of the ToggleCheckBox at rest."""
+
+    _paints = 2000
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._toggle = ToggleCheckBox()
+        self._toggle.resize(58, 45)
+        self._toggle.set_state(True)
+        self._image = QImage(
+            self._toggle.size(), QImage.Format.Format_ARGB32_Premultiplied
+        )
+        self._toggle.render(self._image)
+
+    def test_cached_images(self) -> None:
+        """Test that a paint at rest draws the cached images without looking them up."""
+        with mock.patch.object(
+            checkboxes, "_cached_image", wraps=checkboxes._cached_image
+        ) as cached_image:
+            for _ in range(10):
+                self._toggle.render(self._image)
+            self.assertEqual(cached_image.call_count, 0)
+            self._toggle.circle_position = 0.5
+            self._toggle.render(self._image)
+            self.assertEqual(cached_image.call_count, 1)
+
+    def test_paint_allocations(self) -> None:
+        """Test that a paint at rest only allocates the painter and doesn't keep any memory."""
+        allocated = []
+        kept = []
+        tracemalloc.start()
+        for _ in range(self._paints):
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self._toggle.render(self._image)
+            current, peak = tracemalloc.get_traced_memory()
+            allocated.append(peak - start)
+            kept.append(current - start)
+        tracemalloc.stop()
+        # The medians ignore the occasional resize of the tables of the Qt bindings
+        self.assertLess(statistics.median(allocated), 1024)
+        self.assertEqual(statistics.median(kept), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
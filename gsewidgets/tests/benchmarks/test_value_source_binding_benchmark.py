@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_value_source_binding_benchmark.py
+# Description: Measure the update latency and GUI thread load of the value source bindings.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import math
+import time
+import unittest
+from qtpy.QtTest import QTest
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.tests.benchmarks import timing_test
+from gsewidgets.models.sources import SimulatedPVServer
+from gsewidgets.widgets.bindings import (
+    NumericSpinBoxBinding,
+    ToggleCheckBoxBinding,
+    StatusLabelBinding,
+)
+from gsewidgets.widgets.checkboxes import ToggleCheckBox
+from gsewidgets.widgets.labels import StatusLabel
+from gsewidgets.widgets.spinboxes import NumericSpinBox
+
+
+class TestValueSourceBindingBenchmark(ApplicationTestCase):
+    """Benchmark the bindings with simulated process variables updated at up to 1 kHz."""
+
+    _spinboxes = 100
+    _toggles = 20
+    _duration = 1.0
+
+    @timing_test
+    def test_latency_and_load(self) -> None:
+        """Test that the bindings keep up with the updates with a low GUI thread load."""
+        server = SimulatedPVServer(disconnect_rate=0.2, disconnect_duration=0.1, seed=0)
+        bindings = []
+        for index in range(self._spinboxes):
+            pv = server.add_pv(
+                f"motor:{index}.RBV",
+                rate=1000 if index % 2 else 100,
+                noise=0.01,
+                waveform=lambda elapsed, index=index: 50 * math.sin(elapsed + index),
+            )
+            spinbox = NumericSpinBox(-100, 100, 0, 1, 3)
+            bindings.append(NumericSpinBoxBinding(spinbox, pv))
+        for index in range(self._toggles):
+            pv = server.add_pv(
+                f"shutter:{index}",
+                rate=20,
+                waveform=lambda elapsed, index=index: int(elapsed * 10 + index) % 2,
+            )
+            bindings.append(ToggleCheckBoxBinding(ToggleCheckBox(), pv))
+            bindings.append(StatusLabelBinding(StatusLabel(), pv))
+
+        with server:
+            start = time.perf_counter()
+            QTest.qWait(int(self._duration * 1000))
+            elapsed = time.perf_counter() - start
+
+        published = sum(pv.updates for pv in server.pvs)
+        applied = sum(binding.applied_values for binding in bindings)
+        gui_time = sum(binding.gui_time for binding in bindings)
+        latencies = [binding.latency_statistics() for binding in bindings[:10]]
+        median = sorted(statistics["median"] for statistics in latencies)[5]
+        # The updates are coalesced to at most one per frame and binding
+        self.assertLess(applied, published / 2)
+        self.assertLess(gui_time / elapsed, 0.5)
+        self.assertLess(median, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
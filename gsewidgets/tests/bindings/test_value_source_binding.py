@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_value_source_binding.py
+# Description: Test the ValueSourceBinding.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication, QLabel
+
+from gsewidgets.models.sources import ValueSource
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.bindings import ValueSourceBinding, StatusLabelBinding
+from gsewidgets.widgets.labels import StatusLabel
+from gsewidgets.widgets.spinboxes import LiveValueUpdater
+
+
+class TestValueSourceBinding(ApplicationTestCase):
+    """Test the ValueSourceBinding with a plain value source."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._source = ValueSource("test")
+        self._source._set_connected(True)
+
+    def test_apply_value(self) -> None:
+        """Test that a binding shows the values with the given callable."""
+        label = QLabel()
+        binding = ValueSourceBinding(
+            label, self._source, apply_value=lambda value: label.setText(str(value))
+        )
+        self._source._publish(1.5)
+        self._source._publish(2.5)
+        LiveValueUpdater.instance()._apply_pending_values()
+        self.assertEqual(label.text(), "2.5")
+        self.assertEqual(binding.applied_values, 1)
+
+    def test_subclass(self) -> None:
+        """Test that a subclass shows the values with its _apply_value method."""
+        label = StatusLabel()
+        StatusLabelBinding(label, self._source)
+        self._source._publish(True)
+        LiveValueUpdater.instance()._apply_pending_values()
+        self.assertTrue(label.status)
+
+    def test_initial_false(self) -> None:
+        """Test that a status label shows a first value of False."""
+        self._source._publish(False)
+        label = StatusLabel()
+        StatusLabelBinding(label, self._source)
+        LiveValueUpdater.instance()._apply_pending_values()
+        self.assertFalse(label.status)
+        self.assertEqual(label.text(), "Off")
+
+    def test_deleted_widget(self) -> None:
+        """Test that deleting the widget removes the callbacks of the binding from the source."""
+        label = QLabel()
+        ValueSourceBinding(label, self._source, apply_value=label.setText)
+        label.deleteLater()
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        self.assertEqual(self._source._value_callbacks, [])
+        self.assertEqual(self._source._connection_callbacks, [])
+
+    def test_missing_apply_value(self) -> None:
+        """Test that a binding can't be created without a way to show the values."""
+        with self.assertRaises(TypeError):
+            ValueSourceBinding(QLabel(), self._source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_checkbox_bank.py
+# Description: Test the CheckBoxBank.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.checkboxes import CheckBoxBank
+
+
+class TestCheckBoxBank(ApplicationTestCase):
+    """Test the bitmask of the CheckBoxBank."""
+
+    def test_mask(self) -> None:
+        """Test updating all the checkboxes from one 64 bit mask."""
+        bank = CheckBoxBank(64)
+        emitted = []
+        bank.mask_changed.connect(emitted.append)
+        bank.set_mask(1 << 63 | 0b101)
+        self.assertEqual(
+            [index for index, box in enumerate(bank.checkboxes) if box.isChecked()],
+            [0, 2, 63],
+        )
+        bank.checkboxes[1].setChecked(True)
+        self.assertEqual(emitted, [1 << 63 | 0b101, 1 << 63 | 0b111])
+        with self.assertRaises(ValueError):
+            bank.set_mask(1 << 64)
+
+    def test_exclusive(self) -> None:
+        """Test that at most one checkbox is checked in exclusive mode."""
+        bank = CheckBoxBank(8, exclusive=True, toggles=False)
+        bank.set_bit(3, True)
+        bank.checkboxes[5].setChecked(True)
+        self.assertEqual(bank.mask, 1 << 5)
+        self.assertFalse(bank.checkboxes[3].isChecked())
+        with self.assertRaises(ValueError):
+            bank.set_mask(0b11)
+
+
+if __name__ == "__main__":
+    unittest.main()
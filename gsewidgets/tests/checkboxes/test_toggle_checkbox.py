@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_toggle_checkbox.py
+# Description: Test the rendering of the ToggleCheckBox.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+from qtpy.QtCore import QSize
+from qtpy.QtGui import QColor
+from qtpy.QtTest import QTest
+from qtpy.QtWidgets import QWidget
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets import checkboxes
+from gsewidgets.widgets.checkboxes import ToggleCheckBox, ToggleAnimationDriver
+
+
+class TestToggleCheckBox(ApplicationTestCase):
+    """Test the ToggleCheckBox."""
+
+    def test_shared_images(self) -> None:
+        """Test that the toggles with the same style share the rendered images."""
+        toggles = [ToggleCheckBox(size=QSize(58, 45)) for _ in range(20)]
+        toggles[0].grab()
+        cached = checkboxes._bar_image.cache_info().currsize
+        for toggle in toggles[1:]:
+            toggle.grab()
+        self.assertEqual(checkboxes._bar_image.cache_info().currsize, cached)
+
+        # Another color is rendered separately
+        ToggleCheckBox(inactive_color=QColor(10, 20, 30), size=QSize(58, 45)).grab()
+        self.assertEqual(checkboxes._bar_image.cache_info().currsize, cached + 1)
+
+    def test_shared_animation_driver(self) -> None:
+        """Test that all the running knobs are advanced by the shared driver."""
+        driver = ToggleAnimationDriver.instance()
+        driver.set_duration(50)
+        toggles = [ToggleCheckBox() for _ in range(10)]
+        for toggle in toggles:
+            toggle.setChecked(True)
+        self.assertEqual(driver.active_animations, 10)
+        QTest.qWait(150)
+        self.assertEqual(driver.active_animations, 0)
+        self.assertEqual([toggle.circle_position for toggle in toggles], [1] * 10)
+        driver.set_duration(350)
+
+    def test_deleted_toggle(self) -> None:
+        """Test that a toggle deleted by Qt during its animation is dropped by the driver."""
+        driver = ToggleAnimationDriver.instance()
+        parent = QWidget()
+        toggle = ToggleCheckBox()
+        toggle.setParent(parent)
+        toggle.setChecked(True)
+        parent.deleteLater()
+        QTest.qWait(50)
+        self.assertEqual(driver.active_animations, 0)
+
+    def test_suspended_animations(self) -> None:
+        """Test that the knobs jump while the animations are suspended."""
+        driver = ToggleAnimationDriver.instance()
+        toggle = ToggleCheckBox()
+        with driver.suspended():
+            toggle.setChecked(True)
+        self.assertEqual(toggle.circle_position, 1)
+        self.assertEqual(driver.active_animations, 0)
+
+    def test_instant_state(self) -> None:
+        """Test the instant state changes, with and without signals."""
+        driver = ToggleAnimationDriver.instance()
+        toggle = ToggleCheckBox()
+        emitted = []
+        toggle.toggled.connect(emitted.append)
+        toggle.set_state(True, silent=True)
+        self.assertEqual(emitted, [])
+        self.assertEqual(toggle.circle_position, 1)
+        toggle.set_state(False)
+        self.assertEqual(emitted, [False])
+        self.assertEqual(toggle.circle_position, 0)
+        self.assertEqual(driver.active_animations, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_file_path_input_box.py
+# Description: Test the directory checks of the FilePathInputBox.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import tempfile
+import unittest
+from pathlib import Path
+from qtpy.QtCore import QEvent, Qt
+from qtpy.QtGui import QFocusEvent
+from qtpy.QtTest import QTest
+from qtpy.QtWidgets import QApplication
+from typing import Optional
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.inputboxes import (
+    FilePathInputBox,
+    PATH_PENDING,
+    PATH_OK,
+    PATH_ERROR,
+)
+
+
+class TestFilePathInputBox(ApplicationTestCase):
+    """Test that the FilePathInputBox checks its directory on a worker thread."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._directory = tempfile.TemporaryDirectory()
+        self._root = Path(self._directory.name)
+        self._input_box = FilePathInputBox()
+        self._states = []
+        self._input_box.path_state_changed.connect(self._states.append)
+
+    def tearDown(self) -> None:
+        """Tear down the test."""
+        self._directory.cleanup()
+
+    def _focus_out(self, text: str) -> None:
+        """Sets the text and sends a focus out event to the input box."""
+        self._input_box.setText(text)
+        QApplication.sendEvent(
+            self._input_box,
+            QFocusEvent(QEvent.Type.FocusOut, Qt.FocusReason.OtherFocusReason),
+        )
+
+    def _wait_for_state(self, state: str, timeout: Optional[int] = 2000) -> bool:
+        """Processes events until the input box reaches a state or the timeout expires."""
+        for _ in range(timeout // 10):
+            if self._input_box.path_state == state:
+                return True
+            QTest.qWait(10)
+        return self._input_box.path_state == state
+
+    def test_create_directory(self) -> None:
+        """Test creating a missing directory."""
+        directory = self._root / "data" / "run"
+        self._focus_out(str(directory))
+        self.assertEqual(self._input_box.text(), f"{directory.as_posix()}/")
+        self.assertTrue(self._wait_for_state(PATH_OK))
+        self.assertTrue(directory.is_dir())
+        self.assertEqual(self._states, [PATH_PENDING, PATH_OK])
+        self.assertEqual(self._input_box.property("path_state"), PATH_OK)
+
+    def test_error(self) -> None:
+        """Test the error state when the directory can't be created."""
+        blocking_file = self._root / "file"
+        blocking_file.touch()
+        self._focus_out(str(blocking_file / "run"))
+        self.assertTrue(self._wait_for_state(PATH_ERROR))
+        self.assertIsNotNone(self._input_box.path_error)
+        self.assertEqual(self._input_box.toolTip(), self._input_box.path_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_shared_event_filters.py
+# Description: Test the event filters shared by the input boxes.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+from qtpy.QtCore import QEvent, Qt
+from qtpy.QtGui import QFocusEvent
+from qtpy.QtWidgets import QApplication
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.filters import FileNameEventFilter
+from gsewidgets.widgets.inputboxes import FileNameInputBox, IPv4InputBox
+
+
+class TestSharedEventFilters(ApplicationTestCase):
+    """Test that the input boxes share their event filters."""
+
+    def test_shared_filters(self) -> None:
+        """Test one filter per class and configuration."""
+        boxes = [FileNameInputBox() for _ in range(10)]
+        self.assertEqual(len({id(box._file_name_filter) for box in boxes}), 1)
+        other = FileNameInputBox(invalid_characters="#")
+        self.assertIsNot(other._file_name_filter, boxes[0]._file_name_filter)
+        self.assertIs(FileNameEventFilter.shared("#"), other._file_name_filter)
+        self.assertIs(IPv4InputBox()._ipv4_filter, IPv4InputBox()._ipv4_filter)
+
+    def test_focus_out(self) -> None:
+        """Test that a shared filter changes only the widget that lost the focus."""
+        first, second = FileNameInputBox(), FileNameInputBox()
+        first.setText("run #1")
+        second.setText("run #2")
+        QApplication.sendEvent(
+            first, QFocusEvent(QEvent.Type.FocusOut, Qt.FocusReason.OtherFocusReason)
+        )
+        self.assertEqual(first.text(), "run__1")
+        self.assertEqual(second.text(), "run #2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_collection_points_journal.py
+# Description: Test the CollectionPointsJournal.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import tempfile
+import unittest
+import numpy as np
+from pathlib import Path
+
+from gsewidgets.models.collection_points import CollectionPointsModel
+from gsewidgets.models.journal import CollectionPointsJournal
+
+
+class TestCollectionPointsJournal(unittest.TestCase):
+    """Test the CollectionPointsJournal, without a QApplication."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = Path(self._directory.name) / "points.journal"
+        self._model = CollectionPointsModel(
+            min_values=(-10, -10, -10), max_values=(10, 10, 10)
+        )
+
+    def tearDown(self) -> None:
+        """Tear down the test."""
+        self._directory.cleanup()
+
+    def _edit_model(self) -> None:
+        """Runs a sequence of edits on the model."""
+        self._model.add_points(np.arange(15, dtype=float).reshape(5, 3) - 7)
+        self._model.set_position(1, 2, 3.5)
+        self._model.set_enabled([0, 4], False)
+        self._model.rename_point(2, "crystal")
+        self._model.set_group([2, 3], 7)
+        self._model.remove_point(0)
+        self._model.add_point(1, 1, 1, enabled=False)
+
+    def _assert_models_equal(self, model: CollectionPointsModel) -> None:
+        """Checks that a model has the same points as the edited model."""
+        self.assertEqual(model.names, self._model.names)
+        np.testing.assert_array_equal(model.positions, self._model.positions)
+        np.testing.assert_array_equal(model.max_values, self._model.max_values)
+        np.testing.assert_array_equal(model.enabled, self._model.enabled)
+        np.testing.assert_array_equal(model.groups, self._model.groups)
+
+    def test_replay(self) -> None:
+        """Test replaying the journal records."""
+        journal = CollectionPointsJournal(self._model, self._path)
+        self._edit_model()
+        journal.close()
+
+        model = CollectionPointsModel()
+        self.assertEqual(CollectionPointsJournal.replay(self._path, model), 8)
+        self._assert_models_equal(model)
+
+    def test_reopen(self) -> None:
+        """Test restoring the points when a journal is opened again."""
+        journal = CollectionPointsJournal(self._model, self._path)
+        self._edit_model()
+        journal.flush()
+
+        # Simulate a crash that leaves half of a record at the end of the journal
+        with open(self._path, "ab") as file:
+            file.write(b"\x03\x01\x00")
+
+        model = CollectionPointsModel()
+        restored_journal = CollectionPointsJournal(model, self._path)
+        restored_journal.close()
+        journal.close()
+        self._assert_models_equal(model)
+
+    def test_compaction(self) -> None:
+        """Test compacting the journal into a snapshot."""
+        journal = CollectionPointsJournal(self._model, self._path, compaction_records=3)
+        self._edit_model()
+        self._model.sort_points(axis=0)
+        journal.close()
+
+        # The reordered points replace all the records with a snapshot
+        model = CollectionPointsModel()
+        self.assertEqual(CollectionPointsJournal.replay(self._path, model), 1)
+        self._assert_models_equal(model)
+
+    def test_reset_compaction(self) -> None:
+        """Test that clearing the points leaves only a snapshot and the later records."""
+        journal = CollectionPointsJournal(self._model, self._path)
+        self._edit_model()
+        self._model.clear()
+        self._model.add_point(2, 2, 2)
+        journal.close()
+
+        # The snapshot of the cleared points and the added point
+        model = CollectionPointsModel()
+        self.assertEqual(CollectionPointsJournal.replay(self._path, model), 2)
+        self._assert_models_equal(model)
+
+
+if __name__ == "__main__":
+    unittest.main()
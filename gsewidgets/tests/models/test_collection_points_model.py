@@ -0,0 +1,152 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_collection_points_model.py
+# Description: Test the CollectionPointsModel.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import unittest
+import numpy as np
+
+from gsewidgets.models.collection_points import (
+    CollectionPointsModel,
+    POINTS_INSERTED,
+    POINTS_REMOVED,
+    POSITIONS_CHANGED,
+    ENABLED_CHANGED,
+)
+
+
+class TestCollectionPointsModel(unittest.TestCase):
+    """Test the CollectionPointsModel, without a QApplication."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._model = CollectionPointsModel(
+            min_values=(-10, -10, -10), max_values=(10, 10, 10)
+        )
+
+    def test_point_names(self) -> None:
+        """Test the automatically created point names."""
+        self._model.add_point(1, 2, 3)
+        self._model.add_point(4, 5, 6)
+        self.assertEqual(self._model.names, ["point_1", "point_2"])
+
+    def test_names_skip_existing(self) -> None:
+        """Test that the created names skip the names that already exist."""
+        self._model.add_point(0, 0, 0, name="point_2")
+        self._model.add_points(np.zeros((2, 3)))
+        self.assertEqual(self._model.names, ["point_2", "point_1", "point_3"])
+
+    def test_names_after_removal(self) -> None:
+        """Test that the name counter is not reset when points are removed."""
+        self._model.add_points(np.zeros((3, 3)))
+        self._model.remove_point(2)
+        self._model.clear()
+        self._model.add_point(0, 0, 0)
+        self.assertEqual(self._model.names, ["point_3"])
+
+    def test_bulk_add_and_remove(self) -> None:
+        """Test adding and removing large numbers of points."""
+        positions = np.random.default_rng(0).uniform(-10, 10, (100_000, 3))
+        self._model.add_points(positions)
+        self._model.remove_points(np.arange(0, 100_000, 2))
+        self.assertEqual(len(self._model), 50_000)
+        np.testing.assert_array_equal(self._model.positions, positions[1::2])
+        self.assertEqual(self._model.point_name(0), "point_2")
+
+    def test_enabled_mask(self) -> None:
+        """Test the enabled mask of the points."""
+        self._model.add_points(np.zeros((4, 3)))
+        self._model.set_enabled([1, 3], False)
+        np.testing.assert_array_equal(self._model.enabled_indices, [0, 2])
+        self._model.set_all_enabled(True)
+        self.assertTrue(self._model.enabled.all())
+
+    def test_validate(self) -> None:
+        """Test the validation of the point limits."""
+        self._model.add_points([(0, 0, 0), (11, 0, 0)])
+        np.testing.assert_array_equal(self._model.out_of_bounds(), [False, True])
+        with self.assertRaises(ValueError):
+            self._model.validate()
+
+    def test_ordering(self) -> None:
+        """Test sorting and moving points."""
+        self._model.add_points([(3, 0, 0), (1, 0, 0), (2, 0, 0)])
+        self._model.sort_points(axis=0)
+        self.assertEqual(self._model.names, ["point_2", "point_3", "point_1"])
+        self._model.move_point(0, 2)
+        self.assertEqual(self._model.names, ["point_3", "point_1", "point_2"])
+        with self.assertRaises(ValueError):
+            self._model.reorder([0, 0, 1])
+
+    def test_group_operations(self) -> None:
+        """Test the group wide enable, translate and remove operations."""
+        notifications = []
+        self._model.add_points(np.zeros((2, 3)), groups=1)
+        self._model.add_points(np.ones((2, 3)), groups=2)
+        self._model.add_listener(
+            lambda notification, indices: notifications.append(notification)
+        )
+        self._model.set_group_enabled(2, False)
+        np.testing.assert_array_equal(self._model.enabled, [True, True, False, False])
+        self._model.translate_group(1, (1, 2, 3))
+        np.testing.assert_array_equal(self._model.positions[:2], [[1, 2, 3]] * 2)
+        with self.assertRaises(ValueError):
+            self._model.translate_group(1, (10, 0, 0))
+        self._model.remove_group(2)
+        self.assertEqual(len(self._model), 2)
+        np.testing.assert_array_equal(self._model.group_labels, [1])
+        self.assertEqual(
+            notifications, [ENABLED_CHANGED, POSITIONS_CHANGED, POINTS_REMOVED]
+        )
+
+    def test_read_only_views(self) -> None:
+        """Test that the returned arrays can't be used to change the model."""
+        self._model.add_point(0, 0, 0)
+        with self.assertRaises(ValueError):
+            self._model.positions[0, 0] = 1
+
+    def test_listeners(self) -> None:
+        """Test the notifications sent to the listeners."""
+        notifications = []
+        self._model.add_listener(
+            lambda notification, indices: notifications.append(
+                (notification, indices.tolist())
+            )
+        )
+        self._model.add_points(np.zeros((2, 3)))
+        self._model.set_enabled(1, False)
+        self._model.set_enabled(1, False)
+        self._model.remove_point(0)
+        self.assertEqual(
+            notifications,
+            [
+                (POINTS_INSERTED, [0, 1]),
+                (ENABLED_CHANGED, [1]),
+                (POINTS_REMOVED, [0]),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_filesystem_cache.py
+# Description: Test the FileSystemCache and the DirectoryCreator.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from gsewidgets.models.filesystem import FileSystemCache, DirectoryCreator
+
+
+class TestFileSystemCache(unittest.TestCase):
+    """Test the FileSystemCache and the DirectoryCreator, without a QApplication."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._directory = tempfile.TemporaryDirectory()
+        self._root = Path(self._directory.name)
+        self._cache = FileSystemCache(ttl=60)
+
+    def tearDown(self) -> None:
+        """Tear down the test."""
+        self._directory.cleanup()
+
+    def test_hits_and_misses(self) -> None:
+        """Test that repeated lookups of the same path are served from the cache."""
+        for _ in range(5):
+            info = self._cache.info(f"{self._root}/")
+        self.assertTrue(info.is_dir and info.writable)
+        self.assertEqual((self._cache.hits, self._cache.misses), (4, 1))
+
+        # Changes made outside the application are only seen after invalidation
+        missing = self._root / "missing"
+        self.assertFalse(self._cache.info(missing).exists)
+        missing.mkdir()
+        self.assertFalse(self._cache.info(missing).exists)
+        self._cache.invalidate(self._root)
+        self.assertTrue(self._cache.info(missing).is_dir)
+        self.assertEqual(self._cache.misses, 3)
+
+    def test_expiry(self) -> None:
+        """Test that the entries expire after the ttl."""
+        cache = FileSystemCache(ttl=0.01)
+        cache.info(self._root)
+        time.sleep(0.02)
+        self.assertIsNone(cache.cached(self._root))
+        self.assertEqual(len(cache), 0)
+
+    def test_directory_creator(self) -> None:
+        """Test creating directories and reusing the cached result."""
+        creator = DirectoryCreator(cache=self._cache)
+        directory = self._root / "data" / "run"
+        results = []
+        creator.ensure(directory, lambda *result: results.append(result)).result(5)
+        self.assertTrue(directory.is_dir())
+        creator.ensure(directory, lambda *result: results.append(result)).result(5)
+        self.assertEqual(results, [(str(directory), None)] * 2)
+        self.assertEqual(self._cache.hits, 1)
+
+        (self._root / "file").touch()
+        with self.assertRaises(NotADirectoryError):
+            creator.ensure(self._root / "file").result(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_data_array_model.py
+# Description: Test the NumericDataArrayModel.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import gc
+import unittest
+import weakref
+import numpy as np
+
+from gsewidgets.models.numeric import (
+    NumericDataArrayModel,
+    VALUES_CHANGED,
+    LIMITS_CHANGED,
+)
+
+
+class TestNumericDataArrayModel(unittest.TestCase):
+    """Test the NumericDataArrayModel, without a QApplication."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._model = NumericDataArrayModel(
+            min_values=-100,
+            max_values=100,
+            current_values=np.zeros(5),
+            incremental_steps=1,
+            precisions=2,
+        )
+        self._notifications = []
+        self._model.add_listener(
+            lambda notification, indices: self._notifications.append(
+                (notification, indices.tolist())
+            )
+        )
+
+    def test_update_values(self) -> None:
+        """Test that a batch update notifies once with only the changed indices."""
+        changed = self._model.update_values([0, 1, 2, 3], [0, 5, 0, -5])
+        np.testing.assert_array_equal(changed, [1, 3])
+        np.testing.assert_array_equal(self._model.current_values, [0, 5, 0, -5, 0])
+        self._model.update_values([1, 3], [5, -5])
+        self.assertEqual(self._notifications, [(VALUES_CHANGED, [1, 3])])
+
+    def test_update_min_max(self) -> None:
+        """Test updating the limits of some entries."""
+        self._model.update_min_max([0, 4], [-10, -100], [10, 100])
+        self.assertEqual(self._notifications, [(LIMITS_CHANGED, [0])])
+        self.assertEqual(self._model.data_model(0).max_value, 10)
+
+    def test_clamped_values(self) -> None:
+        """Test that new limits clamp the current values, with a values notification."""
+        self._model.update_values([0, 1], [50, 5])
+        self._model.update_min_max([0, 1], 0, 10)
+        np.testing.assert_array_equal(self._model.current_values[:2], [10, 5])
+        self.assertEqual(
+            self._notifications[1:], [(LIMITS_CHANGED, [0, 1]), (VALUES_CHANGED, [0])]
+        )
+
+    def test_read_only_views(self) -> None:
+        """Test that the returned arrays can't be used to change the model."""
+        with self.assertRaises(ValueError):
+            self._model.current_values[0] = 1
+
+    def test_dropped_listener(self) -> None:
+        """Test that the model doesn't keep the owner of a bound method listener alive."""
+
+        class Owner:
+            def changed(self, notification: str, indices: np.ndarray) -> None:
+                pass
+
+        owner = Owner()
+        self._model.add_listener(owner.changed)
+        reference = weakref.ref(owner)
+        del owner
+        gc.collect()
+        self.assertIsNone(reference())
+        self._model.update_values(0, 1)
+        self.assertEqual(len(self._model._listeners), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
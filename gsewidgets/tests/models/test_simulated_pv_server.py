@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_simulated_pv_server.py
+# Description: Test the simulated process variable server.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import time
+import unittest
+
+from gsewidgets.models.sources import SimulatedPVServer
+
+
+class TestSimulatedPVServer(unittest.TestCase):
+    """Test the SimulatedPVServer, without a QApplication."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._server = SimulatedPVServer(seed=0)
+        self._values = []
+        self._connection = []
+
+    def tearDown(self) -> None:
+        """Tear down the test."""
+        self._server.stop()
+
+    def test_update_rate_and_noise(self) -> None:
+        """Test that the values are published at the rate of the variable."""
+        pv = self._server.add_pv("motor:x.RBV", value=5.0, rate=200, noise=0.1)
+        pv.subscribe(lambda value, timestamp: self._values.append(value))
+        with self._server:
+            time.sleep(0.25)
+        self.assertGreater(len(self._values), 25)
+        self.assertLess(len(self._values), 60)
+        self.assertGreater(len(set(self._values)), 1)
+        self.assertAlmostEqual(sum(self._values) / len(self._values), 5.0, delta=0.1)
+
+    def test_put(self) -> None:
+        """Test that writing a value publishes the new setpoint."""
+        pv = self._server.add_pv("shutter", value=False, rate=1)
+        pv.subscribe(lambda value, timestamp: self._values.append(value))
+        pv.put(True)
+        self.assertEqual(self._values, [True])
+        self.assertTrue(pv.value)
+
+    def test_disconnect(self) -> None:
+        """Test the manual and the timed disconnects."""
+        pv = self._server.add_pv("motor:y.RBV", rate=500)
+        pv.add_connection_callback(self._connection.append)
+        self._server.disconnect("motor:y.RBV", duration=0.05)
+        self.assertFalse(pv.connected)
+        with self._server:
+            time.sleep(0.2)
+        self.assertTrue(pv.connected)
+        self.assertEqual(self._connection, [False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_collection_points_overview.py
+# Description: Test the CollectionPointsOverview.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+import numpy as np
+from unittest import mock
+from qtpy.QtCore import QSize
+
+from gsewidgets.models.collection_points import CollectionPointsModel
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.overviews import CollectionPointsOverview
+from gsewidgets.widgets.tables import XYZCollectionPointsTable
+
+
+class TestCollectionPointsOverview(ApplicationTestCase):
+    """Test the projections, the level of detail and the selection of the overview."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._model = CollectionPointsModel()
+        self._model.add_point(1, 2, 3)
+
+    def test_projections(self) -> None:
+        """Test the projection of the points on the planes and in the rotated 3d view."""
+        overview = CollectionPointsOverview(model=self._model)
+        for projection, expected in (("xy", [1, 2]), ("xz", [1, 3]), ("yz", [2, 3])):
+            overview.set_projection(projection)
+            np.testing.assert_allclose(overview._projected_points(), [expected])
+
+        overview.set_projection("3d")
+        for yaw, pitch, expected in ((0, 0, [1, 3]), (90, 0, [-2, 3]), (0, 90, [1, 2])):
+            overview.set_rotation(yaw, pitch)
+            np.testing.assert_allclose(
+                overview._projected_points(), [expected], atol=1e-12
+            )
+
+    def test_level_of_detail(self) -> None:
+        """Test that the markers are replaced by a density image above the threshold."""
+        overview = CollectionPointsOverview(
+            model=self._model, size=QSize(200, 150), lod_threshold=10
+        )
+        with mock.patch.object(
+            overview, "_paint_markers", wraps=overview._paint_markers
+        ) as paint_markers, mock.patch.object(
+            overview, "_paint_aggregated", wraps=overview._paint_aggregated
+        ) as paint_aggregated:
+            overview.grab()
+            self.assertEqual(
+                (paint_markers.call_count, paint_aggregated.call_count), (1, 0)
+            )
+
+            self._model.add_points(np.random.default_rng(0).uniform(-5, 5, (20, 3)))
+            overview.grab()
+            self.assertEqual(
+                (paint_markers.call_count, paint_aggregated.call_count), (1, 1)
+            )
+
+    def test_table_selection(self) -> None:
+        """Test that the selection follows the table and is sent to the table."""
+        self._model.add_points([[4, 5, 6], [7, 8, 9]])
+        table = XYZCollectionPointsTable(points_model=self._model)
+        overview = CollectionPointsOverview(table=table)
+        table.selectRow(1)
+        self.assertEqual(overview.selected_index, 1)
+        overview.select_point(2)
+        self.assertEqual(table.currentRow(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
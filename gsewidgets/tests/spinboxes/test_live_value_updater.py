@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_live_value_updater.py
+# Description: Test the live updates of the numeric spinboxes.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import threading
+import unittest
+from qtpy.QtCore import QEvent
+from qtpy.QtTest import QTest
+from qtpy.QtWidgets import QApplication
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.models.numeric import NumericDataModel
+from gsewidgets.widgets.spinboxes import NumericSpinBox, LiveValueUpdater
+
+
+class TestLiveValueUpdater(ApplicationTestCase):
+    """Test the LiveValueUpdater."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._data = NumericDataModel(-1000, 1000, 0, 1, 1)
+        self._spinbox = NumericSpinBox.from_data_model(self._data, bind=True)
+        self._spinbox.enable_live_updates()
+
+    def tearDown(self) -> None:
+        """Tear down the test."""
+        self._spinbox.disable_live_updates()
+
+    def test_latest_value_from_threads(self) -> None:
+        """Test that only the latest value posted from other threads is applied."""
+        updater = LiveValueUpdater.instance()
+        applied_values = updater.applied_values
+        values = []
+        self._spinbox.valueChanged.connect(values.append)
+
+        def post_values() -> None:
+            for value in range(1000):
+                self._spinbox.post_live_value(value / 10)
+
+        thread = threading.Thread(target=post_values)
+        thread.start()
+        thread.join()
+        QTest.qWait(100)
+
+        self.assertEqual(self._spinbox.value(), 99.9)
+        self.assertEqual(values, [99.9])
+        self.assertEqual(updater.applied_values - applied_values, 1)
+        # Live values are not written back to the bound model
+        self.assertEqual(self._data.current_value, 0)
+
+    def test_timer(self) -> None:
+        """Test that the timer only runs while values are pending."""
+        updater = LiveValueUpdater.instance()
+        QTest.qWait(50)
+        self.assertFalse(updater._timer.isActive())
+
+        thread = threading.Thread(target=self._spinbox.post_live_value, args=(12.5,))
+        thread.start()
+        thread.join()
+        for _ in range(20):
+            if self._spinbox.value() == 12.5:
+                break
+            QTest.qWait(10)
+        self.assertEqual(self._spinbox.value(), 12.5)
+        QTest.qWait(50)
+        self.assertFalse(updater._timer.isActive())
+
+    def test_unregistered_target(self) -> None:
+        """Test that values of spinboxes without live updates are rejected."""
+        spinbox = NumericSpinBox(-10, 10, 0, 1, 1)
+        with self.assertRaises(RuntimeError):
+            spinbox.post_live_value(1)
+        with self.assertRaises(ValueError):
+            LiveValueUpdater.instance().post(spinbox, 1)
+        self._spinbox.disable_live_updates()
+        with self.assertRaises(RuntimeError):
+            self._spinbox.post_live_value(1)
+
+    def test_deleted_target(self) -> None:
+        """Test that a deleted spinbox is removed with its pending value."""
+        updater = LiveValueUpdater.instance()
+        spinbox = NumericSpinBox(-10, 10, 0, 1, 1)
+        spinbox.enable_live_updates()
+        spinbox.post_live_value(1)
+        key = id(spinbox)
+        spinbox.deleteLater()
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        self.assertNotIn(key, updater._targets)
+        self.assertNotIn(key, updater._pending)
+
+    def test_instance_thread(self) -> None:
+        """Test that the shared updater can't be created outside of the GUI thread."""
+        instance = LiveValueUpdater._instance
+        LiveValueUpdater._instance = None
+        errors = []
+
+        def create_instance() -> None:
+            try:
+                LiveValueUpdater.instance()
+            except RuntimeError as error:
+                errors.append(error)
+
+        try:
+            thread = threading.Thread(target=create_instance)
+            thread.start()
+            thread.join()
+        finally:
+            LiveValueUpdater._instance = instance
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
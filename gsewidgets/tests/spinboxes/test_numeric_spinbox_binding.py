@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_spinbox_binding.py
+# Description: Test the binding of numeric spinboxes to data models.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import gc
+import unittest
+import weakref
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.models.numeric import NumericDataModel
+from gsewidgets.widgets.spinboxes import NumericSpinBox, NumericDataSpinBoxModel
+
+
+class TestNumericSpinBoxBinding(ApplicationTestCase):
+    """Test the two way binding between the numeric spinboxes and the data models."""
+
+    def test_spinbox_model_binding(self) -> None:
+        """Test the binding to a NumericDataSpinBoxModel."""
+        data = NumericDataSpinBoxModel(-10, 10, 0, 1, 1)
+        spinbox = NumericSpinBox.from_data_model(data, bind=True)
+        values = []
+        data.spinbox_value_changed.connect(values.append)
+
+        data.spinbox_min_max_changed.emit(-50, 50)
+        data.spinbox_precision_changed.emit(3)
+        data.spinbox_value_changed.emit(25.125)
+        self.assertEqual((spinbox.minimum(), spinbox.maximum()), (-50, 50))
+        self.assertEqual(spinbox.decimals(), 3)
+        self.assertEqual(spinbox.value(), 25.125)
+
+        # Values changed in the spinbox are emitted once
+        spinbox.setValue(-3)
+        self.assertEqual(data.current_value, -3)
+        self.assertEqual(values, [25.125, -3])
+
+        spinbox.unbind_data_model()
+        data.spinbox_value_changed.emit(1)
+        self.assertEqual(spinbox.value(), -3)
+
+    def test_data_model_binding(self) -> None:
+        """Test the binding to a NumericDataModel."""
+        data = NumericDataModel(-10, 10, 0, 1, 2)
+        spinbox = NumericSpinBox.from_data_model(data, bind=True)
+        data.update_min_max(0, 100)
+        data.update_value(55.5)
+        self.assertEqual(spinbox.maximum(), 100)
+        self.assertEqual(spinbox.value(), 55.5)
+        spinbox.setValue(7)
+        self.assertEqual(data.current_value, 7)
+
+    def test_rebinding(self) -> None:
+        """Test that rebinding moves the observer and a dropped spinbox is collected."""
+        data = NumericDataModel(-10, 10, 0, 1, 2)
+        other_data = NumericDataModel(-10, 10, 0, 1, 2)
+        spinbox = NumericSpinBox.from_data_model(data, bind=True)
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        receivers = spinbox.receivers(spinbox.destroyed)
+        spinbox.bind_data_model(other_data)
+        spinbox.bind_data_model(data)
+        spinbox.bind_data_model(other_data)
+        data.update_value(3)
+        self.assertEqual(spinbox.value(), 0)
+        other_data.update_value(4)
+        self.assertEqual(spinbox.value(), 4)
+        # The bindings don't add handlers of the deletion of the spinbox
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        self.assertEqual(spinbox.receivers(spinbox.destroyed), receivers)
+
+        reference = weakref.ref(spinbox)
+        del spinbox
+        gc.collect()
+        self.assertIsNone(reference())
+        other_data.update_value(5)
+        self.assertEqual(len(other_data._observers), 0)
+
+    def test_clamped_limits(self) -> None:
+        """Test that the spinbox and the models agree on a value clamped by new limits."""
+        data = NumericDataModel(-10, 10, 5, 1)
+        spinbox = NumericSpinBox.from_data_model(data, bind=True)
+        data.update_min_max(-10, 2)
+        self.assertEqual((spinbox.value(), data.current_value), (2, 2))
+
+        spinbox_data = NumericDataSpinBoxModel(-10, 10, 5, 1)
+        spinbox = NumericSpinBox.from_data_model(spinbox_data, bind=True)
+        spinbox_data.spinbox_min_max_changed.emit(-10, 2)
+        self.assertEqual((spinbox.value(), spinbox_data.current_value), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
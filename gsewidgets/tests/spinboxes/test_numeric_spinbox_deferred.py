@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_spinbox_deferred.py
+# Description: Test the deferred construction of the NumericSpinBox.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.spinboxes import NumericSpinBox, NumericSpinBoxValueError
+
+
+class TestNumericSpinBoxDeferred(ApplicationTestCase):
+    """Test applying all the values of the NumericSpinBox in one update."""
+
+    def test_all_errors(self) -> None:
+        """Test that all the invalid values are reported together."""
+        with self.assertRaises(NumericSpinBoxValueError) as context:
+            NumericSpinBox(0, 10, 20, 5, -1, deferred=True)
+        self.assertEqual(len(context.exception.errors), 3)
+
+    def test_precision_before_value(self) -> None:
+        """Test that the value is not rounded to the default precision."""
+        spinbox = NumericSpinBox(-50, 50, 12.345, 1, 3, deferred=True)
+        self.assertEqual(spinbox.value(), 12.345)
+        self.assertEqual(spinbox.text(), "12.345")
+
+    def test_set_values(self) -> None:
+        """Test that valueChanged is emitted once and invalid values change nothing."""
+        spinbox = NumericSpinBox(0, 10, 1, 1, 0)
+        emitted = []
+        spinbox.valueChanged.connect(emitted.append)
+        spinbox.set_values(100, 200, 150.5, 10, 1)
+        self.assertEqual(emitted, [150.5])
+        with self.assertRaises(ValueError):
+            spinbox.set_values(10, 0, 5, 1, 1)
+        self.assertEqual(spinbox.minimum(), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
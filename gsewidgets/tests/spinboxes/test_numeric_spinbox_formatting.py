@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_spinbox_formatting.py
+# Description: Test the cached formatting of the NumericSpinBox.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+from qtpy.QtCore import Qt
+from qtpy.QtTest import QTest
+from qtpy.QtWidgets import QDoubleSpinBox
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.spinboxes import NumericSpinBox, UnitNumericSpinBox
+
+
+class TestNumericSpinBoxFormatting(ApplicationTestCase):
+    """Test that the cached formatting has the same results as Qt."""
+
+    _values = [0.0, -0.0, 0.0625, -0.0625, 2.5e-4, -2.5e-4, 12.3455, 999.9995, -1000.0]
+
+    def _reference(self, precision: int) -> QDoubleSpinBox:
+        """Returns a plain QDoubleSpinBox with the same range and precision."""
+        reference = QDoubleSpinBox()
+        reference.setRange(-1000, 1000)
+        reference.setDecimals(precision)
+        return reference
+
+    def test_text_from_value(self) -> None:
+        """Test the text of the values for a few precisions."""
+        for precision in (0, 1, 3, 6):
+            spinbox = NumericSpinBox(-1000, 1000, 0, 1, precision)
+            reference = self._reference(precision)
+            for value in self._values + [value / 7 for value in range(-700, 700)]:
+                self.assertEqual(
+                    spinbox.textFromValue(value), reference.textFromValue(value)
+                )
+
+    def test_value_from_text(self) -> None:
+        """Test the value of plain and locale texts."""
+        texts = ("0", "-0", "5", "5.", "5.0", ".5", "-.5", "12.3456", "2000", "1e3", "")
+        for precision in (0, 3):
+            spinbox = NumericSpinBox(-1000, 1000, 0, 1, precision)
+            reference = self._reference(precision)
+            for text in texts:
+                self.assertEqual(
+                    spinbox.valueFromText(text), reference.valueFromText(text)
+                )
+
+    def test_displayed_text(self) -> None:
+        """Test the text shown for set and typed values."""
+        spinbox = NumericSpinBox(-1000, 1000, 0, 1, 3)
+        spinbox.setValue(0.0625)
+        self.assertEqual(spinbox.text(), "0.063")
+        spinbox.lineEdit().selectAll()
+        QTest.keyClicks(spinbox, "-12.25")
+        QTest.keyClick(spinbox, Qt.Key.Key_Return)
+        self.assertEqual(spinbox.value(), -12.25)
+        self.assertEqual(spinbox.text(), "-12.250")
+
+    def test_suffix(self) -> None:
+        """Test that typed values are parsed without the unit suffix."""
+        spinbox = UnitNumericSpinBox(-10, 10, 1.234, 0.1, 3)
+        spinbox.lineEdit().selectAll()
+        QTest.keyClicks(spinbox, "2.5 mm")
+        QTest.keyClick(spinbox, Qt.Key.Key_Return)
+        self.assertEqual(spinbox.value(), 2.5)
+        self.assertEqual(spinbox.text(), "2.500 mm")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_spinbox_group.py
+# Description: Test the NumericSpinBoxGroup.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import unittest
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.spinboxes import NumericSpinBox, NumericSpinBoxGroup
+
+
+class TestNumericSpinBoxGroup(ApplicationTestCase):
+    """Test the constraints of the NumericSpinBoxGroup."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._spinboxes = {
+            "start": NumericSpinBox(-100, 100, 0, 1, 2),
+            "stop": NumericSpinBox(-100, 100, 30, 1, 2),
+            "step": NumericSpinBox(0, 60, 5, 1, 2),
+        }
+        self._group = NumericSpinBoxGroup(self._spinboxes)
+        self._group.add_order_constraint("start", "stop")
+        self._group.add_step_constraint("step", "start", "stop")
+        self._emitted = []
+        self._group.values_changed.connect(self._emitted.append)
+
+    def test_independent_change(self) -> None:
+        """Test a change that doesn't break any constraint."""
+        self._spinboxes["stop"].setValue(60)
+        self.assertEqual(self._emitted, [{"stop": 60}])
+
+    def test_dependent_changes(self) -> None:
+        """Test that the dependent fields are updated in a single batch."""
+        self._spinboxes["start"].setValue(45)
+        self.assertEqual(self._group.values, {"start": 45, "stop": 45, "step": 0})
+        self.assertEqual(self._emitted, [{"start": 45, "stop": 45, "step": 0}])
+
+        self._group.set_values({"start": -30, "step": 50})
+        self.assertEqual(self._spinboxes["step"].value(), 25)
+        self.assertEqual(len(self._emitted), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_numeric_spinbox_stepping.py
+# Description: Test the step acceleration and the emission throttle of the NumericSpinBox.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import unittest
+from qtpy.QtCore import Qt
+from qtpy.QtTest import QTest
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.spinboxes import NumericSpinBox
+
+
+class TestNumericSpinBoxStepping(ApplicationTestCase):
+    """Test the step acceleration and the emission throttle of the NumericSpinBox."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._spinbox = NumericSpinBox(-1000, 1000, 0, 0.1, 1)
+        self._emitted = []
+        self._spinbox.throttled_value_changed.connect(self._emitted.append)
+
+    def test_step_acceleration(self) -> None:
+        """Test that held steps grow up to the max multiplier."""
+        self._spinbox.set_step_acceleration(steps_per_doubling=4, max_multiplier=4)
+        for _ in range(12):
+            self._spinbox.stepBy(1)
+        # 4 steps of 0.1, 4 steps of 0.2 and 4 steps of 0.4
+        self.assertAlmostEqual(self._spinbox.value(), 2.8)
+
+    def test_without_throttle(self) -> None:
+        """Test that every value is emitted without an emission rate."""
+        for value in range(5):
+            self._spinbox.setValue(value + 1)
+        self.assertEqual(self._emitted, [1, 2, 3, 4, 5])
+
+    def test_throttle(self) -> None:
+        """Test that the throttle emits the first and the final value."""
+        self._spinbox.set_emission_rate(10)
+        for value in range(100):
+            self._spinbox.setValue(value / 10)
+        self.assertEqual(self._emitted, [0.1])
+        QTest.qWait(150)
+        self.assertEqual(self._emitted, [0.1, 9.9])
+
+    def test_final_value_on_release(self) -> None:
+        """Test that releasing a key emits the final value at once."""
+        self._spinbox.set_emission_rate(1)
+        self._spinbox.setValue(1)
+        self._spinbox.setValue(2)
+        QTest.keyRelease(self._spinbox, Qt.Key_Up)
+        self.assertEqual(self._emitted, [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
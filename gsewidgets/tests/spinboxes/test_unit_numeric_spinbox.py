@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_unit_numeric_spinbox.py
+# Description: Test the UnitNumericSpinBox.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import unittest
+from qtpy.QtWidgets import QWidget
+
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.models.numeric import NumericDataModel
+from gsewidgets.models.units import LENGTH_UNITS, ANGLE_UNITS
+from gsewidgets.widgets.spinboxes import UnitNumericSpinBox
+
+
+class TestUnitNumericSpinBox(ApplicationTestCase):
+    """Test the unit conversions of the UnitNumericSpinBox."""
+
+    def setUp(self) -> None:
+        """Set up the test."""
+        self._spinbox = UnitNumericSpinBox(-10, 10, 1.234, 0.1, 3)
+
+    def test_unit_switch(self) -> None:
+        """Test converting the range, step, precision and value."""
+        emitted = []
+        self._spinbox.valueChanged.connect(emitted.append)
+        self._spinbox.set_unit("µm")
+        self.assertEqual(self._spinbox.decimals(), 0)
+        self.assertEqual(self._spinbox.value(), 1234)
+        self.assertEqual(self._spinbox.maximum(), 10_000)
+        self.assertEqual(self._spinbox.singleStep(), 100)
+        self.assertEqual(self._spinbox.suffix(), " µm")
+        self.assertEqual(emitted, [])
+
+    def test_blocked_signals(self) -> None:
+        """Test that switching the unit keeps the signals blocked by the caller."""
+        emitted = []
+        self._spinbox.valueChanged.connect(emitted.append)
+        self._spinbox.blockSignals(True)
+        self._spinbox.set_unit("µm")
+        self.assertTrue(self._spinbox.signalsBlocked())
+        self._spinbox.setValue(2000)
+        self.assertEqual(emitted, [])
+
+    def test_no_drift(self) -> None:
+        """Test that switching back and forth keeps the canonical value."""
+        self._spinbox.set_canonical_value(1.2345)
+        for unit in ("m", "nm", "µm", "mm"):
+            self._spinbox.set_unit(unit)
+        self.assertEqual(self._spinbox.canonical_value, 1.2345)
+
+    def test_bound_data_model(self) -> None:
+        """Test that the bound data model keeps the canonical values."""
+        data = NumericDataModel(-10, 10, 2, 0.1, 3)
+        self._spinbox.bind_data_model(data)
+        self._spinbox.set_unit("µm")
+        self.assertEqual(self._spinbox.value(), 2000)
+        self._spinbox.setValue(2500)
+        self.assertEqual(data.current_value, 2.5)
+        data.update_value(-3)
+        self.assertEqual(self._spinbox.value(), -3000)
+
+    def test_panel_unit(self) -> None:
+        """Test switching all the spinboxes of a unit family inside a panel."""
+        panel = QWidget()
+        lengths = [UnitNumericSpinBox(0, 10, 1, 0.1, 3) for _ in range(3)]
+        angle = UnitNumericSpinBox(0, 90, 45, 1, 2, units=ANGLE_UNITS)
+        for spinbox in lengths + [angle]:
+            spinbox.setParent(panel)
+        self.assertEqual(UnitNumericSpinBox.set_panel_unit(panel, LENGTH_UNITS, "m"), 3)
+        self.assertEqual([spinbox.unit for spinbox in lengths], ["m"] * 3)
+        self.assertEqual(angle.unit, "deg")
+
+
+if __name__ == "__main__":
+    unittest.main()
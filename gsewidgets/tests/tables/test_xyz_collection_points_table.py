@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: test_xyz_collection_points_table.py
+# Description: Test the XYZCollectionPointsTable.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import gc
+import unittest
+import weakref
+
+from gsewidgets.models.collection_points import CollectionPointsModel
+from gsewidgets.models.numeric import NumericDataModel
+from gsewidgets.tests.application import ApplicationTestCase
+from gsewidgets.widgets.overviews import CollectionPointsOverview
+from gsewidgets.widgets.spinboxes import NumericDataSpinBoxModel
+from gsewidgets.widgets.tables import XYZCollectionPointsTable
+
+
+class TestXYZCollectionPointsTable(ApplicationTestCase):
+    """Test the XYZCollectionPointsTable views of a CollectionPointsModel."""
+
+    def test_dropped_views(self) -> None:
+        """Test that a model shared by several views doesn't keep the dropped views alive."""
+        model = CollectionPointsModel()
+        table = XYZCollectionPointsTable(points_model=model)
+        dropped_table = XYZCollectionPointsTable(points_model=model)
+        dropped_overview = CollectionPointsOverview(model=model)
+        references = [weakref.ref(dropped_table), weakref.ref(dropped_overview)]
+        del dropped_table, dropped_overview
+        gc.collect()
+
+        self.assertEqual([reference() for reference in references], [None, None])
+        model.add_point(1, 2, 3)
+        self.assertEqual(len(model._listeners), 1)
+        self.assertEqual(table.rowCount(), 1)
+
+    def test_group_updated(self) -> None:
+        """Test that group_updated is only emitted when the points of the group changed."""
+        model = CollectionPointsModel()
+        table = XYZCollectionPointsTable(points_model=model)
+        model.add_points([[0, 0, 0], [1, 1, 1]], groups=[1, 1])
+        emitted = []
+        table.group_updated.connect(emitted.append)
+
+        table.translate_group(1, 0, 0, 0)
+        table.translate_group(2, 1, 0, 0)
+        table.enable_group(1)
+        table.delete_group(2)
+        self.assertEqual(emitted, [])
+
+        table.translate_group(1, 0.5, 0, 0)
+        table.disable_group(1)
+        table.disable_group(1)
+        table.setCurrentCell(0, 0)
+        table.set_selection_group(2)
+        table.set_selection_group(2)
+        table.delete_group(2)
+        self.assertEqual(emitted, [1, 1, 2, 2])
+        self.assertEqual(model.positions.tolist(), [[1.5, 1, 1]])
+
+    def test_data_models(self) -> None:
+        """Test that the edits are sent to the data models the points were added with."""
+        table = XYZCollectionPointsTable()
+        x = NumericDataSpinBoxModel(-10, 10, 1, 1)
+        y = NumericDataModel(-10, 10, 2, 1)
+        z = NumericDataSpinBoxModel(-10, 10, 3, 1)
+        table.add_point(x, y, z)
+        table.points_model.add_point(0, 0, 0)
+
+        table.cellWidget(0, 1).setValue(5)
+        table.cellWidget(0, 2).setValue(6)
+        self.assertEqual((x.current_value, y.current_value), (5, 6))
+        self.assertEqual(table.points_model.positions[0].tolist(), [5, 6, 3])
+        self.assertIs(table.numeric_data_list[0][0], x)
+        self.assertEqual(table.numeric_data_list[1], [None, None, None])
+
+        # The rows keep sending the edits to their points after a row above is removed
+        table.points_model.add_point(0, 0, 0)
+        table.points_model.remove_point(1)
+        table.cellWidget(1, 1).setValue(4)
+        self.assertEqual(table.points_model.positions[1, 0], 4)
+        self.assertEqual(x.current_value, 5)
+
+    def test_data_model_limits(self) -> None:
+        """Test that new limits of a data model clamp only the points added from it."""
+        table = XYZCollectionPointsTable()
+        x = NumericDataModel(-10, 10, 5, 1)
+        other_x = NumericDataModel(-10, 10, 5, 1)
+        y = NumericDataSpinBoxModel(-10, 10, 5, 1)
+        table.add_point(x, y, y)
+        table.add_point(other_x, y, y)
+
+        x.update_min_max(-10, 2)
+        y.spinbox_min_max_changed.emit(-10, 3)
+        positions = table.points_model.positions
+        self.assertEqual(positions.tolist(), [[2, 3, 3], [5, 3, 3]])
+        self.assertEqual(table.cellWidget(0, 1).value(), 2)
+        self.assertEqual(table.points_model.max_values[1].tolist(), [10, 3, 3])
+        self.assertFalse(table.points_model.out_of_bounds().any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,269 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: bindings.py
+# Description: Bindings between value sources and widgets.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import time
+from collections import deque
+from functools import partial
+from qtpy.QtCore import QObject, Signal
+from qtpy.QtWidgets import QWidget
+from typing import Callable, Optional
+
+from gsewidgets.models.sources import ValueSource
+from gsewidgets.widgets.checkboxes import ToggleCheckBox
+from gsewidgets.widgets.labels import StatusLabel
+from gsewidgets.widgets.spinboxes import NumericSpinBox, LiveValueUpdater
+
+__all__ = [
+    "ValueSourceBinding",
+    "NumericSpinBoxBinding",
+    "ToggleCheckBoxBinding",
+    "StatusLabelBinding",
+]
+
+
+class ValueSourceBinding(QObject):
+    """
+    Binds a widget to a ValueSource. Values published from any thread are applied on the shared
+    LiveValueUpdater frame timer, the widget is disabled while the source is disconnected, and the
+    update latency and the time spent on the GUI thread are measured. The values are shown with
+    the apply_value callable, or the _apply_value method of a subclass. Writable widgets connect
+    their changes to _write_value.
+    """
+
+    connection_changed: Signal = Signal(bool)
+
+    def __init__(
+        self,
+        widget: QWidget,
+        source: ValueSource,
+        write_back: Optional[bool] = False,
+        latency_samples: Optional[int] = 1000,
+        apply_value: Optional[Callable[[object], None]] = None,
+    ) -> None:
+        if (
+            apply_value is None
+            and type(self)._apply_value is ValueSourceBinding._apply_value
+        ):
+            raise TypeError(
+                "The binding needs an apply_value callable or an _apply_value method."
+            )
+
+        super(ValueSourceBinding, self).__init__(widget)
+
+        self._widget = widget
+        self._source = source
+        self._apply_value_callback = apply_value
+        self._updater: Optional[LiveValueUpdater] = None
+        self._write_back = write_back
+        self._applying_value: bool = False
+        self._latencies: deque[float] = deque(maxlen=latency_samples)
+        self._applied_values = 0
+        self._gui_time = 0.0
+
+        # Run configuration
+        self._configure_value_source_binding()
+
+    def _configure_value_source_binding(self) -> None:
+        """Connects the source to the shared updater and the widget."""
+        # Created on the GUI thread, the source thread only posts to it
+        self._updater = LiveValueUpdater.instance()
+        self._updater.register(self)
+        # Queued to the GUI thread when emitted from the source thread
+        self.connection_changed.connect(self._widget.setEnabled)
+        self._source.subscribe(self._source_value_changed)
+        self._source.add_connection_callback(self._source_connection_changed)
+        # Stop receiving values when the widget and the binding are deleted
+        self.destroyed.connect(
+            partial(
+                ValueSourceBinding._remove_source_callbacks,
+                self._source,
+                self._source_value_changed,
+                self._source_connection_changed,
+            )
+        )
+        # Start from the current state of the source
+        self._widget.setEnabled(self._source.connected)
+        if self._source.connected and self._source.value is not None:
+            self._source_value_changed(self._source.value, self._source.timestamp)
+
+    def _source_value_changed(self, value: object, timestamp: float) -> None:
+        """Queues a value from the source thread for the next frame."""
+        try:
+            self._updater.post(self, (value, timestamp))
+        except ValueError:
+            # The binding was unbound while the source was publishing the value
+            pass
+
+    def _source_connection_changed(self, state: bool) -> None:
+        """Forwards a connection change from the source thread to the GUI thread."""
+        self.connection_changed.emit(state)
+
+    @staticmethod
+    def _remove_source_callbacks(
+        source: ValueSource,
+        value_callback: Callable[[object, float], None],
+        connection_callback: Callable[[bool], None],
+        *_: object,
+    ) -> None:
+        """Unregisters the callbacks of a binding from the source."""
+        source.unsubscribe(value_callback)
+        source.remove_connection_callback(connection_callback)
+
+    def _apply_live_value(self, item: tuple[object, float]) -> None:
+        """Applies the latest value on the GUI thread and records the latency."""
+        start = time.perf_counter()
+        value, timestamp = item
+        self._applying_value = True
+        try:
+            self._apply_value(value)
+        finally:
+            self._applying_value = False
+        end = time.perf_counter()
+        self._latencies.append(end - timestamp)
+        self._gui_time += end - start
+        self._applied_values += 1
+
+    def _apply_value(self, value: object) -> None:
+        """Shows a value in the widget."""
+        self._apply_value_callback(value)
+
+    def _write_value(self, value: object) -> None:
+        """Writes a value changed by the user to the source."""
+        if self._write_back and not self._applying_value:
+            self._source.put(value)
+
+    def hasFocus(self) -> bool:
+        """Returns True while the user edits the widget, which delays the live values."""
+        return self._widget.hasFocus()
+
+    def unbind(self) -> None:
+        """Stops the updates from the source."""
+        self._remove_source_callbacks(
+            self._source, self._source_value_changed, self._source_connection_changed
+        )
+        self._updater.unregister(self)
+
+    def latency_statistics(self) -> dict[str, float]:
+        """Returns the count, mean, median and max latency of the recent updates in seconds."""
+        latencies = sorted(self._latencies)
+        if not latencies:
+            return {"count": 0, "mean": 0.0, "median": 0.0, "max": 0.0}
+        return {
+            "count": len(latencies),
+            "mean": sum(latencies) / len(latencies),
+            "median": latencies[len(latencies) // 2],
+            "max": latencies[-1],
+        }
+
+    @property
+    def source(self) -> ValueSource:
+        """Returns the bound value source."""
+        return self._source
+
+    @property
+    def widget(self) -> QWidget:
+        """Returns the bound widget."""
+        return self._widget
+
+    @property
+    def applied_values(self) -> int:
+        """Returns the number of values applied to the widget."""
+        return self._applied_values
+
+    @property
+    def gui_time(self) -> float:
+        """Returns the total time spent on the GUI thread to apply the values, in seconds."""
+        return self._gui_time
+
+
+class NumericSpinBoxBinding(ValueSourceBinding):
+    """Binds a NumericSpinBox to a numeric value source."""
+
+    def __init__(
+        self,
+        widget: NumericSpinBox,
+        source: ValueSource,
+        write_back: Optional[bool] = False,
+        latency_samples: Optional[int] = 1000,
+    ) -> None:
+        super(NumericSpinBoxBinding, self).__init__(
+            widget=widget,
+            source=source,
+            write_back=write_back,
+            latency_samples=latency_samples,
+        )
+        # Write the value when the user finishes editing, not on every keystroke
+        widget.editingFinished.connect(lambda: self._write_value(widget.value()))
+
+    def _apply_value(self, value: object) -> None:
+        """Shows a value in the spinbox."""
+        self._widget._apply_live_value(float(value))
+
+
+class ToggleCheckBoxBinding(ValueSourceBinding):
+    """Binds a ToggleCheckBox to a boolean value source."""
+
+    def __init__(
+        self,
+        widget: ToggleCheckBox,
+        source: ValueSource,
+        write_back: Optional[bool] = False,
+        latency_samples: Optional[int] = 1000,
+    ) -> None:
+        super(ToggleCheckBoxBinding, self).__init__(
+            widget=widget,
+            source=source,
+            write_back=write_back,
+            latency_samples=latency_samples,
+        )
+        widget.toggled.connect(self._write_value)
+
+    def _apply_value(self, value: object) -> None:
+        """Shows a value in the toggle checkbox."""
+        if bool(value) != self._widget.isChecked():
+            self._widget.set_state(bool(value))
+
+
+class StatusLabelBinding(ValueSourceBinding):
+    """Binds a StatusLabel to a boolean value source."""
+
+    def __init__(
+        self,
+        widget: StatusLabel,
+        source: ValueSource,
+        latency_samples: Optional[int] = 1000,
+    ) -> None:
+        super(StatusLabelBinding, self).__init__(
+            widget=widget, source=source, latency_samples=latency_samples
+        )
+        # The label has no text until its status is first updated
+        self._status_applied: bool = False
+
+    def _apply_value(self, value: object) -> None:
+        """Shows a value in the status label."""
+        if not self._status_applied or bool(value) != self._widget.status:
+            self._widget.update_status(bool(value))
+            self._status_applied = True
@@ -30,6 +30,9 @@ from qtpy.QtGui import QIcon, QColor
 from qtpy.QtWidgets import QPushButton, QFileDialog, QColorDialog
 from typing import Optional
 
+from gsewidgets.models.filesystem import FileSystemCache
+from gsewidgets.widgets.filters import sanitize_text
+
 __all__ = [
     "SimpleButton",
     "FlatButton",
@@ -146,11 +149,23 @@ class AbstractBrowserButton(SimpleButton):
         # Check invalid characters
         if self._invalid_characters is None:
             self._invalid_characters = '<>"\\|?*#& '
-        # Validate based on invalid characters
-        for char in self._invalid_characters:
-            value = value.replace(char, "_")
-        # Set the target directory
-        self._target_directory = value
+        # Validate based on invalid characters and set the target directory
+        self._target_directory = sanitize_text(value, self._invalid_characters)
+        # Read the directory information in the background, before the dialog needs it
+        FileSystemCache.shared().prefetch(self._target_directory)
+
+    def _dialog_directory(self) -> str:
+        """
+        Returns the start directory of the dialog, which is the target directory or its closest
+        readable parent, checked through the shared filesystem cache.
+        """
+        cache = FileSystemCache.shared()
+        directory = Path(self.target_directory)
+        for candidate in (directory, *directory.parents):
+            info = cache.info(candidate)
+            if info.is_dir and info.readable:
+                return str(candidate)
+        return str(Path.home())
 
 
 class FileBrowserButton(AbstractBrowserButton, QObject):
@@ -213,7 +228,7 @@ class FileBrowserButton(AbstractBrowserButton, QObject):
         new_file_path, _ = QFileDialog.getOpenFileName(
             parent=self,
             caption=self.caption,
-            directory=self.target_directory,
+            directory=self._dialog_directory(),
             filter=self._filter,
         )
 
@@ -258,7 +273,7 @@ class DirectoryBrowserButton(AbstractBrowserButton, QObject):
         self.clearFocus()
         # Open file dialog and get the directory
         new_directory = QFileDialog.getExistingDirectory(
-            parent=self, caption=self.caption, directory=self.target_directory
+            parent=self, caption=self.caption, directory=self._dialog_directory()
         )
         # Update the directory path and emit the directory_changed signal
         if new_directory != "":
@@ -288,7 +303,7 @@ class MultiFileBrowserButton(FileBrowserButton):
         new_file_paths, _ = QFileDialog.getOpenFileNames(
             parent=self,
             caption=self.caption,
-            directory=self.target_directory,
+            directory=self._dialog_directory(),
             filter=self._filter,
         )
 
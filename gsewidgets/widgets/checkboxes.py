@@ -24,22 +24,145 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
+import math
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from qtpy.QtCore import (
     Qt,
+    QEvent,
     QSize,
     Property,
     QPoint,
     QPointF,
     QRectF,
     QEasingCurve,
-    QPropertyAnimation,
-    QSequentialAnimationGroup,
+    QCoreApplication,
+    QObject,
+    QTimer,
+    Signal,
 )
-from qtpy.QtGui import QColor, QBrush, QPaintEvent, QPen, QPainter
-from qtpy.QtWidgets import QCheckBox
-from typing import Optional
+from qtpy.QtGui import QColor, QImage, QPaintEvent, QPen, QPainter, QResizeEvent
+from qtpy.QtWidgets import QCheckBox, QGridLayout, QWidget
+from typing import Callable, Iterator, Optional, Sequence, Union
+
+from gsewidgets.widgets.performance import (
+    performance_mode,
+    add_performance_mode_listener,
+)
+
+__all__ = ["CheckBox", "ToggleCheckBox", "ToggleAnimationDriver", "CheckBoxBank"]
+
+
+def _new_image(width: float, height: float, device_pixel_ratio: float) -> QImage:
+    """Returns a transparent image for the given logical size and device pixel ratio."""
+    image = QImage(
+        math.ceil(width * device_pixel_ratio) + 1,
+        math.ceil(height * device_pixel_ratio) + 1,
+        QImage.Format.Format_ARGB32_Premultiplied,
+    )
+    image.setDevicePixelRatio(device_pixel_ratio)
+    image.fill(Qt.GlobalColor.transparent)
+    return image
+
+
+@lru_cache(maxsize=1024)
+def _bar_image(
+    width: float,
+    height: float,
+    color: int,
+    antialiasing: bool,
+    offset: tuple[float, float],
+    device_pixel_ratio: float,
+) -> QImage:
+    """Renders the bar of a toggle checkbox once, for all the toggles with the same style."""
+    image = _new_image(width, height, device_pixel_ratio)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing, antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor.fromRgba(color))
+    painter.drawRoundedRect(QRectF(*offset, width, height), height / 2, height / 2)
+    painter.end()
+    return image
+
+
+@lru_cache(maxsize=1024)
+def _knob_image(
+    radius: int,
+    color: int,
+    outline: Optional[int],
+    antialiasing: bool,
+    offset: tuple[float, float],
+    device_pixel_ratio: float,
+) -> QImage:
+    """
+    Renders the knob of a toggle checkbox once, for all the toggles with the same style. The image
+    has a margin of one pixel around the circle for the outline.
+    """
+    image = _new_image(2 * radius + 2, 2 * radius + 2, device_pixel_ratio)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing, antialiasing)
+    if outline is None:
+        painter.setPen(Qt.PenStyle.NoPen)
+    else:
+        painter.setPen(QPen(QColor.fromRgba(outline)))
+    painter.setBrush(QColor.fromRgba(color))
+    painter.drawEllipse(
+        QPointF(radius + 1 + offset[0], radius + 1 + offset[1]), radius, radius
+    )
+    painter.end()
+    return image
+
+
+def _cached_image(
+    x: float,
+    y: float,
+    device_pixel_ratio: float,
+    render: Callable[..., QImage],
+    *args,
+) -> tuple[QRectF, QImage]:
+    """
+    Returns a cached image and its target rectangle aligned to the device pixels. The fraction of
+    a pixel, in quarters, is rendered inside the image, so the result matches drawing at the exact
+    position.
+    """
+    offset = []
+    aligned = []
+    for coordinate in (x, y):
+        device_coordinate = coordinate * device_pixel_ratio
+        pixel = math.floor(device_coordinate)
+        offset.append(round((device_coordinate - pixel) * 4) / 4 / device_pixel_ratio)
+        aligned.append(pixel / device_pixel_ratio)
+    image = render(*args, tuple(offset), device_pixel_ratio)
+    return QRectF(QPointF(*aligned), image.deviceIndependentSize()), image
+
+
+# Only sent by Qt 6.6 and later, older versions check the ratio on every paint
+_DEVICE_PIXEL_RATIO_CHANGE = getattr(QEvent.Type, "DevicePixelRatioChange", None)
+
+
+class _ToggleStyle:
+    """Colors of the toggle checkboxes, indexed by the checked state and shared per style."""
+
+    __slots__ = ("bar_colors", "circle_colors", "outline_colors")
+
+    def __init__(
+        self, inactive_color: int, active_color: int, circle_color: int
+    ) -> None:
+        self.bar_colors = (
+            inactive_color,
+            QColor.fromRgba(active_color).lighter().rgba(),
+        )
+        self.circle_colors = (circle_color, active_color)
+        self.outline_colors = (QColor(Qt.GlobalColor.lightGray).rgba(), None)
 
-__all__ = ["CheckBox", "ToggleCheckBox"]
+
+@lru_cache(maxsize=64)
+def _toggle_style(
+    inactive_color: int, active_color: int, circle_color: int
+) -> _ToggleStyle:
+    """Returns the shared style of the toggles with the given colors."""
+    return _ToggleStyle(inactive_color, active_color, circle_color)
 
 
 class CheckBox(QCheckBox):
@@ -89,7 +212,11 @@ class CheckBox(QCheckBox):
 
 
 class ToggleCheckBox(QCheckBox):
-    """Used to create instances of toggle checkboxes."""
+    """
+    Used to create instances of toggle checkboxes. The bar and the knob are rendered once per size,
+    colors, state and device pixel ratio, and the rendered images are shared by all the toggles.
+    The geometry is computed on resize, so a paint at rest only draws two cached images.
+    """
 
     def __init__(
         self,
@@ -102,17 +229,25 @@ class ToggleCheckBox(QCheckBox):
     ) -> None:
         super(ToggleCheckBox, self).__init__()
 
-        self._inactive_brush = QBrush(inactive_color)
-        self._circle_inactive_brush = QBrush(circle_color)
-        self._active_brush = QBrush(QColor(active_color).lighter())
-        self._circle_active_brush = QBrush(QColor(active_color))
+        self._style = _toggle_style(
+            QColor(inactive_color).rgba(),
+            QColor(active_color).rgba(),
+            QColor(circle_color).rgba(),
+        )
         self._size = size
         self._circle_radius_multiplier = circle_radius_multiplier
         self._bar_size_multiplier = bar_size_multiplier
 
         self._circle_position: float = 0
-        self._animation = QPropertyAnimation(self, b"circle_position")
-        self._animation_group = QSequentialAnimationGroup()
+        self._instant_update: bool = False
+        # Geometry computed on resize, see _update_geometry
+        self._frames: Optional[tuple] = None
+        self._device_pixel_ratio: float = 0.0
+        self._antialiasing: bool = True
+        self._knob_x: float = 0.0
+        self._knob_y: float = 0.0
+        self._knob_trail: float = 0.0
+        self._knob_radius: int = 0
 
         # Run the configuration methods
         self._configure_toggle_checkbox()
@@ -124,24 +259,18 @@ class ToggleCheckBox(QCheckBox):
             self.setFixedSize(self._size)
         # Set the margins
         self.setContentsMargins(8, 0, 8, 0)
-        # Set the animation method
-        self._animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        # Set the animation duration
-        self._animation.setDuration(350)
-        # Add the animation to the group
-        self._animation_group.addAnimation(self._animation)
         # Connect the state changed signal of the checkbox
         self.stateChanged.connect(self._run_animations)
 
     def _run_animations(self, state: bool) -> None:
         """Runs the animations for each checkbox state."""
-        # Stop any animations that are already running
-        self._animation_group.stop()
+        # The knob of an instant update is moved by set_state
+        if self._instant_update:
+            return
         # Clear the focus
         self.clearFocus()
-        # Set and start the animation
-        self._animation.setEndValue(1) if state else self._animation.setEndValue(0)
-        self._animation_group.start()
+        # Move the knob with the shared animation driver
+        ToggleAnimationDriver.instance().animate(self, 1 if state else 0)
 
     def sizeHint(self):
         return QSize(58, 45)
@@ -149,13 +278,17 @@ class ToggleCheckBox(QCheckBox):
     def hitButton(self, position: QPoint) -> QPoint:
         return self.contentsRect().contains(position)
 
-    def paintEvent(self, event: QPaintEvent) -> None:
-        # Set the painter
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setPen(QPen(Qt.GlobalColor.transparent))
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self._frames = None
+        super(ToggleCheckBox, self).resizeEvent(event)
 
-        # Compute and draw the rectangle
+    def changeEvent(self, event: QEvent) -> None:
+        if event.type() == _DEVICE_PIXEL_RATIO_CHANGE:
+            self._frames = None
+        super(ToggleCheckBox, self).changeEvent(event)
+
+    def _update_geometry(self) -> None:
+        """Computes the geometry and looks up the images of both states for the current size."""
         contents_rect = self.contentsRect()
         circle_radius = round(self._circle_radius_multiplier * contents_rect.height())
         bar_rectangle = QRectF(
@@ -166,37 +299,87 @@ class ToggleCheckBox(QCheckBox):
         )
         bar_rectangle.moveCenter(contents_rect.center().toPointF())
 
-        trail_bar = contents_rect.width() - 2 * circle_radius
-        x_position = (
-            contents_rect.x() + circle_radius + trail_bar * self._circle_position
-        )
-        radius = bar_rectangle.height() / 2
-
-        if self.isChecked():
-            # Set active status
-            painter.setBrush(self._active_brush)
-            painter.drawRoundedRect(bar_rectangle, radius, radius)
-            painter.setBrush(self._circle_active_brush)
-
-        else:
-            # Set inactive status
-            painter.setBrush(self._inactive_brush)
-            painter.drawRoundedRect(bar_rectangle, radius, radius)
-            painter.setPen(QPen(Qt.GlobalColor.lightGray))
-            painter.setBrush(self._circle_inactive_brush)
-
-        # Draw the ellipse
-        painter.drawEllipse(
-            QPointF(x_position, bar_rectangle.center().y()),
-            circle_radius,
-            circle_radius,
+        # Top left corner of the knob image, at position 0
+        self._knob_x = contents_rect.x() - 1
+        self._knob_y = bar_rectangle.center().y() - circle_radius - 1
+        self._knob_trail = contents_rect.width() - 2 * circle_radius
+        self._knob_radius = circle_radius
+        self._device_pixel_ratio = self.devicePixelRatioF()
+        self._antialiasing = not performance_mode()
+
+        style = self._style
+        frames = []
+        for state in (0, 1):
+            bar = _cached_image(
+                bar_rectangle.x(),
+                bar_rectangle.y(),
+                self._device_pixel_ratio,
+                _bar_image,
+                bar_rectangle.width(),
+                bar_rectangle.height(),
+                style.bar_colors[state],
+                self._antialiasing,
+            )
+            knob = self._knob(state, state)
+            frames.append(bar + knob)
+        self._frames = tuple(frames)
+
+    def _knob(self, state: int, position: float) -> tuple[QRectF, QImage]:
+        """Returns the knob image of a state and its position on the trail."""
+        style = self._style
+        return _cached_image(
+            self._knob_x + self._knob_trail * position,
+            self._knob_y,
+            self._device_pixel_ratio,
+            _knob_image,
+            self._knob_radius,
+            style.circle_colors[state],
+            style.outline_colors[state],
+            self._antialiasing,
         )
 
+    def paintEvent(self, event: QPaintEvent) -> None:
+        # Recompute the geometry after a resize, a screen or a performance mode change
+        if (
+            self._frames is None
+            or self._antialiasing == performance_mode()
+            or (
+                _DEVICE_PIXEL_RATIO_CHANGE is None
+                and self._device_pixel_ratio != self.devicePixelRatioF()
+            )
+        ):
+            self._update_geometry()
+
+        # Draw the cached images, a knob at rest uses the images of the state
+        state = self.isChecked()
+        bar_target, bar_image, knob_target, knob_image = self._frames[state]
+        if self._circle_position != state:
+            knob_target, knob_image = self._knob(state, self._circle_position)
+        painter = QPainter(self)
+        painter.drawImage(bar_target, bar_image)
+        painter.drawImage(knob_target, knob_image)
         painter.end()
 
     def update_toggle(self, value: float) -> None:
         self.setChecked(value)
 
+    def set_state(self, checked: bool, silent: Optional[bool] = False) -> None:
+        """
+        Sets the state from the program, e.g. to mirror a hardware state. The knob jumps to its
+        final position, the focus is kept and the toggle is repainted once. With silent set, no
+        signals are emitted.
+        """
+        checked = bool(checked)
+        self._instant_update = True
+        signals_blocked = self.blockSignals(True) if silent else False
+        try:
+            self.setChecked(checked)
+        finally:
+            self._instant_update = False
+            if silent:
+                self.blockSignals(signals_blocked)
+        ToggleAnimationDriver.jump(self, 1 if checked else 0)
+
     @Property(float)
     def circle_position(self) -> float:
         return self._circle_position
@@ -205,3 +388,310 @@ class ToggleCheckBox(QCheckBox):
     def circle_position(self, value: float) -> None:
         self._circle_position = value
         self.update()
+
+
+class ToggleAnimationDriver(QObject):
+    """
+    Advances the knob animations of all the toggle checkboxes on a single timer. Every tick moves
+    all the running knobs and schedules their repaints together, so Qt paints them in one pass. A
+    duration of 0 or the performance mode disable the animations, and suspended() makes the knobs
+    jump during bulk changes.
+    """
+
+    _instance: Optional["ToggleAnimationDriver"] = None
+
+    def __init__(
+        self, duration: Optional[int] = 350, frame_rate: Optional[float] = 60
+    ) -> None:
+        super(ToggleAnimationDriver, self).__init__()
+
+        self._duration = duration
+        self._easing_curve = QEasingCurve(QEasingCurve.Type.InOutCubic)
+        self._animations: dict[int, tuple[ToggleCheckBox, float, float, float]] = {}
+        self._suspended = 0
+        self._frames = 0
+        self._timer = QTimer(self)
+
+        # Run configuration
+        self._configure_toggle_animation_driver(frame_rate)
+
+    def _configure_toggle_animation_driver(self, frame_rate: float) -> None:
+        """Basic configuration for the frame timer."""
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._advance)
+        self.set_frame_rate(frame_rate)
+
+    @classmethod
+    def instance(cls) -> "ToggleAnimationDriver":
+        """Returns the shared driver, created on first use from the GUI thread."""
+        if cls._instance is None:
+            driver = cls()
+            # Delete the driver together with the application
+            driver.setParent(QCoreApplication.instance())
+            driver.destroyed.connect(cls._reset_instance)
+            cls._instance = driver
+        return cls._instance
+
+    @classmethod
+    def _reset_instance(cls) -> None:
+        """Forgets the deleted shared driver."""
+        cls._instance = None
+
+    @classmethod
+    def _performance_mode_changed(cls, enabled: bool) -> None:
+        """Finishes the running animations when the performance mode is enabled."""
+        if enabled and cls._instance is not None:
+            cls._instance.finish_all()
+
+    def set_frame_rate(self, frame_rate: float) -> None:
+        """Sets the number of animation frames per second."""
+        if frame_rate <= 0:
+            raise ValueError("The frame rate must be greater than 0.")
+        self._timer.setInterval(max(1, round(1000 / frame_rate)))
+
+    def set_duration(self, duration: int) -> None:
+        """Sets the duration of the animations in milliseconds, 0 disables the animations."""
+        if duration < 0:
+            raise ValueError("The duration can't be lesser than 0.")
+        self._duration = duration
+        if duration == 0:
+            self.finish_all()
+
+    def animate(self, toggle: ToggleCheckBox, end_position: float) -> None:
+        """Moves the knob of a toggle to the end position, from where it currently is."""
+        key = id(toggle)
+        if self._duration == 0 or self._suspended or performance_mode():
+            self._animations.pop(key, None)
+            self._move_knob(toggle, end_position)
+            return
+        start_position = toggle.circle_position
+        if start_position == end_position:
+            self._animations.pop(key, None)
+            return
+        self._animations[key] = (
+            toggle,
+            start_position,
+            end_position,
+            time.perf_counter(),
+        )
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @classmethod
+    def jump(cls, toggle: ToggleCheckBox, position: float) -> None:
+        """Stops the animation of a toggle, if any, and moves its knob to the position."""
+        if cls._instance is not None:
+            cls._instance._animations.pop(id(toggle), None)
+        cls._move_knob(toggle, position)
+
+    def stop(self, toggle: ToggleCheckBox) -> None:
+        """Stops the animation of a toggle, leaving the knob where it is."""
+        self._animations.pop(id(toggle), None)
+
+    def finish_all(self) -> None:
+        """Moves all the running knobs to their end positions."""
+        animations, self._animations = self._animations, {}
+        for toggle, _, end_position, _ in animations.values():
+            try:
+                self._move_knob(toggle, end_position)
+            except RuntimeError:
+                # The toggle was deleted by Qt during its animation
+                pass
+        self._timer.stop()
+
+    @contextmanager
+    def suspended(self) -> Iterator["ToggleAnimationDriver"]:
+        """Makes the knobs jump to their end positions, e.g. while changing many toggles."""
+        self._suspended += 1
+        try:
+            self.finish_all()
+            yield self
+        finally:
+            self._suspended -= 1
+
+    @staticmethod
+    def _move_knob(toggle: ToggleCheckBox, position: float) -> None:
+        """Moves the knob of a toggle and schedules its repaint."""
+        if toggle._circle_position != position:
+            toggle._circle_position = position
+            toggle.update()
+
+    def _advance(self) -> None:
+        """Moves all the running knobs for the current frame."""
+        now = time.perf_counter()
+        duration = self._duration / 1000
+        finished = []
+        for key, (toggle, start, end, start_time) in self._animations.items():
+            progress = min(1.0, (now - start_time) / duration)
+            position = start + (end - start) * self._easing_curve.valueForProgress(
+                progress
+            )
+            try:
+                self._move_knob(toggle, position)
+            except RuntimeError:
+                # The toggle was deleted by Qt during its animation
+                progress = 1.0
+            if progress == 1.0:
+                finished.append(key)
+        for key in finished:
+            del self._animations[key]
+        self._frames += 1
+        if not self._animations:
+            self._timer.stop()
+
+    @property
+    def duration(self) -> int:
+        """Returns the duration of the animations in milliseconds."""
+        return self._duration
+
+    @property
+    def active_animations(self) -> int:
+        """Returns the number of running animations."""
+        return len(self._animations)
+
+    @property
+    def frames(self) -> int:
+        """Returns the number of animation frames advanced by the timer."""
+        return self._frames
+
+
+class CheckBoxBank(QWidget):
+    """
+    Bank of toggle checkboxes, or simple checkboxes, backed by an integer bitmask, e.g. to mirror
+    the channels of a digital I/O card. Bit i of the mask is the state of checkbox i. Setting a
+    mask only changes, and repaints, the checkboxes whose bit flipped, and mask_changed is emitted
+    once per change. In exclusive mode at most one checkbox is checked.
+    """
+
+    mask_changed: Signal = Signal(object)
+
+    def __init__(
+        self,
+        count: int,
+        labels: Optional[Sequence[str]] = None,
+        columns: Optional[int] = 8,
+        exclusive: Optional[bool] = False,
+        toggles: Optional[bool] = True,
+        size: Optional[QSize] = None,
+        object_name: Optional[str] = "checkbox-bank",
+    ) -> None:
+        super(CheckBoxBank, self).__init__()
+
+        self._count = count
+        self._labels = labels
+        self._columns = columns
+        self._exclusive = exclusive
+        self._toggles = toggles
+        self._size = size
+        self._object_name = object_name
+        self._mask: int = 0
+        self._checkboxes: list[Union[ToggleCheckBox, CheckBox]] = []
+
+        # Run configuration
+        self._configure_checkbox_bank()
+
+    def _configure_checkbox_bank(self) -> None:
+        """Basic configuration for the checkbox bank."""
+        if self._count < 1:
+            raise ValueError("The bank must have at least one checkbox.")
+        if self._labels is not None and len(self._labels) != self._count:
+            raise ValueError(
+                "The number of labels must match the number of checkboxes."
+            )
+
+        layout = QGridLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for index in range(self._count):
+            if self._toggles:
+                checkbox = ToggleCheckBox(size=self._size)
+            else:
+                checkbox = CheckBox(size=self._size)
+            if self._labels is not None:
+                checkbox.setToolTip(self._labels[index])
+            checkbox.toggled.connect(
+                lambda checked, index=index: self._checkbox_toggled(index, checked)
+            )
+            layout.addWidget(checkbox, index // self._columns, index % self._columns)
+            self._checkboxes.append(checkbox)
+
+        # Set the object name
+        if self._object_name is not None:
+            self.setObjectName(self._object_name)
+
+    def _checkbox_toggled(self, index: int, checked: bool) -> None:
+        """Updates the mask after the user changed a checkbox."""
+        if checked and self._exclusive:
+            mask = 1 << index
+        elif checked:
+            mask = self._mask | 1 << index
+        else:
+            mask = self._mask & ~(1 << index)
+        self.set_mask(mask)
+
+    def set_mask(self, mask: int, silent: Optional[bool] = False) -> None:
+        """Sets the state of all the checkboxes from a mask. With silent set, no signal is emitted."""
+        mask = int(mask)
+        if mask < 0 or mask >> self._count:
+            raise ValueError(f"The mask must fit in {self._count} bits.")
+        if self._exclusive and mask & (mask - 1):
+            raise ValueError("Only one bit can be set in exclusive mode.")
+        flipped = self._mask ^ mask
+        if not flipped:
+            return
+        self._mask = mask
+        while flipped:
+            bit = flipped & -flipped
+            flipped ^= bit
+            self._set_checkbox(bit.bit_length() - 1, bool(mask & bit))
+        if not silent:
+            self.mask_changed.emit(mask)
+
+    def _set_checkbox(self, index: int, checked: bool) -> None:
+        """Changes a single checkbox without emitting its signals."""
+        checkbox = self._checkboxes[index]
+        if checkbox.isChecked() == checked:
+            return
+        if isinstance(checkbox, ToggleCheckBox):
+            checkbox.set_state(checked, silent=True)
+        else:
+            signals_blocked = checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(signals_blocked)
+
+    def set_bit(self, index: int, checked: bool) -> None:
+        """Sets the state of a single checkbox."""
+        if not 0 <= index < self._count:
+            raise IndexError("Checkbox index out of range.")
+        if checked:
+            self.set_mask(1 << index if self._exclusive else self._mask | 1 << index)
+        else:
+            self.set_mask(self._mask & ~(1 << index))
+
+    def bit(self, index: int) -> bool:
+        """Returns the state of a single checkbox."""
+        if not 0 <= index < self._count:
+            raise IndexError("Checkbox index out of range.")
+        return bool(self._mask >> index & 1)
+
+    @property
+    def mask(self) -> int:
+        """Returns the mask of the checked checkboxes."""
+        return self._mask
+
+    @property
+    def count(self) -> int:
+        """Returns the number of checkboxes."""
+        return self._count
+
+    @property
+    def exclusive(self) -> bool:
+        """Returns whether at most one checkbox can be checked."""
+        return self._exclusive
+
+    @property
+    def checkboxes(self) -> list[Union[ToggleCheckBox, CheckBox]]:
+        """Returns the checkboxes of the bank, with checkbox i showing bit i."""
+        return self._checkboxes
+
+
+add_performance_mode_listener(ToggleAnimationDriver._performance_mode_changed)
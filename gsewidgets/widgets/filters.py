@@ -24,63 +24,121 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
-from PyQt6.QtCore import QObject
-from qtpy.QtCore import QObject, QEvent
+from qtpy.QtCore import QCoreApplication, QObject, QEvent
 from qtpy.QtWidgets import QLineEdit
 from typing import Optional
 
+from gsewidgets.models.filesystem import DirectoryCreator
+
 __all__ = [
+    "sanitize_text",
     "FileNameEventFilter",
     "FilePathEventFilter",
     "URIParseEventFilter",
-    "IPv4EventFilter, MultiFloatEventFilter",
+    "IPv4EventFilter",
+    "MultiFloatEventFilter",
 ]
 
 
-class FileNameEventFilter(QObject):
+@lru_cache(maxsize=64)
+def _translation_table(invalid_characters: str, replacement: str) -> dict[int, str]:
+    """Compiles the translation table of a set of invalid characters once."""
+    return str.maketrans(dict.fromkeys(invalid_characters, replacement))
+
+
+def sanitize_text(
+    text: str, invalid_characters: str, replacement: Optional[str] = "_"
+) -> str:
+    """Replaces all the invalid characters of a text in a single pass."""
+    return text.translate(_translation_table(invalid_characters, replacement))
+
+
+# The only event type handled by the filters
+_FOCUS_OUT = QEvent.Type.FocusOut
+
+
+class _SharedEventFilter(QObject):
+    """
+    Base of the event filters, which don't keep any state per widget. shared() returns a single
+    instance per filter class and configuration, that can be installed on any number of widgets.
+    """
+
+    _shared_instances: dict[tuple, "_SharedEventFilter"] = {}
+
+    @classmethod
+    def shared(cls, *args) -> "_SharedEventFilter":
+        """Returns the shared filter for the given configuration, created on first use."""
+        key = (cls, *args)
+        instance = _SharedEventFilter._shared_instances.get(key)
+        if instance is None:
+            instance = cls(*args)
+            # Delete the filter together with the application
+            instance.setParent(QCoreApplication.instance())
+            instance.destroyed.connect(
+                lambda _=None, key=key: _SharedEventFilter._shared_instances.pop(
+                    key, None
+                )
+            )
+            _SharedEventFilter._shared_instances[key] = instance
+        return instance
+
+
+class FileNameEventFilter(_SharedEventFilter):
     """Used to create file name focus out event filters to replace invalid characters with underscores."""
 
     def __init__(self, invalid_characters: Optional[str] = '<>"/\\|?*#&$: ') -> None:
         super(FileNameEventFilter, self).__init__()
 
         self._invalid_characters = invalid_characters
+        self._translation_table = _translation_table(invalid_characters, "_")
 
     def eventFilter(self, widget: QLineEdit, event: QEvent) -> bool:
         """Filter file name on focus out events."""
-        if event.type() == QEvent.FocusOut:
-            # Validate string
-            text = widget.text()
-            for character in self._invalid_characters:
-                text = text.replace(character, "_")
-            # Replace old text with the validated text
-            widget.setText(text)
-
+        if event.type() != _FOCUS_OUT:
+            return False
+        self._sanitize(widget)
         return False
 
+    def _sanitize(self, widget: QLineEdit) -> None:
+        """Replaces the invalid characters of the widget text."""
+        # Validate string
+        text = widget.text().translate(self._translation_table)
+        # Replace old text with the validated text
+        widget.setText(text)
+
 
 class FilePathEventFilter(FileNameEventFilter):
-    """Used to create file path focus out event filters to replace invalid characters with underscores."""
+    """
+    Used to create file path focus out event filters to replace invalid characters with underscores.
+    The directory is checked and created on a worker thread, and widgets with a check_directory
+    method, like the FilePathInputBox, are left to start and follow the check themselves.
+    """
 
     def __init__(self, invalid_characters: Optional[str] = '<>"|?*#&$: ') -> None:
         super(FilePathEventFilter, self).__init__(invalid_characters=invalid_characters)
 
     def eventFilter(self, widget: QLineEdit, event: QEvent) -> bool:
         """Filter file path on focus out events."""
-        super(FilePathEventFilter, self).eventFilter(widget=widget, event=event)
-        if event.type() == QEvent.FocusOut:
-            text = widget.text()
-            # Check/create file path
-            file_path = Path(text)
-            if not file_path.exists():
-                file_path.mkdir(parents=True)
-            # Replace the text with a PosixPath
-            widget.setText(f"{file_path.as_posix()}/")
+        if event.type() != _FOCUS_OUT:
+            return False
+        self._sanitize(widget)
+        text = widget.text()
+        # Replace the text with a PosixPath
+        file_path = Path(text)
+        widget.setText(f"{file_path.as_posix()}/")
+        # Check/create file path without blocking the event loop
+        check_directory = getattr(widget, "check_directory", None)
+        if check_directory is not None:
+            check_directory()
+        else:
+            DirectoryCreator.shared().ensure(file_path)
         return False
 
 
-class URIParseEventFilter(QObject):
+class URIParseEventFilter(_SharedEventFilter):
     """Used to parse URI on focus out events."""
 
     def __init__(self) -> None:
@@ -88,19 +146,20 @@ class URIParseEventFilter(QObject):
 
     def eventFilter(self, widget: QLineEdit, event: QEvent) -> bool:
         """Filter URI on focus out events."""
-        if event.type() == QEvent.FocusOut:
-            text = widget.text()
-
-            # Parse URI
-            parsed_uri = urlparse(text)
-            # Check parsed uri
-            if parsed_uri.scheme not in ["https", "http"]:
-                # Clean the text of the URI input
-                widget.setText("")
+        if event.type() != _FOCUS_OUT:
+            return False
+        text = widget.text()
+
+        # Parse URI
+        parsed_uri = urlparse(text)
+        # Check parsed uri
+        if parsed_uri.scheme not in ["https", "http"]:
+            # Clean the text of the URI input
+            widget.setText("")
         return False
 
 
-class IPv4EventFilter(QObject):
+class IPv4EventFilter(_SharedEventFilter):
     """Used to parse IPv4 on focus out events."""
 
     def __init__(self) -> None:
@@ -108,14 +167,15 @@ class IPv4EventFilter(QObject):
 
     def eventFilter(self, widget: QLineEdit, event: QEvent) -> bool:
         """Filter IPv4 on focus out events."""
-        if event.type() == QEvent.FocusOut:
-            text = widget.text()
-
-            # Check IPv4
-            validated_ipv4 = self._valid_ip_check(ip=text)
-            if not validated_ipv4:
-                # Set the IP to an empty string
-                widget.setText("")
+        if event.type() != _FOCUS_OUT:
+            return False
+        text = widget.text()
+
+        # Check IPv4
+        validated_ipv4 = self._valid_ip_check(ip=text)
+        if not validated_ipv4:
+            # Set the IP to an empty string
+            widget.setText("")
         return False
 
     def _valid_ip_check(self, ip: str) -> bool:
@@ -137,7 +197,7 @@ class IPv4EventFilter(QObject):
         return True
 
 
-class MultiFloatEventFilter(QObject):
+class MultiFloatEventFilter(_SharedEventFilter):
     """Used to parse multi float on focus out events."""
 
     def __init__(self) -> None:
@@ -145,26 +205,26 @@ class MultiFloatEventFilter(QObject):
 
     def eventFilter(self, widget: QLineEdit, event: QEvent) -> bool:
         """Filter multi float on focus out events."""
-        if event.type() == QEvent.FocusOut:
-            text = widget.text()
-            modified_text = ""
-
-            # Check if the text is empty
-            if text.strip() == "":
-                return False
+        if event.type() != _FOCUS_OUT:
+            return False
+        text = widget.text()
+        modified_text = ""
 
-            # Check multi float
-            for entry in text.split(","):
-                # Check each entry for decimal points and add .0 if there are none
-                if "." not in entry:
-                    modified_text += f"{entry}.0, "
-                else:
-                    modified_text += f"{entry}, "
+        # Check if the text is empty
+        if text.strip() == "":
+            return False
 
-            # Remove the last comma and space
-            modified_text = modified_text[:-2]
+        # Check multi float
+        for entry in text.split(","):
+            # Check each entry for decimal points and add .0 if there are none
+            if "." not in entry:
+                modified_text += f"{entry}.0, "
+            else:
+                modified_text += f"{entry}, "
 
-            # Set the text to the modified text
-            widget.setText(modified_text)
+        # Remove the last comma and space
+        modified_text = modified_text[:-2]
 
+        # Set the text to the modified text
+        widget.setText(modified_text)
         return False
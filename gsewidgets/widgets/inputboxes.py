@@ -24,11 +24,12 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
-from qtpy.QtCore import QSize, Qt, QRegularExpression
+from qtpy.QtCore import QSize, Qt, QRegularExpression, Signal
 from qtpy.QtGui import QRegularExpressionValidator
 from qtpy.QtWidgets import QLineEdit, QTextEdit
 from typing import Optional
 
+from gsewidgets.models.filesystem import DirectoryCreator
 from gsewidgets.widgets.filters import (
     FileNameEventFilter,
     FilePathEventFilter,
@@ -45,8 +46,18 @@ __all__ = [
     "IPv4InputBox",
     "MultiFloatInputBox",
     "TextInfoBox",
+    "PATH_UNCHECKED",
+    "PATH_PENDING",
+    "PATH_OK",
+    "PATH_ERROR",
 ]
 
+# States of the directory of a FilePathInputBox
+PATH_UNCHECKED = "unchecked"
+PATH_PENDING = "pending"
+PATH_OK = "ok"
+PATH_ERROR = "error"
+
 
 class InputBox(QLineEdit):
     """Used to create instances of simple input boxes."""
@@ -108,14 +119,20 @@ class FileNameInputBox(InputBox):
         )
 
         # Set the file name event filter
-        self._file_name_filter = FileNameEventFilter(
-            invalid_characters=invalid_characters
-        )
+        self._file_name_filter = FileNameEventFilter.shared(invalid_characters)
         self.installEventFilter(self._file_name_filter)
 
 
 class FilePathInputBox(InputBox):
-    """Creates a file path input box with a path validation. The path will be created if it doesn't exist."""
+    """
+    Creates a file path input box with a path validation. The path will be created if it doesn't
+    exist, on a worker thread. The state of the directory is set as the path_state dynamic
+    property, e.g. for QLineEdit[path_state="error"] style sheet rules, and the error message is
+    shown as the tool tip.
+    """
+
+    path_state_changed = Signal(str)
+    _directory_checked = Signal(str, object)
 
     def __init__(
         self,
@@ -130,12 +147,63 @@ class FilePathInputBox(InputBox):
             object_name=object_name,
         )
 
+        # Directory state helpers
+        self._path_state = PATH_UNCHECKED
+        self._path_error: Optional[str] = None
+        self._checked_path: Optional[str] = None
+        self.setProperty("path_state", PATH_UNCHECKED)
+        # Results arrive from the worker threads as queued signals
+        self._directory_checked.connect(self._directory_check_finished)
+
         # Set the file path event filter
-        self._file_path_filter = FilePathEventFilter(
-            invalid_characters=invalid_characters
-        )
+        self._file_path_filter = FilePathEventFilter.shared(invalid_characters)
         self.installEventFilter(self._file_path_filter)
 
+    def check_directory(self) -> None:
+        """Checks and creates the directory of the current text without blocking the event loop."""
+        self._checked_path = self.text()
+        self._set_path_state(PATH_PENDING)
+        DirectoryCreator.shared().ensure(
+            self._checked_path, self._emit_directory_checked
+        )
+
+    def _emit_directory_checked(self, path: str, error: Optional[str]) -> None:
+        """Sends the result of a check to the GUI thread."""
+        try:
+            self._directory_checked.emit(path, error)
+        except RuntimeError:
+            # The input box was deleted while the directory was checked
+            pass
+
+    def _directory_check_finished(self, path: str, error: Optional[str]) -> None:
+        """Updates the state, unless the result belongs to an older check."""
+        if path != self._checked_path:
+            return
+        self._set_path_state(PATH_OK if error is None else PATH_ERROR, error)
+
+    def _set_path_state(self, state: str, error: Optional[str] = None) -> None:
+        """Updates the directory state, the dynamic property and the tool tip."""
+        self._path_error = error
+        self.setToolTip(error or "")
+        if state == self._path_state:
+            return
+        self._path_state = state
+        # Re-polish to apply the style sheet rules of the new state
+        self.setProperty("path_state", state)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.path_state_changed.emit(state)
+
+    @property
+    def path_state(self) -> str:
+        """Returns the state of the directory, unchecked, pending, ok or error."""
+        return self._path_state
+
+    @property
+    def path_error(self) -> Optional[str]:
+        """Returns the error message of the last failed check, or None."""
+        return self._path_error
+
 
 class URIInputBox(InputBox):
     """
@@ -158,7 +226,7 @@ class URIInputBox(InputBox):
 
         if validate_uri:
             # Set the URI event filter
-            self._uri_filter = URIParseEventFilter()
+            self._uri_filter = URIParseEventFilter.shared()
             self.installEventFilter(self._uri_filter)
 
 
@@ -182,7 +250,7 @@ class IPv4InputBox(InputBox):
         self.setValidator(validator)
 
         # Set the IPv4 event filter
-        self._ipv4_filter = IPv4EventFilter()
+        self._ipv4_filter = IPv4EventFilter.shared()
         self.installEventFilter(self._ipv4_filter)
 
 
@@ -211,7 +279,7 @@ class MultiFloatInputBox(InputBox):
         self.setValidator(validator)
 
         # Set the multi float event filter
-        self._multi_float_filter = MultiFloatEventFilter()
+        self._multi_float_filter = MultiFloatEventFilter.shared()
         self.installEventFilter(self._multi_float_filter)
 
 
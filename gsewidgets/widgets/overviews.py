@@ -0,0 +1,380 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: overviews.py
+# Description: Implementation of overview widgets for the collection points.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import numpy as np
+from qtpy.QtCore import QSize, Qt, QPointF, QRectF, Signal
+from qtpy.QtGui import (
+    QColor,
+    QImage,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPalette,
+    QPen,
+    QWheelEvent,
+)
+from qtpy.QtWidgets import QWidget
+from typing import Optional
+
+from gsewidgets.models.collection_points import CollectionPointsModel
+from gsewidgets.widgets.performance import performance_mode
+from gsewidgets.widgets.tables import XYZCollectionPointsTable
+
+__all__ = ["CollectionPointsOverview"]
+
+# Axes pairs of the flat projections
+_PLANES = {"xy": (0, 1), "xz": (0, 2), "yz": (1, 2)}
+
+
+class CollectionPointsOverview(QWidget):
+    """
+    Used to create instances of scatter overviews of the collection points. Individual markers are
+    drawn when zoomed in, and the points are aggregated into a density image when zoomed out.
+    """
+
+    point_selected: Signal = Signal(int)
+
+    def __init__(
+        self,
+        table: Optional[XYZCollectionPointsTable] = None,
+        model: Optional[CollectionPointsModel] = None,
+        projection: Optional[str] = "xy",
+        size: Optional[QSize] = None,
+        object_name: Optional[str] = "points-overview",
+        active_color: Optional[QColor] = QColor(45, 200, 20),
+        inactive_color: Optional[QColor] = QColor(150, 150, 150),
+        selection_color: Optional[QColor] = QColor(255, 140, 0),
+        point_radius: Optional[float] = 3.0,
+        lod_threshold: Optional[int] = 2000,
+        lod_cell_size: Optional[int] = 2,
+    ) -> None:
+        super(CollectionPointsOverview, self).__init__()
+
+        if model is None:
+            if table is None:
+                raise ValueError("A table or a collection points model is required.")
+            model = table.points_model
+
+        self._table = table
+        self._model = model
+        self._projection = projection
+        self._size = size
+        self._object_name = object_name
+        self._active_color = QColor(active_color)
+        self._inactive_color = QColor(inactive_color)
+        self._selection_color = QColor(selection_color)
+        self._point_radius = point_radius
+        self._lod_threshold = lod_threshold
+        self._lod_cell_size = lod_cell_size
+
+        self._yaw: float = 30.0
+        self._pitch: float = 30.0
+        self._scale: float = 1.0
+        self._center = np.zeros(2, dtype=np.float64)
+        self._auto_fit: bool = True
+        self._selected_index: int = -1
+        self._projected: Optional[np.ndarray] = None
+        self._press_position: Optional[QPointF] = None
+        self._last_position: Optional[QPointF] = None
+        self._dragged: bool = False
+
+        # Run configuration
+        self._configure_overview()
+
+    def _configure_overview(self) -> None:
+        """Basic configuration of the overview widget."""
+        if self._projection not in _PLANES and self._projection != "3d":
+            raise ValueError("The projection must be one of 'xy', 'xz', 'yz' or '3d'.")
+
+        # Set the size
+        if self._size is not None:
+            self.setFixedSize(self._size)
+
+        # Set the object name
+        if self._object_name is not None:
+            self.setObjectName(self._object_name)
+
+        self.setMouseTracking(False)
+        # Listen for changes of the collection points. The model holds the listener weakly, so
+        # a dropped overview can still be collected
+        self._model.add_listener(self._points_changed)
+        # Synchronize the selection with the table
+        if self._table is not None:
+            self._table.currentCellChanged.connect(self._table_selection_changed)
+            self.point_selected.connect(self._table.selectRow)
+
+    def _points_changed(self, notification: str, indices: np.ndarray) -> None:
+        """Drops the cached projection and schedules a repaint."""
+        self._projected = None
+        if self._selected_index >= len(self._model):
+            self._selected_index = -1
+        if self._auto_fit:
+            self.fit_to_points()
+        self.update()
+
+    def _table_selection_changed(self, row: int, *_) -> None:
+        """Highlights the point of the current table row."""
+        if row != self._selected_index:
+            self._selected_index = row
+            self.update()
+
+    def _projection_matrix(self) -> np.ndarray:
+        """Returns the (3, 2) matrix that projects the positions on the screen plane."""
+        if self._projection in _PLANES:
+            matrix = np.zeros((3, 2), dtype=np.float64)
+            horizontal, vertical = _PLANES[self._projection]
+            matrix[horizontal, 0] = 1
+            matrix[vertical, 1] = 1
+            return matrix
+
+        # Rotate around z (yaw) and then around x (pitch)
+        yaw, pitch = np.radians(self._yaw), np.radians(self._pitch)
+        rotation_z = np.array(
+            [
+                [np.cos(yaw), -np.sin(yaw), 0],
+                [np.sin(yaw), np.cos(yaw), 0],
+                [0, 0, 1],
+            ]
+        )
+        rotation_x = np.array(
+            [
+                [1, 0, 0],
+                [0, np.cos(pitch), -np.sin(pitch)],
+                [0, np.sin(pitch), np.cos(pitch)],
+            ]
+        )
+        rotation = rotation_x @ rotation_z
+        # Screen x follows the rotated x axis and screen y the rotated z axis
+        return rotation[[0, 2], :].T
+
+    def _projected_points(self) -> np.ndarray:
+        """Returns the cached (N, 2) projected positions of the points."""
+        if self._projected is None:
+            self._projected = self._model.positions @ self._projection_matrix()
+        return self._projected
+
+    def _screen_points(self) -> np.ndarray:
+        """Returns the (N, 2) pixel positions of the points."""
+        screen = (self._projected_points() - self._center) * self._scale
+        screen[:, 0] += self.width() / 2
+        # Flip the vertical axis so that positive values point up
+        screen[:, 1] = self.height() / 2 - screen[:, 1]
+        return screen
+
+    def fit_to_points(self) -> None:
+        """Centers and scales the view to show all the points."""
+        projected = self._projected_points()
+        if not projected.shape[0]:
+            return
+        minimum, maximum = projected.min(axis=0), projected.max(axis=0)
+        self._center = (minimum + maximum) / 2
+        extent = np.maximum(maximum - minimum, 1e-9)
+        margin = 2 * self._point_radius + 10
+        self._scale = float(
+            min(
+                max(self.width() - margin, 1) / extent[0],
+                max(self.height() - margin, 1) / extent[1],
+            )
+        )
+        self.update()
+
+    def set_projection(self, projection: str) -> None:
+        """Sets the projection to one of the 'xy', 'xz', 'yz' planes or to a rotatable '3d' view."""
+        if projection not in _PLANES and projection != "3d":
+            raise ValueError("The projection must be one of 'xy', 'xz', 'yz' or '3d'.")
+        self._projection = projection
+        self._projected = None
+        self.fit_to_points()
+
+    def set_rotation(self, yaw: float, pitch: float) -> None:
+        """Sets the rotation angles in degrees, used by the '3d' projection."""
+        self._yaw = yaw
+        self._pitch = pitch
+        self._projected = None
+        self.update()
+
+    def select_point(self, index: int) -> None:
+        """Highlights a point and emits the point_selected signal."""
+        self._selected_index = index
+        self.update()
+        self.point_selected.emit(index)
+
+    def sizeHint(self) -> QSize:
+        return QSize(400, 300)
+
+    def resizeEvent(self, event) -> None:
+        if self._auto_fit:
+            self.fit_to_points()
+        super(CollectionPointsOverview, self).resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().color(QPalette.ColorRole.Base))
+
+        if len(self._model):
+            screen = self._screen_points()
+            # Cull the points outside the widget
+            visible = np.flatnonzero(
+                (screen[:, 0] >= 0)
+                & (screen[:, 0] < self.width())
+                & (screen[:, 1] >= 0)
+                & (screen[:, 1] < self.height())
+            )
+            enabled = self._model.enabled[visible]
+            if visible.size > self._lod_threshold:
+                self._paint_aggregated(painter, screen[visible], enabled)
+            else:
+                self._paint_markers(painter, screen[visible], enabled)
+            self._paint_selection(painter, screen)
+
+        painter.end()
+
+    def _paint_markers(
+        self, painter: QPainter, screen: np.ndarray, enabled: np.ndarray
+    ) -> None:
+        """Draws a marker for every visible point."""
+        painter.setRenderHint(QPainter.Antialiasing, not performance_mode())
+        painter.setPen(Qt.PenStyle.NoPen)
+        radius = self._point_radius
+        for color, mask in (
+            (self._inactive_color, ~enabled),
+            (self._active_color, enabled),
+        ):
+            painter.setBrush(color)
+            for x, y in screen[mask].tolist():
+                painter.drawEllipse(QPointF(x, y), radius, radius)
+
+    def _paint_aggregated(
+        self, painter: QPainter, screen: np.ndarray, enabled: np.ndarray
+    ) -> None:
+        """Draws the visible points as a density image with one pixel block per cell."""
+        cell = self._lod_cell_size
+        columns = self.width() // cell + 1
+        rows = self.height() // cell + 1
+        bins = (screen[:, 1] // cell).astype(np.int64) * columns + (
+            screen[:, 0] // cell
+        ).astype(np.int64)
+        counts = np.bincount(bins, minlength=rows * columns)
+        enabled_counts = np.bincount(bins[enabled], minlength=rows * columns)
+
+        # Cells with at least one enabled point use the active color
+        pixels = np.where(
+            enabled_counts > 0,
+            np.uint32(self._active_color.rgb() & 0xFFFFFF),
+            np.uint32(self._inactive_color.rgb() & 0xFFFFFF),
+        ).astype(np.uint32)
+        # Scale the opacity with the logarithm of the number of points in each cell
+        occupied = counts > 0
+        alpha = np.zeros(counts.shape, dtype=np.uint32)
+        alpha[occupied] = (
+            96 + 159 * np.log1p(counts[occupied]) / np.log1p(counts.max())
+        ).astype(np.uint32)
+        pixels |= alpha << 24
+
+        buffer = pixels.tobytes()
+        image = QImage(buffer, columns, rows, columns * 4, QImage.Format.Format_ARGB32)
+        painter.drawImage(QRectF(0, 0, columns * cell, rows * cell), image)
+
+    def _paint_selection(self, painter: QPainter, screen: np.ndarray) -> None:
+        """Draws a ring around the selected point."""
+        if not 0 <= self._selected_index < screen.shape[0]:
+            return
+        painter.setRenderHint(QPainter.Antialiasing, not performance_mode())
+        painter.setPen(QPen(self._selection_color, 2))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        x, y = screen[self._selected_index]
+        radius = self._point_radius + 3
+        painter.drawEllipse(QPointF(x, y), radius, radius)
+
+    def _nearest_point(self, position: QPointF) -> int:
+        """Returns the index of the point closest to the given position, or -1 if none is close enough."""
+        if not len(self._model):
+            return -1
+        screen = self._screen_points()
+        distances = (screen[:, 0] - position.x()) ** 2 + (
+            screen[:, 1] - position.y()
+        ) ** 2
+        index = int(np.argmin(distances))
+        if distances[index] > (self._point_radius + 4) ** 2:
+            return -1
+        return index
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        self._press_position = event.position()
+        self._last_position = event.position()
+        self._dragged = False
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self._last_position is None:
+            return
+        delta = event.position() - self._last_position
+        self._last_position = event.position()
+        if (event.position() - self._press_position).manhattanLength() > 3:
+            self._dragged = True
+        if not self._dragged:
+            return
+
+        if event.buttons() & Qt.MouseButton.RightButton and self._projection == "3d":
+            # Rotate the 3d view
+            self.set_rotation(
+                self._yaw + 0.5 * delta.x(),
+                float(np.clip(self._pitch + 0.5 * delta.y(), -90, 90)),
+            )
+        else:
+            # Pan the view
+            self._auto_fit = False
+            self._center -= np.array([delta.x(), -delta.y()]) / self._scale
+            self.update()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if not self._dragged and event.button() == Qt.MouseButton.LeftButton:
+            index = self._nearest_point(event.position())
+            if index >= 0:
+                self.select_point(index)
+        self._press_position = None
+        self._last_position = None
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        # Go back to the automatic fit
+        self._auto_fit = True
+        self.fit_to_points()
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        # Zoom around the cursor position
+        self._auto_fit = False
+        factor = 1.0015 ** event.angleDelta().y()
+        position = event.position()
+        anchor = np.array(
+            [position.x() - self.width() / 2, self.height() / 2 - position.y()]
+        )
+        self._center += anchor / self._scale - anchor / (self._scale * factor)
+        self._scale *= factor
+        self.update()
+
+    @property
+    def selected_index(self) -> int:
+        """Returns the index of the highlighted point, or -1 if there is no selection."""
+        return self._selected_index
@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+# ------------------------------------------------------------------------------
+# Script Name: performance.py
+# Description: Library wide performance mode for slow and remote displays.
+#
+# License: GNU General Public License v3.0
+# ------------------------------------------------------------------------------
+# GSEWidgets - Collection of gui widgets to be used in GSE software.
+# Author: Christofanis Skordas (skordasc@uchicago.edu)
+# Copyright (C) 2022-2025 GSECARS, The University of Chicago
+# Copyright (C) 2024-2025 NSF SEES, Synchrotron Earth and Environmental Science
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+
+import os
+from typing import Callable
+
+__all__ = [
+    "PERFORMANCE_MODE_VARIABLE",
+    "PERFORMANCE_MODE_FRAME_RATE",
+    "performance_mode",
+    "set_performance_mode",
+    "add_performance_mode_listener",
+    "remove_performance_mode_listener",
+]
+
+# Environment variable that enables the performance mode on import, e.g. GSEWIDGETS_PERFORMANCE_MODE=1
+PERFORMANCE_MODE_VARIABLE = "GSEWIDGETS_PERFORMANCE_MODE"
+# Frame rate of the live value updates while the performance mode is enabled
+PERFORMANCE_MODE_FRAME_RATE = 10
+
+_performance_mode: bool = os.environ.get(
+    PERFORMANCE_MODE_VARIABLE, ""
+).strip().lower() in ("1", "true", "yes", "on")
+_listeners: list[Callable[[bool], None]] = []
+
+
+def performance_mode() -> bool:
+    """
+    Returns whether the performance mode is enabled. In performance mode, e.g. over X11 forwarding
+    or VNC, the widgets don't animate, paint without antialiasing and apply live values at a lower
+    frame rate.
+    """
+    return _performance_mode
+
+
+def set_performance_mode(enabled: bool) -> None:
+    """Enables or disables the performance mode and notifies the listeners of a change."""
+    global _performance_mode
+    enabled = bool(enabled)
+    if enabled == _performance_mode:
+        return
+    _performance_mode = enabled
+    for listener in list(_listeners):
+        listener(enabled)
+
+
+def add_performance_mode_listener(listener: Callable[[bool], None]) -> None:
+    """Registers a callable that receives the new state when the performance mode changes."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_performance_mode_listener(listener: Callable[[bool], None]) -> None:
+    """Unregisters a previously registered listener."""
+    if listener in _listeners:
+        _listeners.remove(listener)
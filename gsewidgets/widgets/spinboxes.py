@@ -24,16 +24,82 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
-from qtpy.QtCore import QSize, Qt, QObject, Signal
-from qtpy.QtGui import QWheelEvent
-from qtpy.QtWidgets import QDoubleSpinBox, QAbstractSpinBox
-from typing import Optional
+import math
+import re
+import threading
+import time
+import numpy as np
+from collections import deque
+from functools import lru_cache, partial
+from qtpy.QtCore import QCoreApplication, QSize, Qt, QObject, QThread, QTimer, Signal
+from qtpy.QtGui import QKeyEvent, QWheelEvent
+from qtpy.QtWidgets import QDoubleSpinBox, QAbstractSpinBox, QWidget
+from typing import Callable, Optional, Sequence, Union
 
-__all__ = ["NumericSpinBox", "NoWheelNumericSpinBox", "NumericDataSpinBoxModel"]
+from gsewidgets.models.numeric import (
+    NumericDataModel,
+    NumericDataArrayModel,
+    VALUES_CHANGED,
+    LIMITS_CHANGED,
+)
+from gsewidgets.models.units import UnitFamily, LENGTH_UNITS
+from gsewidgets.widgets.performance import (
+    PERFORMANCE_MODE_FRAME_RATE,
+    performance_mode,
+    add_performance_mode_listener,
+)
+
+__all__ = [
+    "NumericSpinBoxValueError",
+    "NumericSpinBox",
+    "NoWheelNumericSpinBox",
+    "NumericDataSpinBoxModel",
+    "NumericSpinBoxArrayBinding",
+    "LiveValueUpdater",
+    "NumericSpinBoxGroup",
+    "UnitNumericDataSpinBoxModel",
+    "UnitNumericSpinBox",
+]
+
+# Plain decimal numbers, that are parsed without the locale
+_NUMERIC_TEXT = re.compile(r"-?(?:[0-9]+\.?[0-9]*|\.[0-9]+)")
+
+
+@lru_cache(maxsize=4096)
+def _format_value(value: float, precision: int) -> str:
+    """Formats a finite value with the same output as the C locale QLocale.toString(value, "f")."""
+    text = f"{value:.{precision}f}"
+    # Qt rounds exact ties away from zero, while Python rounds them to even
+    numerator, denominator = abs(value).as_integer_ratio()
+    scaled = numerator * 10**precision
+    if denominator > 1 and not (2 * scaled) % denominator and scaled % denominator:
+        digits = str(scaled // denominator + 1).rjust(precision + 1, "0")
+        if precision:
+            digits = f"{digits[:-precision]}.{digits[-precision:]}"
+        text = f"-{digits}" if value < 0 else digits
+    # Qt doesn't show the sign of negative zero
+    if value == 0:
+        text = text.lstrip("-")
+    return text
+
+
+class NumericSpinBoxValueError(ValueError):
+    """Raised with all the invalid values given to a numeric spinbox."""
+
+    def __init__(self, errors: Sequence[str]) -> None:
+        super(NumericSpinBoxValueError, self).__init__(" ".join(errors))
+        self.errors = list(errors)
 
 
 class NumericSpinBox(QDoubleSpinBox):
-    """Used to create instances of numeric only spin boxes, without arrow buttons."""
+    """
+    Used to create instances of numeric only spin boxes, without arrow buttons. Holding a step key
+    can accelerate the steps, and throttled_value_changed delivers a limited number of values per
+    second, always including the final value. With deferred set, all the values are checked before
+    any is applied, all the errors are raised together and the values are applied in one update.
+    """
+
+    throttled_value_changed: Signal = Signal(float)
 
     def __init__(
         self,
@@ -44,6 +110,7 @@ class NumericSpinBox(QDoubleSpinBox):
         precision: Optional[int] = 0,
         size: Optional[QSize] = None,
         object_name: Optional[str] = "numeric-spinbox",
+        deferred: Optional[bool] = False,
     ) -> None:
         super(NumericSpinBox, self).__init__()
 
@@ -54,12 +121,68 @@ class NumericSpinBox(QDoubleSpinBox):
         self._precision = precision
         self._size = size
         self._object_name = object_name
+        self._deferred = deferred
+        self._data_model: Optional[
+            Union["NumericDataSpinBoxModel", NumericDataModel]
+        ] = None
+        self._updating_from_data_model: bool = False
+        self._live_value_updater: Optional["LiveValueUpdater"] = None
+        self._fast_formatting: bool = False
+        # Step acceleration
+        self._step_acceleration: bool = False
+        self._steps_per_doubling: int = 8
+        self._max_step_multiplier: int = 16
+        self._held_steps: int = 0
+        self._last_step_time: float = 0.0
+        self._last_step_direction: int = 0
+        # Emission throttle, the timer is only created when a rate is set
+        self._throttle_timer: Optional[QTimer] = None
+        self._throttle_pending: bool = False
+        self._last_throttled_value: Optional[float] = None
 
         # Run configuration
         self._configure_numeric_spinbox()
 
     def _configure_numeric_spinbox(self) -> None:
         """Basic configuration for the numeric spinbox."""
+        if self._deferred:
+            self.set_values(
+                min_value=self._min_value,
+                max_value=self._max_value,
+                value=self._default_value,
+                incremental_step=self._incremental_step,
+                precision=self._precision,
+            )
+        else:
+            self._apply_values_sequentially()
+
+        # Format and parse plain numbers in Python, unless the locale needs Qt
+        locale = self.locale()
+        self._fast_formatting = (
+            locale.decimalPoint() == "."
+            and locale.negativeSign() == "-"
+            and not self.isGroupSeparatorShown()
+        )
+
+        # Set the object name
+        if self._object_name is not None:
+            self.setObjectName(self._object_name)
+
+        # Align to center
+        self.setAlignment(Qt.AlignCenter)
+
+        # Disable buttons
+        self.setButtonSymbols(QAbstractSpinBox.NoButtons)
+
+        # Connect lineedit
+        self.lineEdit().returnPressed.connect(self._return_pressed_event)
+
+        # Relay the value changes until an emission rate is set
+        self.valueChanged.connect(self.throttled_value_changed)
+        self.editingFinished.connect(self.flush_throttled_value)
+
+    def _apply_values_sequentially(self) -> None:
+        """Checks and applies the values one at a time, raising the first error found."""
         # Check for valid min and max
         if self._min_value >= self._max_value:
             raise ValueError("The min value must be lower than the max value.")
@@ -93,23 +216,350 @@ class NumericSpinBox(QDoubleSpinBox):
         # Set the precision
         self.setDecimals(self._precision)
 
-        # Set the object name
-        if self._object_name is not None:
-            self.setObjectName(self._object_name)
+    @staticmethod
+    def validate_values(
+        min_value: float,
+        max_value: float,
+        value: float,
+        incremental_step: float,
+        precision: int,
+    ) -> list[str]:
+        """Returns the errors of all the invalid values, or an empty list if all are valid."""
+        errors = []
+        if min_value >= max_value:
+            errors.append("The min value must be lower than the max value.")
+        elif value > max_value or value < min_value:
+            errors.append(
+                "The default value must be within the range of the acceptable values for the spinbox."
+            )
+        if incremental_step > abs(max_value - min_value) / 3:
+            errors.append(
+                "The incremental step given must be maximum 1/3 of the total range of the spinbox."
+            )
+        if precision < 0:
+            errors.append("Precision value can't be lesser than 0.")
+        return errors
 
-        # Align to center
-        self.setAlignment(Qt.AlignCenter)
+    def set_values(
+        self,
+        min_value: float,
+        max_value: float,
+        value: float,
+        incremental_step: float,
+        precision: int,
+    ) -> None:
+        """
+        Checks all the values first and raises a NumericSpinBoxValueError with every error found.
+        The valid values are applied in one update, with a single repaint, and valueChanged is
+        emitted once if the value changed.
+        """
+        errors = self.validate_values(
+            min_value, max_value, value, incremental_step, precision
+        )
+        if errors:
+            raise NumericSpinBoxValueError(errors)
 
-        # Disable buttons
-        self.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self._min_value = min_value
+        self._max_value = max_value
+        self._incremental_step = incremental_step
+        previous_value = self.value()
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        signals_blocked = self.blockSignals(True)
+        try:
+            # Qt formats the text again on every call, the order keeps the number of formats low
+            # and sets the precision before the value, so the value is not rounded
+            self.setRange(min_value, max_value)
+            self.setDecimals(precision)
+            self.setSingleStep(incremental_step)
+            self.setValue(value)
+        finally:
+            self.blockSignals(signals_blocked)
+            self.setUpdatesEnabled(updates_enabled)
 
-        # Connect lineedit
-        self.lineEdit().returnPressed.connect(self._return_pressed_event)
+        if self.value() != previous_value:
+            self.valueChanged.emit(self.value())
 
     def _return_pressed_event(self) -> None:
         """Clears the focus state of the spinbox."""
         self.clearFocus()
 
+    def set_step_acceleration(
+        self,
+        enabled: Optional[bool] = True,
+        steps_per_doubling: Optional[int] = 8,
+        max_multiplier: Optional[int] = 16,
+    ) -> None:
+        """
+        Enables the step acceleration. While a step key is held, the step size doubles after every
+        steps_per_doubling repeated steps, up to max_multiplier times the incremental step.
+        """
+        if steps_per_doubling < 1 or max_multiplier < 1:
+            raise ValueError("The acceleration values must be at least 1.")
+        self._step_acceleration = enabled
+        self._steps_per_doubling = steps_per_doubling
+        self._max_step_multiplier = max_multiplier
+        self._held_steps = 0
+
+    def stepBy(self, steps: int) -> None:
+        """Steps the value, with a growing step size while the step key is held."""
+        if self._step_acceleration:
+            now = time.monotonic()
+            direction = 1 if steps > 0 else -1
+            # Key repeats arrive every ~30 ms, a longer pause starts a new hold
+            if (
+                direction == self._last_step_direction
+                and now - self._last_step_time < 0.2
+            ):
+                self._held_steps += 1
+            else:
+                self._held_steps = 0
+            self._last_step_time = now
+            self._last_step_direction = direction
+            steps *= min(
+                2 ** (self._held_steps // self._steps_per_doubling),
+                self._max_step_multiplier,
+            )
+        super(NumericSpinBox, self).stepBy(steps)
+
+    def keyReleaseEvent(self, event: QKeyEvent) -> None:
+        """Ends the step acceleration and delivers the final value when a key is released."""
+        super(NumericSpinBox, self).keyReleaseEvent(event)
+        if not event.isAutoRepeat():
+            self._held_steps = 0
+            self._last_step_direction = 0
+            self.flush_throttled_value()
+
+    def set_emission_rate(self, rate: Optional[float]) -> None:
+        """
+        Limits throttled_value_changed to the given number of values per second. None emits every
+        value change.
+        """
+        if rate is None:
+            if self._throttle_timer is not None:
+                self.flush_throttled_value()
+                self.valueChanged.disconnect(self._throttle_value_changed)
+                self.valueChanged.connect(self.throttled_value_changed)
+                self._throttle_timer.deleteLater()
+                self._throttle_timer = None
+            return
+        if rate <= 0:
+            raise ValueError("The emission rate must be greater than 0.")
+        if self._throttle_timer is None:
+            self._throttle_timer = QTimer(self)
+            self._throttle_timer.setSingleShot(True)
+            self._throttle_timer.timeout.connect(self._throttle_timeout)
+            self._last_throttled_value = self.value()
+            self.valueChanged.disconnect(self.throttled_value_changed)
+            self.valueChanged.connect(self._throttle_value_changed)
+        self._throttle_timer.setInterval(max(1, round(1000 / rate)))
+
+    def _throttle_value_changed(self, value: float) -> None:
+        """Emits the first value at once, and keeps the next ones until the interval passes."""
+        timer = self._throttle_timer
+        if timer.isActive():
+            self._throttle_pending = True
+        else:
+            self._emit_throttled_value(value)
+            timer.start()
+
+    def _throttle_timeout(self) -> None:
+        """Emits the latest value kept during the interval."""
+        if self._throttle_pending:
+            self._throttle_pending = False
+            self._emit_throttled_value(self.value())
+            self._throttle_timer.start()
+
+    def flush_throttled_value(self) -> None:
+        """Emits the latest value now, if it is still kept by the throttle."""
+        if self._throttle_pending:
+            self._throttle_pending = False
+            self._emit_throttled_value(self.value())
+
+    def _emit_throttled_value(self, value: float) -> None:
+        """Emits a throttled value, unless it was the last emitted value."""
+        if value != self._last_throttled_value:
+            self._last_throttled_value = value
+            self.throttled_value_changed.emit(value)
+
+    def setDecimals(self, precision: int) -> None:
+        """Sets the precision and keeps it for the formatting of the values."""
+        super(NumericSpinBox, self).setDecimals(precision)
+        self._precision = self.decimals()
+
+    def textFromValue(self, value: float) -> str:
+        """Returns the text of a value, from a cache of the recently formatted values."""
+        if self._fast_formatting and math.isfinite(value):
+            return _format_value(value, self._precision)
+        return super(NumericSpinBox, self).textFromValue(value)
+
+    def valueFromText(self, text: str) -> float:
+        """
+        Returns the value of a text, parsing plain numbers without the locale. Texts with more
+        decimals than the precision or out of range values are left to Qt.
+        """
+        if (
+            self._fast_formatting
+            and _NUMERIC_TEXT.fullmatch(text)
+            and len(text.partition(".")[2]) <= self._precision
+        ):
+            value = float(text)
+            if self.minimum() <= value <= self.maximum():
+                return value
+        return super(NumericSpinBox, self).valueFromText(text)
+
+    def bind_data_model(
+        self, data: Union["NumericDataSpinBoxModel", NumericDataModel]
+    ) -> None:
+        """
+        Binds the spinbox to a NumericDataSpinBoxModel or a NumericDataModel. Range, value and
+        precision changes of the model are applied to the spinbox, and values changed in the
+        spinbox are written to the model.
+        """
+        self.unbind_data_model()
+        self._data_model = data
+        if isinstance(data, NumericDataSpinBoxModel):
+            data.spinbox_min_max_changed.connect(self._data_model_min_max_changed)
+            data.spinbox_value_changed.connect(self._data_model_value_changed)
+            data.spinbox_precision_changed.connect(self._data_model_precision_changed)
+        else:
+            # The model holds the observer weakly, so a dropped spinbox can still be collected
+            data.add_observer(self._data_model_updated)
+        self.valueChanged.connect(self._update_data_model_value)
+        # Start from the current values of the model
+        self._data_model_updated(data)
+
+    def unbind_data_model(self) -> None:
+        """Stops the synchronization with the bound data model."""
+        data = self._data_model
+        if data is None:
+            return
+        if isinstance(data, NumericDataSpinBoxModel):
+            data.spinbox_min_max_changed.disconnect(self._data_model_min_max_changed)
+            data.spinbox_value_changed.disconnect(self._data_model_value_changed)
+            data.spinbox_precision_changed.disconnect(
+                self._data_model_precision_changed
+            )
+        else:
+            data.remove_observer(self._data_model_updated)
+        self.valueChanged.disconnect(self._update_data_model_value)
+        self._data_model = None
+
+    def _data_model_min_max_changed(self, new_min: float, new_max: float) -> None:
+        """Applies the range of the bound data model."""
+        if new_min == self.minimum() and new_max == self.maximum():
+            return
+        self._updating_from_data_model = True
+        try:
+            self.setRange(new_min, new_max)
+        finally:
+            self._updating_from_data_model = False
+
+    def _data_model_value_changed(self, new_value: float) -> None:
+        """Applies the current value of the bound data model."""
+        if new_value == self.value():
+            return
+        self._updating_from_data_model = True
+        try:
+            self.setValue(new_value)
+        finally:
+            self._updating_from_data_model = False
+
+    def _data_model_precision_changed(self, new_precision: int) -> None:
+        """Applies the precision of the bound data model."""
+        if new_precision == self.decimals():
+            return
+        self._updating_from_data_model = True
+        try:
+            self.setDecimals(new_precision)
+        finally:
+            self._updating_from_data_model = False
+
+    def _data_model_updated(
+        self, data: Union["NumericDataSpinBoxModel", NumericDataModel]
+    ) -> None:
+        """Applies all the values of the bound data model."""
+        self._data_model_precision_changed(data.precision)
+        self._data_model_min_max_changed(data.min_value, data.max_value)
+        self._data_model_value_changed(data.current_value)
+
+    def _update_data_model_value(self, value: float) -> None:
+        """Writes a value changed in the spinbox to the bound data model."""
+        data = self._data_model
+        if self._updating_from_data_model or data is None:
+            return
+        if value == data.current_value:
+            return
+        self._updating_from_data_model = True
+        try:
+            if isinstance(data, NumericDataSpinBoxModel):
+                data.spinbox_value_changed.emit(value)
+            else:
+                data.update_value(value)
+        finally:
+            self._updating_from_data_model = False
+
+    def enable_live_updates(self) -> None:
+        """
+        Registers the spinbox to the shared LiveValueUpdater, used by post_live_value. Must be
+        called on the GUI thread.
+        """
+        self._live_value_updater = LiveValueUpdater.instance()
+        self._live_value_updater.register(self)
+
+    def disable_live_updates(self) -> None:
+        """Unregisters the spinbox from the shared LiveValueUpdater."""
+        if self._live_value_updater is not None:
+            self._live_value_updater.unregister(self)
+            self._live_value_updater = None
+
+    def post_live_value(self, value: float) -> None:
+        """
+        Queues a live value, e.g. a motor readback. Can be called from any thread, only the latest
+        value is applied on the next frame and it is kept while the user edits the spinbox.
+        """
+        updater = self._live_value_updater
+        if updater is None:
+            raise RuntimeError(
+                "The live updates are disabled, call enable_live_updates first."
+            )
+        updater.post(self, value)
+
+    def _apply_live_value(self, value: float) -> None:
+        """Shows a live value, without writing it back to the bound data model."""
+        if value == self.value():
+            return
+        self._updating_from_data_model = True
+        try:
+            self.setValue(value)
+        finally:
+            self._updating_from_data_model = False
+
+    @classmethod
+    def from_data_model(
+        cls,
+        data: Union["NumericDataSpinBoxModel", NumericDataModel],
+        size: Optional[QSize] = None,
+        object_name: Optional[str] = "numeric-spinbox",
+        bind: Optional[bool] = False,
+    ) -> "NumericSpinBox":
+        """
+        Creates a spinbox from the values of a NumericDataSpinBoxModel or a NumericDataModel, and
+        optionally keeps it bound to the model.
+        """
+        spinbox = cls(
+            min_value=data.min_value,
+            max_value=data.max_value,
+            default_value=data.current_value,
+            incremental_step=data.incremental_step,
+            precision=data.precision,
+            size=size,
+            object_name=object_name,
+        )
+        if bind:
+            spinbox.bind_data_model(data)
+        return spinbox
+
 
 class NoWheelNumericSpinBox(NumericSpinBox):
     """Used to create instances of NumericSpinBox that ignore all mouse wheel events."""
@@ -123,6 +573,7 @@ class NoWheelNumericSpinBox(NumericSpinBox):
         precision: Optional[int] = 0,
         size: Optional[QSize] = None,
         object_name: Optional[str] = "numeric-spinbox",
+        deferred: Optional[bool] = False,
     ):
         super(NoWheelNumericSpinBox, self).__init__(
             min_value=min_value,
@@ -132,6 +583,7 @@ class NoWheelNumericSpinBox(NumericSpinBox):
             precision=precision,
             size=size,
             object_name=object_name,
+            deferred=deferred,
         )
 
     def wheelEvent(self, event: QWheelEvent) -> None:
@@ -143,11 +595,13 @@ class NoWheelNumericSpinBox(NumericSpinBox):
 class NumericDataSpinBoxModel(QObject):
     """
     Simple numeric data model for use in the creation of a spinbox.
-    Emit the min_max and the value to update the numeric data spinbox model values.
+    Emit the min_max, the value and the precision to update the numeric data spinbox model values,
+    and any spinbox bound to the model with NumericSpinBox.bind_data_model.
     """
 
     spinbox_min_max_changed: Signal = Signal(float, float)
     spinbox_value_changed: Signal = Signal(float)
+    spinbox_precision_changed: Signal = Signal(int)
 
     def __init__(
         self,
@@ -168,15 +622,21 @@ class NumericDataSpinBoxModel(QObject):
         # Connect signals
         self.spinbox_min_max_changed.connect(self._update_min_max)
         self.spinbox_value_changed.connect(self._update_current_value)
+        self.spinbox_precision_changed.connect(self._update_precision)
 
     def _update_current_value(self, new_value: float) -> None:
         """Updates the current value with the emitted value."""
         self._current_value = new_value
 
     def _update_min_max(self, new_min: float, new_max: float) -> None:
-        """Updates the min and max values with the emitted values."""
+        """Updates the min and max values with the emitted values and clamps the current value."""
         self._min_value = new_min
         self._max_value = new_max
+        self._current_value = min(max(self._current_value, new_min), new_max)
+
+    def _update_precision(self, new_precision: int) -> None:
+        """Updates the precision with the emitted value."""
+        self._precision = new_precision
 
     @property
     def min_value(self) -> float:
@@ -202,3 +662,657 @@ class NumericDataSpinBoxModel(QObject):
     def precision(self) -> int:
         """Returns the precision value."""
         return self._precision
+
+
+class NumericSpinBoxArrayBinding(QObject):
+    """
+    Binds a list of spinboxes to the entries of a NumericDataArrayModel. Only the spinboxes of the
+    entries that changed are refreshed, and values typed in a spinbox are written to the model.
+    """
+
+    values_changed: Signal = Signal(object)
+
+    def __init__(
+        self,
+        model: NumericDataArrayModel,
+        spinboxes: Optional[Sequence[NumericSpinBox]] = None,
+        size: Optional[QSize] = None,
+        no_wheel: Optional[bool] = False,
+    ) -> None:
+        super(NumericSpinBoxArrayBinding, self).__init__()
+
+        self._model = model
+        self._spinboxes = list(spinboxes) if spinboxes is not None else None
+        self._size = size
+        self._no_wheel = no_wheel
+        self._updating_from_model = False
+
+        # Run configuration
+        self._configure_array_binding()
+
+    def _configure_array_binding(self) -> None:
+        """Creates the missing spinboxes and connects them to the model."""
+        if self._spinboxes is None:
+            spinbox_class = NoWheelNumericSpinBox if self._no_wheel else NumericSpinBox
+            self._spinboxes = [
+                spinbox_class.from_data_model(
+                    self._model.data_model(index), size=self._size
+                )
+                for index in range(len(self._model))
+            ]
+        elif len(self._spinboxes) != len(self._model):
+            raise ValueError("The number of spinboxes must match the model entries.")
+
+        for index, spinbox in enumerate(self._spinboxes):
+            spinbox.valueChanged.connect(
+                lambda value, index=index: self._spinbox_value_changed(index, value)
+            )
+
+        self._model.add_listener(self._model_changed)
+
+    def _spinbox_value_changed(self, index: int, value: float) -> None:
+        """Writes a value changed from a spinbox to the model."""
+        if not self._updating_from_model:
+            self._model.update_values(index, value)
+
+    def _model_changed(self, notification: str, indices: np.ndarray) -> None:
+        """Refreshes the spinboxes of the entries that changed in the model."""
+        self._updating_from_model = True
+        try:
+            if notification == VALUES_CHANGED:
+                values = self._model.current_values[indices]
+                for index, value in zip(indices.tolist(), values.tolist()):
+                    self._spinboxes[index].setValue(value)
+            elif notification == LIMITS_CHANGED:
+                min_values = self._model.min_values[indices]
+                max_values = self._model.max_values[indices]
+                for index, min_value, max_value in zip(
+                    indices.tolist(), min_values.tolist(), max_values.tolist()
+                ):
+                    self._spinboxes[index].setRange(min_value, max_value)
+        finally:
+            self._updating_from_model = False
+
+        if notification == VALUES_CHANGED:
+            self.values_changed.emit(indices)
+
+    def unbind(self) -> None:
+        """Stops listening to the model notifications."""
+        self._model.remove_listener(self._model_changed)
+
+    @property
+    def model(self) -> NumericDataArrayModel:
+        """Returns the array model."""
+        return self._model
+
+    @property
+    def spinboxes(self) -> list[NumericSpinBox]:
+        """Returns the bound spinboxes."""
+        return self._spinboxes
+
+
+class LiveValueUpdater(QObject):
+    """
+    Applies live values to the registered spinboxes on a single timer at display frame rate. Values
+    can be posted from any thread, only the latest value of every spinbox is kept, and spinboxes
+    that have the focus keep their value until the user finishes editing. The timer only runs
+    while values are pending. Any QObject with the _apply_live_value and hasFocus methods, e.g. a
+    value source binding, can be registered. The performance mode limits the frame rate to
+    PERFORMANCE_MODE_FRAME_RATE.
+    """
+
+    _instance: Optional["LiveValueUpdater"] = None
+    # Queued to the GUI thread when a value is posted from another thread
+    _values_posted: Signal = Signal()
+
+    def __init__(self, frame_rate: Optional[float] = 60) -> None:
+        super(LiveValueUpdater, self).__init__()
+
+        self._lock = threading.Lock()
+        self._pending: dict[int, object] = {}
+        self._targets: dict[int, QObject] = {}
+        self._scheduled: bool = False
+        self._applied_values = 0
+        self._coalesced_values = 0
+        self._frame_rate = frame_rate
+        self._timer = QTimer(self)
+
+        # Run configuration
+        self._configure_live_value_updater(frame_rate)
+
+    def _configure_live_value_updater(self, frame_rate: float) -> None:
+        """Basic configuration for the frame timer."""
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._apply_pending_values)
+        self._values_posted.connect(self._start_timer)
+        self.set_frame_rate(frame_rate)
+
+    @classmethod
+    def instance(cls) -> "LiveValueUpdater":
+        """
+        Returns the shared updater. It is created on first use, which must happen on the GUI
+        thread, e.g. with enable_live_updates or a value source binding.
+        """
+        if cls._instance is None:
+            application = QCoreApplication.instance()
+            if (
+                application is None
+                or QThread.currentThread() is not application.thread()
+            ):
+                raise RuntimeError(
+                    "The shared LiveValueUpdater can only be created on the GUI thread."
+                )
+            updater = cls()
+            # Delete the updater together with the application
+            updater.setParent(application)
+            updater.destroyed.connect(cls._reset_instance)
+            cls._instance = updater
+        return cls._instance
+
+    @classmethod
+    def _reset_instance(cls) -> None:
+        """Forgets the deleted shared updater."""
+        cls._instance = None
+
+    @classmethod
+    def _performance_mode_changed(cls, enabled: bool) -> None:
+        """Applies the frame rate of the performance mode to the shared updater."""
+        if cls._instance is not None:
+            cls._instance.set_frame_rate(cls._instance._frame_rate)
+
+    def set_frame_rate(self, frame_rate: float) -> None:
+        """Sets the number of times per second the pending values are applied."""
+        if frame_rate <= 0:
+            raise ValueError("The frame rate must be greater than 0.")
+        self._frame_rate = frame_rate
+        if performance_mode():
+            frame_rate = min(frame_rate, PERFORMANCE_MODE_FRAME_RATE)
+        self._timer.setInterval(max(1, round(1000 / frame_rate)))
+
+    def register(self, target: Union[NumericSpinBox, QObject]) -> None:
+        """Adds a spinbox to the live updates."""
+        key = id(target)
+        with self._lock:
+            if key in self._targets:
+                return
+            self._targets[key] = target
+        # Bind the key alone, so the connection doesn't keep the target or the updater alive
+        target.destroyed.connect(partial(LiveValueUpdater._target_destroyed, key))
+
+    def unregister(self, target: Union[NumericSpinBox, QObject]) -> None:
+        """Removes a spinbox from the live updates."""
+        self._remove(id(target))
+
+    @classmethod
+    def _target_destroyed(cls, key: int, *_: object) -> None:
+        """Drops a deleted target, if the shared updater still exists."""
+        if cls._instance is not None:
+            cls._instance._remove(key)
+
+    def _remove(self, key: int) -> None:
+        """Drops a spinbox and its pending value, and stops the timer when nothing is pending."""
+        with self._lock:
+            self._targets.pop(key, None)
+            self._pending.pop(key, None)
+            if self._pending:
+                return
+            self._scheduled = False
+        self._timer.stop()
+
+    def post(self, target: Union[NumericSpinBox, QObject], value: object) -> None:
+        """
+        Stores the latest value of a registered spinbox and starts the timer. Safe to call from any
+        thread, raises a ValueError for a target that isn't registered.
+        """
+        key = id(target)
+        with self._lock:
+            if key not in self._targets:
+                raise ValueError("The target isn't registered to the live updates.")
+            if key in self._pending:
+                self._coalesced_values += 1
+            self._pending[key] = value
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._values_posted.emit()
+
+    def _start_timer(self) -> None:
+        """Starts the timer on the GUI thread, unless the values were already applied."""
+        if self._scheduled and not self._timer.isActive():
+            self._timer.start()
+
+    def _apply_pending_values(self) -> None:
+        """Applies the latest values on the GUI thread, and stops the timer when none is left."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        deferred = {}
+        for key, value in pending.items():
+            target = self._targets.get(key)
+            if target is None:
+                continue
+            # Don't overwrite a value that is being edited
+            if target.hasFocus():
+                deferred[key] = value
+                continue
+            target._apply_live_value(value)
+            self._applied_values += 1
+
+        with self._lock:
+            # Newer values posted meanwhile take precedence
+            for key, value in deferred.items():
+                self._pending.setdefault(key, value)
+            if self._pending:
+                return
+            self._scheduled = False
+        self._timer.stop()
+
+    @property
+    def applied_values(self) -> int:
+        """Returns the number of live values applied to the spinboxes."""
+        return self._applied_values
+
+    @property
+    def coalesced_values(self) -> int:
+        """Returns the number of live values replaced by a newer value before being applied."""
+        return self._coalesced_values
+
+    @property
+    def frame_rate(self) -> float:
+        """Returns the requested frame rate, without the limit of the performance mode."""
+        return self._frame_rate
+
+
+class NumericSpinBoxGroup(QObject):
+    """
+    Group of named spinboxes whose values constrain each other, e.g. start/stop/step. When a field
+    changes, only the constraints that depend on it are evaluated, the fields they change are
+    propagated the same way, and all the results are applied to the spinboxes in a single batch
+    with one values_changed emission.
+    """
+
+    values_changed: Signal = Signal(dict)
+
+    # Maximum number of field evaluations for a single change
+    _max_evaluations = 1000
+
+    def __init__(self, spinboxes: dict[str, NumericSpinBox]) -> None:
+        super(NumericSpinBoxGroup, self).__init__()
+
+        self._spinboxes = dict(spinboxes)
+        self._values: dict[str, float] = {}
+        self._dependants: dict[str, list[Callable]] = {}
+        self._applying_values: bool = False
+
+        # Run configuration
+        self._configure_spinbox_group()
+
+    def _configure_spinbox_group(self) -> None:
+        """Reads the current values and connects the spinboxes."""
+        for name, spinbox in self._spinboxes.items():
+            self._values[name] = spinbox.value()
+            self._dependants[name] = []
+            spinbox.valueChanged.connect(
+                lambda value, name=name: self._spinbox_value_changed(name, value)
+            )
+
+    def add_constraint(
+        self,
+        fields: Sequence[str],
+        constraint: Callable[[dict[str, float], str], dict[str, float]],
+    ) -> None:
+        """
+        Adds a constraint between fields. The constraint receives the current values and the name
+        of the field that changed, and returns the new values of the fields it adjusts.
+        """
+        for name in fields:
+            if name not in self._spinboxes:
+                raise ValueError(f"The group has no field named {name}.")
+            self._dependants[name].append(constraint)
+
+    def add_order_constraint(self, lower: str, upper: str) -> None:
+        """Keeps the lower field below or equal to the upper field, by moving the other field."""
+
+        def order(values: dict[str, float], changed: str) -> dict[str, float]:
+            if values[lower] <= values[upper]:
+                return {}
+            if changed == upper:
+                return {lower: values[upper]}
+            return {upper: values[lower]}
+
+        self.add_constraint((lower, upper), order)
+
+    def add_step_constraint(
+        self, step: str, start: str, stop: str, fraction: Optional[float] = 1 / 3
+    ) -> None:
+        """Keeps the step field at most the given fraction of the range between start and stop."""
+
+        def step_limit(values: dict[str, float], changed: str) -> dict[str, float]:
+            maximum = abs(values[stop] - values[start]) * fraction
+            if values[step] <= maximum:
+                return {}
+            return {step: maximum}
+
+        self.add_constraint((step, start, stop), step_limit)
+
+    def _spinbox_value_changed(self, name: str, value: float) -> None:
+        """Solves the constraints after a value changed in one of the spinboxes."""
+        if self._applying_values:
+            return
+        self._values[name] = value
+        self._apply(self._solve({name: value}), changed={name: value})
+
+    def set_values(self, values: dict[str, float]) -> None:
+        """Sets several values at once, solving the constraints before updating the spinboxes."""
+        updates = dict(values)
+        self._values.update(updates)
+        updates.update(self._solve(values))
+        self._apply(updates, changed=updates)
+
+    def _solve(self, changed: dict[str, float]) -> dict[str, float]:
+        """Propagates a change through the dependent constraints and returns the new values."""
+        values = self._values
+        updates: dict[str, float] = {}
+        queue = deque(changed)
+        evaluations = 0
+        while queue:
+            name = queue.popleft()
+            evaluations += 1
+            if evaluations > self._max_evaluations:
+                raise RuntimeError(
+                    "The constraints of the spinbox group don't converge."
+                )
+            for constraint in self._dependants[name]:
+                for output, value in constraint(values, name).items():
+                    if values[output] != value:
+                        values[output] = value
+                        updates[output] = value
+                        queue.append(output)
+        return updates
+
+    def _apply(self, updates: dict[str, float], changed: dict[str, float]) -> None:
+        """Applies the solved values to the spinboxes and emits the changed values once."""
+        self._applying_values = True
+        try:
+            for name, value in updates.items():
+                spinbox = self._spinboxes[name]
+                spinbox.setValue(value)
+                # Keep the value the spinbox accepted, after the range and the rounding
+                self._values[name] = spinbox.value()
+        finally:
+            self._applying_values = False
+
+        changed = {**changed, **updates}
+        self.values_changed.emit({name: self._values[name] for name in changed})
+
+    def value(self, name: str) -> float:
+        """Returns the value of a field."""
+        return self._values[name]
+
+    @property
+    def values(self) -> dict[str, float]:
+        """Returns a copy of all the values."""
+        return dict(self._values)
+
+    @property
+    def spinboxes(self) -> dict[str, NumericSpinBox]:
+        """Returns the spinboxes of the group."""
+        return self._spinboxes
+
+
+class UnitNumericDataSpinBoxModel(NumericDataSpinBoxModel):
+    """NumericDataSpinBoxModel with values in the canonical unit of a unit family."""
+
+    def __init__(
+        self,
+        min_value: float,
+        max_value: float,
+        current_value: float,
+        incremental_step: float,
+        precision: Optional[int] = 0,
+        units: Optional[UnitFamily] = LENGTH_UNITS,
+    ) -> None:
+        super(UnitNumericDataSpinBoxModel, self).__init__(
+            min_value=min_value,
+            max_value=max_value,
+            current_value=current_value,
+            incremental_step=incremental_step,
+            precision=precision,
+        )
+
+        self._units = units
+
+    def converted(self, unit: str) -> NumericDataModel:
+        """Returns the values converted to a unit."""
+        factor = self._units.factor(unit)
+        return NumericDataModel(
+            min_value=self._min_value / factor,
+            max_value=self._max_value / factor,
+            current_value=self._current_value / factor,
+            incremental_step=self._incremental_step / factor,
+            precision=self._units.display_precision(self._precision, unit),
+        )
+
+    @property
+    def units(self) -> UnitFamily:
+        """Returns the unit family of the values."""
+        return self._units
+
+
+class UnitNumericSpinBox(NumericSpinBox):
+    """
+    NumericSpinBox that keeps its values in the canonical unit of a unit family and shows them in
+    a selectable unit. All the constructor values are canonical. Switching the unit converts the
+    range, step, precision and value with the precomputed factor, without emitting valueChanged.
+    Bound data models and live values are canonical as well.
+    """
+
+    canonical_value_changed: Signal = Signal(float)
+    unit_changed: Signal = Signal(str)
+
+    def __init__(
+        self,
+        min_value: float,
+        max_value: float,
+        default_value: float,
+        incremental_step: float,
+        precision: Optional[int] = 0,
+        units: Optional[UnitFamily] = LENGTH_UNITS,
+        unit: Optional[str] = None,
+        show_suffix: Optional[bool] = True,
+        size: Optional[QSize] = None,
+        object_name: Optional[str] = "numeric-spinbox",
+    ) -> None:
+        if unit is None:
+            unit = units.canonical_unit
+        factor = units.factor(unit)
+        super(UnitNumericSpinBox, self).__init__(
+            min_value=min_value / factor,
+            max_value=max_value / factor,
+            default_value=default_value / factor,
+            incremental_step=incremental_step / factor,
+            precision=units.display_precision(precision, unit),
+            size=size,
+            object_name=object_name,
+        )
+
+        self._units = units
+        self._unit = unit
+        self._show_suffix = show_suffix
+        self._canonical_min = min_value
+        self._canonical_max = max_value
+        self._canonical_value = default_value
+        self._canonical_step = incremental_step
+        self._canonical_precision = precision
+        self._switching_unit: bool = False
+
+        # Run configuration
+        self._configure_unit_spinbox()
+
+    def _configure_unit_spinbox(self) -> None:
+        """Shows the unit and follows the displayed value."""
+        if self._show_suffix:
+            self.setSuffix(f" {self._unit}")
+        self.valueChanged.connect(self._display_value_changed)
+
+    def _display_value_changed(self, value: float) -> None:
+        """Updates the canonical value from the displayed value."""
+        if self._switching_unit:
+            return
+        self._canonical_value = self._units.to_canonical(value, self._unit)
+        self.canonical_value_changed.emit(self._canonical_value)
+
+    def _show_canonical_value(self, value: float) -> None:
+        """Shows a canonical value and keeps it without the display rounding."""
+        changed = value != self._canonical_value
+        self._canonical_value = value
+        self._switching_unit = True
+        try:
+            self.setValue(self._units.to_display(value, self._unit))
+        finally:
+            self._switching_unit = False
+        if changed:
+            self.canonical_value_changed.emit(value)
+
+    def set_unit(self, unit: str) -> None:
+        """Shows the values in another unit of the family."""
+        if unit == self._unit:
+            return
+        factor = self._units.factor(unit)
+        self._unit = unit
+
+        self._switching_unit = True
+        signals_blocked = self.blockSignals(True)
+        try:
+            # Set the precision first, so the range and the value are not rounded
+            self.setDecimals(
+                self._units.display_precision(self._canonical_precision, unit)
+            )
+            self.setRange(self._canonical_min / factor, self._canonical_max / factor)
+            self.setSingleStep(self._canonical_step / factor)
+            self.setValue(self._canonical_value / factor)
+            if self._show_suffix:
+                self.setSuffix(f" {unit}")
+        finally:
+            self.blockSignals(signals_blocked)
+            self._switching_unit = False
+
+        self.unit_changed.emit(unit)
+
+    def set_canonical_value(self, value: float) -> None:
+        """Sets the value in the canonical unit."""
+        self._show_canonical_value(value)
+
+    def set_canonical_range(self, min_value: float, max_value: float) -> None:
+        """Sets the range in the canonical unit."""
+        if min_value >= max_value:
+            raise ValueError("The min value must be lower than the max value.")
+        self._canonical_min = min_value
+        self._canonical_max = max_value
+        factor = self._units.factor(self._unit)
+        self.setRange(min_value / factor, max_value / factor)
+
+    @staticmethod
+    def set_panel_unit(panel: QWidget, units: UnitFamily, unit: str) -> int:
+        """
+        Switches all the unit spinboxes of a unit family inside a panel to a unit, with a single
+        repaint of the panel. Returns the number of switched spinboxes.
+        """
+        spinboxes = [
+            spinbox
+            for spinbox in panel.findChildren(UnitNumericSpinBox)
+            if spinbox.units is units
+        ]
+        panel.setUpdatesEnabled(False)
+        try:
+            for spinbox in spinboxes:
+                spinbox.set_unit(unit)
+        finally:
+            panel.setUpdatesEnabled(True)
+        return len(spinboxes)
+
+    def _data_model_min_max_changed(self, new_min: float, new_max: float) -> None:
+        """Applies the canonical range of the bound data model."""
+        self._canonical_min = new_min
+        self._canonical_max = new_max
+        factor = self._units.factor(self._unit)
+        super(UnitNumericSpinBox, self)._data_model_min_max_changed(
+            new_min / factor, new_max / factor
+        )
+
+    def _data_model_value_changed(self, new_value: float) -> None:
+        """Applies the canonical value of the bound data model."""
+        if new_value == self._canonical_value:
+            return
+        self._updating_from_data_model = True
+        try:
+            self._show_canonical_value(new_value)
+        finally:
+            self._updating_from_data_model = False
+
+    def _data_model_precision_changed(self, new_precision: int) -> None:
+        """Applies the canonical precision of the bound data model."""
+        self._canonical_precision = new_precision
+        super(UnitNumericSpinBox, self)._data_model_precision_changed(
+            self._units.display_precision(new_precision, self._unit)
+        )
+
+    def _update_data_model_value(self, value: float) -> None:
+        """Writes the canonical value to the bound data model."""
+        super(UnitNumericSpinBox, self)._update_data_model_value(self._canonical_value)
+
+    def _apply_live_value(self, value: float) -> None:
+        """Shows a canonical live value, without writing it back to the bound data model."""
+        if value == self._canonical_value:
+            return
+        self._updating_from_data_model = True
+        try:
+            self._show_canonical_value(value)
+        finally:
+            self._updating_from_data_model = False
+
+    @classmethod
+    def from_data_model(
+        cls,
+        data: Union[NumericDataSpinBoxModel, NumericDataModel],
+        size: Optional[QSize] = None,
+        object_name: Optional[str] = "numeric-spinbox",
+        bind: Optional[bool] = False,
+        units: Optional[UnitFamily] = None,
+        unit: Optional[str] = None,
+    ) -> "UnitNumericSpinBox":
+        """Creates a unit spinbox from the canonical values of a data model."""
+        if units is None:
+            units = getattr(data, "units", LENGTH_UNITS)
+        spinbox = cls(
+            min_value=data.min_value,
+            max_value=data.max_value,
+            default_value=data.current_value,
+            incremental_step=data.incremental_step,
+            precision=data.precision,
+            units=units,
+            unit=unit,
+            size=size,
+            object_name=object_name,
+        )
+        if bind:
+            spinbox.bind_data_model(data)
+        return spinbox
+
+    @property
+    def canonical_value(self) -> float:
+        """Returns the value in the canonical unit."""
+        return self._canonical_value
+
+    @property
+    def unit(self) -> str:
+        """Returns the displayed unit."""
+        return self._unit
+
+    @property
+    def units(self) -> UnitFamily:
+        """Returns the unit family."""
+        return self._units
+
+
+add_performance_mode_listener(LiveValueUpdater._performance_mode_changed)
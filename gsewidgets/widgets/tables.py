@@ -24,6 +24,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
+import numpy as np
 from qtpy.QtCore import QObject, Signal, QSize, Qt
 from qtpy.QtGui import QColor
 from qtpy.QtWidgets import (
@@ -33,8 +34,20 @@ from qtpy.QtWidgets import (
     QWidget,
     QVBoxLayout,
 )
-from typing import Optional
+from typing import Optional, Union
 
+from gsewidgets.models.collection_points import (
+    CollectionPointsModel,
+    POINTS_INSERTED,
+    POINTS_REMOVED,
+    POSITIONS_CHANGED,
+    ENABLED_CHANGED,
+    NAMES_CHANGED,
+    GROUPS_CHANGED,
+    LIMITS_CHANGED,
+    POINTS_RESET,
+)
+from gsewidgets.models.numeric import NumericDataModel
 from gsewidgets.widgets.inputboxes import FileNameInputBox
 from gsewidgets.widgets.spinboxes import NoWheelNumericSpinBox, NumericDataSpinBoxModel
 from gsewidgets.widgets.checkboxes import ToggleCheckBox
@@ -123,10 +136,30 @@ class TableWidget(QTableWidget):
         self.setRowCount(0)
 
 
+class _TableRow:
+    """Widgets of a single row of the table, with the current index of the row."""
+
+    __slots__ = ("index", "name_widget", "spinbox_widgets", "checkbox")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.name_widget: Optional[FileNameInputBox] = None
+        self.spinbox_widgets: list[NoWheelNumericSpinBox] = []
+        self.checkbox: Optional[ToggleCheckBox] = None
+
+
 class XYZCollectionPointsTable(TableWidget, QObject):
-    """Used to create instances of simple XYZ Collection Points table."""
+    """
+    Used to create instances of simple XYZ Collection Points table. The table is a view of a
+    headless CollectionPointsModel, that keeps the names, positions and enabled state of the points.
+    Several tables can share the same model, and all of them are updated from its notifications.
+    Edits of the X, Y and Z values are also sent to the numeric data models the point was added from.
+    Points can be labeled with integer groups, that are enabled, moved or deleted together.
+    Points added from numeric data models follow the later min and max changes of those models.
+    """
 
     enabled_checkboxes_updated: Signal = Signal()
+    group_updated: Signal = Signal(int)
 
     def __init__(
         self,
@@ -141,6 +174,7 @@ class XYZCollectionPointsTable(TableWidget, QObject):
         size: Optional[QSize] = QSize(55, 35),
         circle_radius_multiplier: Optional[float] = 0.25,
         bar_size_multiplier: Optional[float] = 0.35,
+        points_model: Optional[CollectionPointsModel] = None,
     ) -> None:
         # Check mutable input
         if horizontal_headers is None:
@@ -161,84 +195,144 @@ class XYZCollectionPointsTable(TableWidget, QObject):
         self._circle_radius_multiplier = circle_radius_multiplier
         self._bar_size_multiplier = bar_size_multiplier
 
+        # Use a private model if a shared one is not given
+        if points_model is None:
+            points_model = CollectionPointsModel()
+        self._model = points_model
+        self._rows: list[_TableRow] = []
         self._enabled_checkboxes: list[ToggleCheckBox] = []
-        self._numeric_data_list: list[list[NumericDataSpinBoxModel]] = []
-        self._file_names_list: list[str] = []
-        self._name_counter: int = 1
+        self._updating_from_model: bool = False
+
+        # Run configuration
+        self._configure_xyz_table()
+
+    def _configure_xyz_table(self) -> None:
+        """Attaches the table to the collection points model."""
+        # The model holds the listener weakly, so a dropped table can still be collected
+        self._model.add_listener(self._points_model_changed)
+        # Show the points that already exist in a shared model
+        if len(self._model):
+            self._insert_rows(np.arange(len(self._model)))
+
+    def _points_model_changed(self, notification: str, indices: np.ndarray) -> None:
+        """Updates the rows of the table from the notifications of the model."""
+        self._updating_from_model = True
+        try:
+            if notification == POINTS_INSERTED:
+                self._insert_rows(indices)
+            elif notification == POINTS_REMOVED:
+                self._remove_rows(indices)
+            elif notification == POSITIONS_CHANGED:
+                self._update_positions(indices)
+            elif notification == ENABLED_CHANGED:
+                self._update_enabled(indices)
+            elif notification == NAMES_CHANGED:
+                for row in indices:
+                    self._rows[row].name_widget.setText(self._model.point_name(row))
+            elif notification == GROUPS_CHANGED:
+                for row in indices:
+                    self._rows[row].name_widget.setToolTip(
+                        f"Group {self._model.groups[row]}"
+                    )
+            elif notification == LIMITS_CHANGED:
+                self._update_limits(indices)
+            elif notification == POINTS_RESET:
+                self._remove_rows(np.arange(len(self._rows)))
+                self._insert_rows(np.arange(len(self._model)))
+        finally:
+            self._updating_from_model = False
+
+        # Emit once for every change of the enabled points
+        if notification in (
+            POINTS_INSERTED,
+            POINTS_REMOVED,
+            ENABLED_CHANGED,
+            POINTS_RESET,
+        ):
+            self.enabled_checkboxes_updated.emit()
+
+    def _insert_rows(self, indices: np.ndarray) -> None:
+        """Creates the widgets for the given rows, using the values of the model."""
+        if not indices.size:
+            return
+        for row in indices.tolist():
+            self.insertRow(row)
+            self._create_row_widgets(row)
+        self._renumber_rows(int(indices.min()))
+
+    def _remove_rows(self, indices: np.ndarray) -> None:
+        """Removes the given rows and their widgets."""
+        if not indices.size:
+            return
+        for row in sorted(indices.tolist(), reverse=True):
+            self.removeRow(row)
+            self._rows.pop(row)
+            self._enabled_checkboxes.pop(row)
+        self._renumber_rows(int(indices.min()))
+
+    def _renumber_rows(self, start: int) -> None:
+        """Updates the index of the rows after the inserted or removed ones."""
+        for index in range(start, len(self._rows)):
+            self._rows[index].index = index
+
+    def _update_positions(self, indices: np.ndarray) -> None:
+        """Updates the spinboxes of the given rows."""
+        positions = self._model.positions
+        for row in indices.tolist():
+            for axis, spinbox_widget in enumerate(self._rows[row].spinbox_widgets):
+                if spinbox_widget.value() != positions[row, axis]:
+                    spinbox_widget.setValue(positions[row, axis])
+
+    def _update_limits(self, indices: np.ndarray) -> None:
+        """Updates the range of the spinboxes of the given rows, without recreating them."""
+        min_values = self._model.min_values
+        max_values = self._model.max_values
+        for row in indices.tolist():
+            for axis, spinbox_widget in enumerate(self._rows[row].spinbox_widgets):
+                spinbox_widget.setRange(min_values[row, axis], max_values[row, axis])
+
+    def _update_enabled(self, indices: np.ndarray) -> None:
+        """Updates the checkboxes of the given rows."""
+        enabled = self._model.enabled
+        for row in indices.tolist():
+            self._enabled_checkboxes[row].set_state(bool(enabled[row]))
+
+    def _create_row_widgets(self, row: int) -> None:
+        """Creates the name, X, Y, Z and enabled widgets of a single row."""
+        model = self._model
+        table_row = _TableRow(row)
+        self._rows.insert(row, table_row)
 
-    def add_point(
-        self,
-        x: NumericDataSpinBoxModel,
-        y: NumericDataSpinBoxModel,
-        z: NumericDataSpinBoxModel,
-    ) -> None:
-        """Adds a single collection point to the bottom of the list."""
-        # Get rows
-        row = self.rowCount()
-        # Increase the row count by 1
-        self.setRowCount(row + 1)
-
-        # Check if the name already exists
-        if row > 0:
-            for name in self._file_names_list:
-                if f"point_{self._name_counter}" == name:
-                    self._name_counter += 1
-        # Set the name based on the name counter without checking if there are missing names
-        dynamically_created_name = f"point_{self._name_counter}"
         # Create the file name widget
         file_name_widget = FileNameInputBox(object_name="table-input-box")
         file_name_widget.setStyleSheet("background-color: transparent;" "border: none;")
-        file_name_widget.setText(dynamically_created_name)
-        # Append to the file names list
-        self._file_names_list.append(dynamically_created_name)
+        file_name_widget.setText(model.point_name(row))
+        file_name_widget.setToolTip(f"Group {model.groups[row]}")
+        file_name_widget.editingFinished.connect(lambda: self._name_edited(table_row))
+        table_row.name_widget = file_name_widget
         # Set the item
         self.setCellWidget(row, 0, file_name_widget)
 
         # Create the X,Y and Z widgets
-        # X widget
-        x_widget = NoWheelNumericSpinBox(
-            min_value=x.min_value,
-            max_value=x.max_value,
-            default_value=x.current_value,
-            incremental_step=x.incremental_step,
-            precision=x.precision,
-            object_name="table-spinbox",
-        )
-        x_widget.setStyleSheet("background-color: transparent;" "border: none;")
-        x_widget.valueChanged.connect(
-            lambda: x.spinbox_value_changed.emit(x_widget.value())
-        )
-        self.setCellWidget(row, 1, x_widget)
-        # Y widget
-        y_widget = NoWheelNumericSpinBox(
-            min_value=y.min_value,
-            max_value=y.max_value,
-            default_value=y.current_value,
-            incremental_step=y.incremental_step,
-            precision=y.precision,
-            object_name="table-spinbox",
-        )
-        y_widget.setStyleSheet("background-color: transparent;" "border: none;")
-        y_widget.valueChanged.connect(
-            lambda: y.spinbox_value_changed.emit(y_widget.value())
-        )
-        self.setCellWidget(row, 2, y_widget)
-        # Z widget
-        z_widget = NoWheelNumericSpinBox(
-            min_value=z.min_value,
-            max_value=z.max_value,
-            default_value=z.current_value,
-            incremental_step=z.incremental_step,
-            precision=z.precision,
-            object_name="table-spinbox",
-        )
-        z_widget.setStyleSheet("background-color: transparent;" "border: None;")
-        z_widget.valueChanged.connect(
-            lambda: z.spinbox_value_changed.emit(z_widget.value())
-        )
-        self.setCellWidget(row, 3, z_widget)
-        # Append to the numeric list
-        self.numeric_data_list.append([x, y, z])
+        for axis in range(3):
+            spinbox_widget = NoWheelNumericSpinBox(
+                min_value=float(model.min_values[row, axis]),
+                max_value=float(model.max_values[row, axis]),
+                default_value=float(model.positions[row, axis]),
+                incremental_step=float(model.incremental_steps[row, axis]),
+                precision=int(model.precisions[row, axis]),
+                object_name="table-spinbox",
+            )
+            spinbox_widget.setStyleSheet(
+                "background-color: transparent;" "border: none;"
+            )
+            spinbox_widget.valueChanged.connect(
+                lambda value, axis=axis: self._spinbox_value_changed(
+                    table_row, axis, value
+                )
+            )
+            self.setCellWidget(row, axis + 1, spinbox_widget)
+            table_row.spinbox_widgets.append(spinbox_widget)
 
         # Create the enabled checkbox
         checkbox = ToggleCheckBox(
@@ -249,8 +343,8 @@ class XYZCollectionPointsTable(TableWidget, QObject):
             circle_radius_multiplier=self._circle_radius_multiplier,
             bar_size_multiplier=self._bar_size_multiplier,
         )
-        # Set default state as checked
-        checkbox.setChecked(True)
+        # Set the state of the point
+        checkbox.set_state(bool(model.enabled[row]))
         # Create separate widget to center align the checkbox before adding to the table
         checkbox_widget = QWidget()
         checkbox_widget_layout = QVBoxLayout()
@@ -261,46 +355,172 @@ class XYZCollectionPointsTable(TableWidget, QObject):
         # Add to table
         self.setCellWidget(row, 4, checkbox_widget)
         # Add to the enabled checkboxes list
-        self.enabled_checkboxes.append(checkbox)
+        table_row.checkbox = checkbox
+        self._enabled_checkboxes.insert(row, checkbox)
         # Connect checkbox state changed
-        checkbox.stateChanged.connect(lambda: self.enabled_checkboxes_updated.emit())
+        checkbox.stateChanged.connect(lambda: self._checkbox_state_changed(table_row))
+
+    def _name_edited(self, table_row: _TableRow) -> None:
+        """Updates the name of the point in the model."""
+        self._model.rename_point(table_row.index, table_row.name_widget.text())
+
+    def _spinbox_value_changed(
+        self, table_row: _TableRow, axis: int, value: float
+    ) -> None:
+        """Updates the position of the point in the model and in its numeric data model."""
+        if self._updating_from_model:
+            return
+        self._model.set_position(table_row.index, axis, value)
+        source = self._model.sources[table_row.index, axis]
+        if isinstance(source, NumericDataSpinBoxModel):
+            source.spinbox_value_changed.emit(value)
+        elif isinstance(source, NumericDataModel):
+            source.update_value(value)
+
+    def _checkbox_state_changed(self, table_row: _TableRow) -> None:
+        """Updates the enabled mask of the model."""
+        if self._updating_from_model:
+            return
+        self._model.set_enabled(table_row.index, table_row.checkbox.isChecked())
+
+    def _follow_data_model_limits(
+        self, data: Union[NumericDataSpinBoxModel, NumericDataModel]
+    ) -> None:
+        """Applies the later min and max changes of a data model to the points added from it."""
+        if isinstance(data, NumericDataSpinBoxModel):
+            try:
+                data.spinbox_min_max_changed.connect(
+                    self._data_model_min_max_changed,
+                    Qt.ConnectionType.UniqueConnection,
+                )
+            except TypeError:
+                # The table already follows the data model
+                pass
+        else:
+            # Held weakly by the data model, like the listener of the points model
+            data.add_observer(self._data_model_updated)
+
+    def _data_model_min_max_changed(self, new_min: float, new_max: float) -> None:
+        """Applies the limits emitted by a NumericDataSpinBoxModel."""
+        self._set_data_model_limits(self.sender(), new_min, new_max)
+
+    def _data_model_updated(self, data: NumericDataModel) -> None:
+        """Applies the limits of a NumericDataModel after any of its changes."""
+        self._set_data_model_limits(data, data.min_value, data.max_value)
+
+    def _set_data_model_limits(
+        self,
+        data: Union[NumericDataSpinBoxModel, NumericDataModel],
+        new_min: float,
+        new_max: float,
+    ) -> None:
+        """Sets the new limits to the values of the points that were added from a data model."""
+        sources = self._model.sources
+        matches = np.fromiter(
+            (source is data for source in sources.flat),
+            dtype=bool,
+            count=sources.size,
+        ).reshape(sources.shape)
+        indices = np.flatnonzero(matches.any(axis=1))
+        if not indices.size:
+            return
+        matches = matches[indices]
+        new_min_values = self._model.min_values[indices].copy()
+        new_max_values = self._model.max_values[indices].copy()
+        new_min_values[matches] = new_min
+        new_max_values[matches] = new_max
+        self._model.set_limits(indices, new_min_values, new_max_values)
+
+    def add_point(
+        self,
+        x: Union[NumericDataSpinBoxModel, NumericDataModel],
+        y: Union[NumericDataSpinBoxModel, NumericDataModel],
+        z: Union[NumericDataSpinBoxModel, NumericDataModel],
+    ) -> None:
+        """
+        Adds a single collection point to the bottom of the list. The X, Y and Z values can be given
+        as NumericDataSpinBoxModel or as lightweight NumericDataModel instances.
+        """
+        # The rows of all the tables that share the model are created from the notification
+        self._model.add_point(
+            x.current_value,
+            y.current_value,
+            z.current_value,
+            min_values=(x.min_value, y.min_value, z.min_value),
+            max_values=(x.max_value, y.max_value, z.max_value),
+            incremental_steps=(
+                x.incremental_step,
+                y.incremental_step,
+                z.incremental_step,
+            ),
+            precisions=(x.precision, y.precision, z.precision),
+            sources=(x, y, z),
+        )
+        for data in (x, y, z):
+            self._follow_data_model_limits(data)
 
     def enable_all_points(self) -> None:
-        """Sets the check state to True for all the checkboxes included in the list of checkboxes."""
-        for checkbox in self.enabled_checkboxes:
-            checkbox.setChecked(True)
+        """Sets the enabled state to True for all the points."""
+        self._model.set_all_enabled(True)
 
     def disable_all_points(self) -> None:
-        """Sets the check state to False for all the checkboxes included in the list of checkboxes."""
-        for checkbox in self.enabled_checkboxes:
-            checkbox.setChecked(False)
+        """Sets the enabled state to False for all the points."""
+        self._model.set_all_enabled(False)
 
     def clear_table(self) -> None:
-        """Deletes all the rows of the table and clears the lists of checkboxes, numeric data and file names."""
-        # Remove existing rows
+        """Deletes all the points of the model, which removes the rows of the table."""
+        self._model.clear()
+        # Remove any rows that are not part of the model
         super(XYZCollectionPointsTable, self).clear_table()
-        # Clear the lists
-        self._enabled_checkboxes.clear()
-        self.numeric_data_list.clear()
-        self._file_names_list.clear()
 
     def delete_selection(self) -> None:
-        """
-        Removes the selected row from the table, the checkbox entry from the list of checkboxes,
-        the numeric data entry from the list of numeric data and the file name entry from
-        the file names list.
-        """
+        """Removes the point of the selected row from the model, which removes the row of the table."""
         index = self.currentRow()
-        if index >= 0:
-            self.removeRow(index)
-            self.enabled_checkboxes.pop(index)
-            self.numeric_data_list.pop(index)
-            self._file_names_list.pop(index)
+        if 0 <= index < len(self._model):
+            self._model.remove_point(index)
+
+    def set_selection_group(self, group: int) -> None:
+        """Moves the point of the selected row to a group."""
+        index = self.currentRow()
+        if 0 <= index < len(self._model):
+            if self._model.set_group(index, group):
+                self.group_updated.emit(group)
+
+    def enable_group(self, group: int) -> None:
+        """Sets the enabled state to True for all the points of a group."""
+        if self._model.set_group_enabled(group, True):
+            self.group_updated.emit(group)
+
+    def disable_group(self, group: int) -> None:
+        """Sets the enabled state to False for all the points of a group."""
+        if self._model.set_group_enabled(group, False):
+            self.group_updated.emit(group)
+
+    def translate_group(self, group: int, x: float, y: float, z: float) -> None:
+        """Shifts all the points of a group by the given offsets."""
+        if self._model.translate_group(group, (x, y, z)):
+            self.group_updated.emit(group)
+
+    def delete_group(self, group: int) -> None:
+        """Removes all the points of a group from the model, which removes their rows."""
+        if self._model.remove_group(group):
+            self.group_updated.emit(group)
+
+    @property
+    def points_model(self) -> CollectionPointsModel:
+        """Returns the headless model of the collection points."""
+        return self._model
 
     @property
     def enabled_checkboxes(self) -> list[ToggleCheckBox]:
         return self._enabled_checkboxes
 
     @property
-    def numeric_data_list(self) -> list[list[NumericDataSpinBoxModel]]:
-        return self._numeric_data_list
+    def numeric_data_list(
+        self,
+    ) -> list[list[Optional[Union[NumericDataSpinBoxModel, NumericDataModel]]]]:
+        """
+        Returns the X, Y and Z numeric data models that every point was added with. The entries of
+        points that were added to the model directly, without data models, are None.
+        """
+        return self._model.sources.tolist()